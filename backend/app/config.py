@@ -0,0 +1,37 @@
+import os
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class Settings(BaseSettings):
+    app_name: str = "Business Warning System API"
+    debug: bool = True
+    
+    # Database
+    database_url: str = "sqlite+aiosqlite:///./app.db"
+    
+    # Security
+    secret_key: str = "your-secret-key-here-change-in-production"
+    algorithm: str = "HS256"
+    access_token_expire_minutes: int = 15  # 15분
+    refresh_token_expire_days: int = 7  # 7일
+    
+    # CORS
+    cors_origins: list = ["http://localhost:5173", "http://localhost:3000"]
+    
+    # OpenAI
+    openai_api_key: str = ""
+    
+    # Data (CSV 원본 및 컬럼 스냅샷 위치)
+    data_dir: str = os.path.dirname(os.path.abspath(__file__))  # 기본: app/
+    snapshot_dir: str = ""  # 비어 있으면 {data_dir}/.snapshot
+    diagnosis_cache_size: int = 10000  # 진단 응답 LRU 캐시 최대 항목 수
+    data_watch_interval: int = 0  # 원본 CSV 변경 감지 주기(초), 0이면 자동 리로드 안 함
+    shared_data_dir: str = ""  # 워커 간 데이터셋 공유 디렉토리 (예: /dev/shm/safety-store), 비어 있으면 워커마다 로드
+    shared_poll_interval: int = 5  # 공유 모드에서 새 세대(버전 헤더) 확인 주기(초)
+    compact_frames: bool = True  # 메모리 절감 모드 (문자열 공유, 벤치마크 계산 프레임 축소, ds3는 저장소에 올리지 않고 첫 고객 구성 요청 시 집계용으로만 읽음)
+    
+    model_config = SettingsConfigDict(env_file=".env")
+
+
+settings = Settings()
+
@@ -0,0 +1,88 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
+from starlette.concurrency import run_in_threadpool
+from app.core.auth import current_superuser
+from app.models.user import UserTable
+from app.schemas import IngestResponse
+from app.services.benchmark_calculator import scatter_cache
+from app.services.data_context import data_reloader
+from app.services.data_snapshot import read_csv
+from app.services.diagnosis_service import diagnosis_service
+from app.services.memory_report import memory_report
+
+
+router = APIRouter()
+
+
+@router.get("/cache-stats")
+async def get_cache_stats(user: UserTable = Depends(current_superuser)):
+    """응답 캐시 적중/미스 통계 (관리자 전용)"""
+    return {
+        "diagnosis": diagnosis_service.cache_stats(),
+        "scatter": scatter_cache.stats(),
+    }
+
+
+@router.get("/memory")
+async def get_memory_report(user: UserTable = Depends(current_superuser)):
+    """
+    프로세스 RSS와 데이터프레임별 메모리 사용량 (관리자 전용)
+    - memory_mb: 프로세스 전용 메모리 (공유 문자열은 한 번만 계산)
+    - mmap_mb: 스냅샷/공유 세대 mmap 위의 숫자 컬럼과 문자열 컬럼 코드 (워커 간 공유 가능)
+    """
+    context = data_reloader.current
+    # 문자열 객체 순회가 있으므로 이벤트 루프를 막지 않도록 스레드에서 실행
+    return await run_in_threadpool(memory_report, context)
+
+
+@router.post("/reload", status_code=202)
+async def reload_data(user: UserTable = Depends(current_superuser)):
+    """
+    원본 데이터 무중단 리로드 (관리자 전용)
+    새 데이터를 백그라운드에서 모두 로드한 뒤 교체하며, 그동안 요청은 기존 데이터로 처리된다.
+    """
+    print("[API] POST /api/admin/reload")
+    started = data_reloader.reload()
+    return {"started": started, **data_reloader.status()}
+
+
+@router.get("/reload-status")
+async def get_reload_status(user: UserTable = Depends(current_superuser)):
+    """리로드 진행 상태와 현재 데이터 버전 (관리자 전용)"""
+    return data_reloader.status()
+
+
+@router.post("/ingest", response_model=IngestResponse)
+async def ingest_monthly_data(
+    ta_ym: int = Form(..., alias="taYm"),
+    usage: UploadFile = File(...),
+    customers: Optional[UploadFile] = File(None),
+    risk: UploadFile = File(...),
+    persist: bool = Form(False),
+    user: UserTable = Depends(current_superuser),
+):
+    """
+    새 기준년월 데이터 한 달치를 서버 재시작 없이 추가 (관리자 전용)
+    - usage: 해당 월 ds2 CSV, customers: 해당 월 ds3 CSV (선택)
+    - risk: 해당 월 risk_output CSV (필수)
+    - persist: 원본 CSV/스냅샷에도 반영 (기본 false - 메모리에만 추가)
+    """
+    print(f"[API] POST /api/admin/ingest - ta_ym: {ta_ym}, persist: {persist}")
+
+    def ingest():
+        return data_reloader.ingest(
+            ta_ym,
+            read_csv("usage", usage.file),
+            read_csv("customers", customers.file) if customers else None,
+            read_csv("risk", risk.file),
+            persist=persist,
+        )
+
+    try:
+        # CSV 파싱/집계는 CPU 작업이므로 이벤트 루프를 막지 않도록 스레드에서 실행
+        summary = await run_in_threadpool(ingest)
+    except (ValueError, KeyError) as e:
+        print(f"[ERROR] 데이터 추가 실패: {e}")
+        raise HTTPException(status_code=400, detail=f"데이터 추가 실패: {e}")
+
+    return summary
@@ -0,0 +1,403 @@
+from fastapi import APIRouter, HTTPException, Query
+from starlette.concurrency import run_in_threadpool
+from typing import Optional
+from app.schemas import (
+    BenchmarkBulkResponse, BenchmarkData, BenchmarkTrend, CompareRequest, CompareResponse,
+    CustomerMixBenchmark, CustomerMixCompareResponse, ScatterData,
+)
+from app.services.benchmark_calculator import map_industry_code, scatter_cache
+from app.services.benchmark_cube import AmbiguousRegionError
+from app.services.benchmark_trend import TREND_WINDOWS
+from app.services.data_context import data_reloader
+from app.services.scatter_density import SCATTER_MODES
+
+router = APIRouter()
+
+MAX_BULK_INDUSTRIES = 200  # 일괄 조회 최대 업종 수
+MAX_SCATTER_LIMIT = 5000  # 산점도 최대 점 수
+
+# 고객 구성 비교 인사이트 기준 백분위 (이상이면 높음, 이하이면 낮음)와 대상 지표 그룹
+CUSTOMER_MIX_HIGH_PERCENTILE = 80
+CUSTOMER_MIX_LOW_PERCENTILE = 20
+CUSTOMER_MIX_INSIGHT_GROUPS = ("retention", "customer_type", "gender", "age")
+
+
+@router.get("", response_model=BenchmarkData)
+async def get_benchmark(industry: Optional[str] = None, region: Optional[str] = None,
+                        district: Optional[str] = None, month: Optional[int] = None):
+    """
+    실제 데이터 기반 벤치마크 조회
+    - region: 시군구명(예: 서울 성동구), 구 이름(예: 성동구) 또는 상권명(예: 성수), 해석할 수 없으면 전국 기준
+      (구 이름이 여러 시군구에 해당하면 404)
+    - district: 상권명 (region과 함께 지정 가능)
+    - month: 위험 등급 분포 기준년월 (예: 202412, 없으면 최신 월)
+    """
+    
+    # 요청 로깅
+    print(f"[API] GET /api/benchmark - industry: {industry}, region: {region}, district: {district}, month: {month}")
+    benchmark_calc = data_reloader.current.benchmark_calc
+    
+    # 프론트엔드 코드를 실제 업종명으로 변환
+    if industry:
+        mapped_industry = map_industry_code(industry)
+        print(f"[MAPPING] '{industry}' -> '{mapped_industry}'")
+    else:
+        mapped_industry = None
+    
+    # 데이터가 로드되지 않았으면 기본값 반환
+    if benchmark_calc is None or benchmark_calc.industry_stats is None:
+        print("[WARN] 벤치마크 데이터가 로드되지 않아 기본값을 반환합니다.")
+        return BenchmarkData(
+            industry=industry or "전체",
+            region=region or "전국",
+            average_risk_score=35.0,  # 안전점수 (0.65 위험도 -> 35 안전점수)
+            metrics={
+                "revenue": {"average": 45000000, "median": 38000000},
+                "expenses": {"average": 35000000, "median": 30000000},
+                "customers": {"average": 850, "median": 720},
+                "profit_margin": {"average": 22, "median": 21},
+            },
+            risk_distribution={
+                "GREEN": 25,
+                "YELLOW": 40,
+                "ORANGE": 25,
+                "RED": 10,
+            },
+        )
+    
+    # 지역이 지정되면 업종 x 지역 큐브에서 조회
+    benchmark = None
+    if region or district:
+        try:
+            benchmark = benchmark_calc.get_regional_benchmark(industry, region, district)
+        except AmbiguousRegionError as e:
+            raise HTTPException(status_code=404, detail=str(e))
+        if benchmark is None:
+            print(f"[WARN] 지역 데이터 없음 - 전국 기준 사용 (region: {region}, district: {district})")
+
+    # 실제 데이터에서 벤치마크 가져오기
+    if benchmark is None:
+        benchmark = benchmark_calc.get_benchmark_for_industry(
+            industry or "전체",
+            base_revenue=50000000,  # 5천만원 기준
+            base_customers=1000      # 1000명 기준
+        )
+    
+    # 업종/카테고리의 실제 Alert 등급 분포 (미리 계산된 사전 조회)
+    alerts = benchmark_calc.get_alert_distribution(industry, month)
+    if alerts is None and month is not None:
+        raise HTTPException(status_code=404, detail=f"{month} 기준년월의 위험 등급 데이터가 없습니다.")
+    
+    print(f"[OK] 업종: {benchmark['industry']}, 지역: {benchmark.get('region', '전국')}, "
+          f"평균 위험도: {benchmark['average_risk_score']:.2f}")
+    
+    return _to_benchmark_data(industry or "전체", benchmark, alerts)
+
+
+def _to_benchmark_data(industry: str, benchmark: dict, alerts: Optional[dict]) -> BenchmarkData:
+    """벤치마크 딕셔너리와 Alert 등급 분포를 응답 형식으로 변환"""
+    return BenchmarkData(
+        industry=industry,
+        region=benchmark.get("region", "전국"),
+        average_risk_score=benchmark["average_risk_score"],
+        metrics={
+            "revenue": {
+                "average": benchmark["average_revenue"],
+                "median": benchmark["median_revenue"]
+            },
+            "expenses": {
+                "average": int(benchmark["average_revenue"] * 0.75),  # 매출의 75%로 추정
+                "median": int(benchmark["median_revenue"] * 0.75)
+            },
+            "customers": {
+                "average": benchmark["average_customers"],
+                "median": benchmark["median_customers"]
+            },
+            "profit_margin": {"average": 22, "median": 21},
+        },
+        risk_distribution=alerts["distribution"] if alerts else {
+            "GREEN": 25,
+            "YELLOW": 40,
+            "ORANGE": 25,
+            "RED": 10,
+        },
+        month=alerts["month"] if alerts else None,
+    )
+
+
+@router.get("/bulk", response_model=BenchmarkBulkResponse)
+async def get_benchmarks_bulk(industries: Optional[str] = None):
+    """
+    여러 업종/카테고리 벤치마크 일괄 조회 (레이더 차트 등 다중 비교용)
+    - industries: 쉼표로 구분한 업종 코드 (예: cafe,pub,카페), 없으면 모든 업종과 카테고리
+    """
+    print(f"[API] GET /api/benchmark/bulk - industries: {industries}")
+    benchmark_calc = data_reloader.current.benchmark_calc
+    
+    if benchmark_calc is None or benchmark_calc.industry_stats is None:
+        raise HTTPException(status_code=503, detail="벤치마크 데이터가 로드되지 않았습니다.")
+    
+    codes = None
+    if industries:
+        codes = list(dict.fromkeys(code.strip() for code in industries.split(",") if code.strip()))
+        if len(codes) > MAX_BULK_INDUSTRIES:
+            raise HTTPException(status_code=400, detail=f"한 번에 최대 {MAX_BULK_INDUSTRIES}개 업종까지 조회할 수 있습니다.")
+    
+    # 미리 계산된 테이블/분포에서 한 번에 조회
+    benchmarks = benchmark_calc.get_benchmarks(codes)
+    items = [
+        _to_benchmark_data(code, benchmark, benchmark_calc.get_alert_distribution(code))
+        for code, benchmark in benchmarks.items()
+    ]
+    
+    print(f"[OK] 벤치마크 일괄 조회 완료: {len(items)}개 업종")
+    return BenchmarkBulkResponse(benchmarks=items, total_count=len(items))
+
+
+@router.get("/trend", response_model=BenchmarkTrend)
+async def get_benchmark_trend(industry: Optional[str] = None, window: int = 1,
+                              months: Optional[int] = None):
+    """
+    업종/카테고리별 월별 추이 (매출, 고객수, 안전점수, Alert 등급 건수)
+    - window: 이동 구간 (1, 3, 6, 12개월, 1이면 월별 값)
+    - months: 최근 몇 개월만 반환할지 (없으면 전체)
+    """
+    print(f"[API] GET /api/benchmark/trend - industry: {industry}, window: {window}, months: {months}")
+    benchmark_calc = data_reloader.current.benchmark_calc
+    
+    if benchmark_calc is None:
+        raise HTTPException(status_code=503, detail="벤치마크 데이터가 로드되지 않았습니다.")
+    if window not in TREND_WINDOWS:
+        raise HTTPException(status_code=400, detail=f"window는 {', '.join(map(str, TREND_WINDOWS))} 중 하나여야 합니다.")
+    if months is not None and months <= 0:
+        raise HTTPException(status_code=400, detail="months는 1 이상이어야 합니다.")
+    
+    trend = benchmark_calc.get_trend(industry, window, months)
+    if trend is None:
+        raise HTTPException(status_code=404, detail="해당 업종의 추이 데이터가 없습니다.")
+    
+    print(f"[OK] 추이 반환 완료: {trend['industry']}, {len(trend['months'])}개월")
+    return trend
+
+
+@router.get("/regions")
+async def get_benchmark_regions():
+    """벤치마크 지역 필터로 사용할 수 있는 시군구/상권 목록"""
+    benchmark_calc = data_reloader.current.benchmark_calc
+    if benchmark_calc is None or benchmark_calc.cube is None:
+        raise HTTPException(status_code=503, detail="벤치마크 데이터가 로드되지 않았습니다.")
+    return benchmark_calc.cube.regions()
+
+
+@router.post("/compare", response_model=CompareResponse)
+async def compare_benchmark(request: CompareRequest):
+    """벤치마크 비교 분석 - 실제 데이터 기반"""
+    
+    # 요청 로깅
+    print(f"[API] POST /api/benchmark/compare - industry: {request.industry}, risk_score: {request.risk_score}")
+    benchmark_calc = data_reloader.current.benchmark_calc
+    
+    # 프론트엔드 코드를 실제 업종명으로 변환
+    mapped_industry = map_industry_code(request.industry)
+    print(f"[MAPPING] '{request.industry}' -> '{mapped_industry}'")
+    
+    # 실제 데이터가 없으면 기본값 사용
+    percentiles = {"safety_score": None, "revenue": None, "customers": None}
+    if benchmark_calc is None or benchmark_calc.industry_stats is None:
+        print("[WARN] 벤치마크 데이터가 없어 기본값 사용")
+        avg_revenue = 45000000
+        avg_customers = 850
+        industry_avg_risk = 65.0
+    else:
+        # 실제 업종 데이터 가져오기
+        benchmark = benchmark_calc.get_benchmark_for_industry(
+            request.industry,  # 매핑은 get_benchmark_for_industry 내부에서 처리됨
+            base_revenue=50000000,
+            base_customers=1000
+        )
+        avg_revenue = benchmark["average_revenue"]
+        avg_customers = benchmark["average_customers"]
+        industry_avg_risk = benchmark["average_risk_score"]
+        print(f"[OK] 업종 평균 - 매출: {avg_revenue:,}원, 고객수: {avg_customers}명, 위험도: {industry_avg_risk:.2f}")
+        # 업종 내 가맹점 대비 실제 백분위 (정렬 배열 이진 탐색)
+        percentiles = benchmark_calc.get_percentiles(
+            request.industry,
+            safety_score=request.risk_score,
+            revenue=request.revenue,
+            customers=request.customers,
+        )
+    
+    # 비용은 요청에서 받거나 매출의 75%로 추정
+    avg_expenses = int(avg_revenue * 0.75)
+    
+    # 백분위 계산 (안전점수 기준, 데이터가 없으면 평균과의 차이로 추정)
+    score_diff = request.risk_score - industry_avg_risk
+    if percentiles["safety_score"] is not None:
+        percentile = int(round(percentiles["safety_score"]))
+    elif score_diff <= -10:
+        percentile = 20
+    elif score_diff <= -5:
+        percentile = 35
+    elif score_diff <= 0:
+        percentile = 50
+    elif score_diff <= 5:
+        percentile = 65
+    else:
+        percentile = 80
+    
+    # 인사이트 생성
+    insights = []
+    
+    revenue_diff = ((request.revenue - avg_revenue) / avg_revenue) * 100
+    if abs(revenue_diff) < 5:
+        insights.append("귀하의 매출은 업종 평균과 유사합니다.")
+    elif revenue_diff > 0:
+        insights.append(f"귀하의 매출은 업종 평균보다 {revenue_diff:.1f}% 높습니다.")
+    else:
+        insights.append(f"귀하의 매출은 업종 평균보다 {abs(revenue_diff):.1f}% 낮습니다. 매출 증대 전략이 필요합니다.")
+    
+    expense_ratio = (request.expenses / request.revenue) * 100
+    avg_expense_ratio = (avg_expenses / avg_revenue) * 100
+    if expense_ratio > avg_expense_ratio + 5:
+        insights.append("비용 비율이 업종 평균보다 높습니다. 비용 관리를 통해 수익성을 개선할 수 있습니다.")
+    elif expense_ratio < avg_expense_ratio - 5:
+        insights.append("효율적인 비용 관리를 하고 계십니다.")
+    
+    if request.risk_score > industry_avg_risk:
+        insights.append(f"위험도가 업종 평균보다 {request.risk_score - industry_avg_risk:.1f}점 높습니다. 개선 조치가 필요합니다.")
+    else:
+        insights.append("위험도가 업종 평균 이하로 양호한 상태입니다.")
+    
+    print(f"[OK] 비교 완료 - 백분위: {percentile}%, 인사이트 {len(insights)}개 생성")
+    
+    return CompareResponse(
+        user_score=request.risk_score,
+        industry_average=industry_avg_risk,
+        percentile=percentile,
+        comparison={
+            "revenue": {
+                "user": request.revenue,
+                "average": avg_revenue,
+                "difference": revenue_diff,
+                "percentile": percentiles["revenue"],
+            },
+            "expenses": {
+                "user": request.expenses,
+                "average": avg_expenses,
+                "difference": ((request.expenses - avg_expenses) / avg_expenses) * 100,
+            },
+            "customers": {
+                "user": float(request.customers),
+                "average": float(avg_customers),
+                "difference": ((request.customers - avg_customers) / avg_customers) * 100,
+                "percentile": percentiles["customers"],
+            },
+        },
+        insights=insights,
+    )
+
+
+@router.get("/customers", response_model=CustomerMixBenchmark)
+async def get_customer_mix_benchmark(industry: Optional[str] = None, region: Optional[str] = None,
+                                     district: Optional[str] = None):
+    """
+    업종 x 지역 고객 구성 벤치마크 (ds3 - 가맹점별 최신 월 기준, 미리 계산된 셀 조회)
+    - 성별/연령대 비중, 재방문/신규 고객 비율, 거주/직장/유동 고객 비율의 평균/중앙값
+    - region/district: /api/benchmark와 같은 지역 필터 (없으면 전국)
+    """
+    print(f"[API] GET /api/benchmark/customers - industry: {industry}, region: {region}, district: {district}")
+    benchmark_calc = data_reloader.current.benchmark_calc
+    
+    if benchmark_calc is None or benchmark_calc.industry_stats is None:
+        raise HTTPException(status_code=503, detail="벤치마크 데이터가 로드되지 않았습니다.")
+    
+    try:
+        # 첫 요청은 ds3를 읽어 벤치마크를 만들므로 스레드풀에서 실행
+        mix = await run_in_threadpool(benchmark_calc.get_customer_mix, industry, region, district)
+    except AmbiguousRegionError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    if mix is None:
+        raise HTTPException(status_code=404, detail="해당 업종/지역의 고객 구성 데이터가 없습니다.")
+    
+    print(f"[OK] 고객 구성 벤치마크 반환: {mix['industry']}, {mix['region']}, 가맹점 {mix['merchant_count']}개")
+    return mix
+
+
+@router.get("/customers/compare", response_model=CustomerMixCompareResponse)
+async def compare_customer_mix(encoded_mct: str, region: Optional[str] = None,
+                               district: Optional[str] = None):
+    """
+    가맹점 고객 구성을 같은 업종 가맹점과 비교 (지표별 평균 대비 차이와 백분위)
+    - region/district: 비교 대상을 해당 지역의 같은 업종 가맹점으로 제한 (없으면 전국)
+    """
+    print(f"[API] GET /api/benchmark/customers/compare - encoded_mct: {encoded_mct}, region: {region}, district: {district}")
+    context = data_reloader.current
+    benchmark_calc = context.benchmark_calc
+    
+    if benchmark_calc is None or benchmark_calc.industry_stats is None:
+        raise HTTPException(status_code=503, detail="벤치마크 데이터가 로드되지 않았습니다.")
+    
+    try:
+        comparison = await run_in_threadpool(benchmark_calc.compare_customer_mix, encoded_mct, region, district)
+    except AmbiguousRegionError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    if comparison is None:
+        raise HTTPException(status_code=404, detail="가맹점 고객 데이터 또는 비교 대상 가맹점이 없습니다.")
+    
+    merchant = context.store.get_merchant(encoded_mct)
+    insights = []
+    for metric in comparison["metrics"]:
+        percentile = metric["percentile"]
+        if metric["group"] not in CUSTOMER_MIX_INSIGHT_GROUPS or percentile is None:
+            continue
+        if percentile >= CUSTOMER_MIX_HIGH_PERCENTILE:
+            insights.append(f"{metric['label']} 비율이 동종 가맹점보다 높습니다 (상위 {100 - percentile:.0f}%).")
+        elif percentile <= CUSTOMER_MIX_LOW_PERCENTILE:
+            insights.append(f"{metric['label']} 비율이 동종 가맹점보다 낮습니다 (하위 {percentile:.0f}%).")
+    
+    print(f"[OK] 고객 구성 비교 완료 - 업종: {comparison['industry']}, 비교 가맹점 {comparison['peer_count']}개")
+    return {
+        **comparison,
+        "merchant_name": merchant.name if merchant else None,
+        "insights": insights,
+    }
+
+
+@router.get("/scatter-data", response_model=ScatterData)
+async def get_scatter_data(industry: Optional[str] = None,
+                           limit: int = Query(500, ge=1, le=MAX_SCATTER_LIMIT),
+                           mode: str = "random"):
+    """
+    특정 업종의 개별 가게 데이터를 반환 (산점도용)
+    - industry: 업종 코드 (restaurant, cafe 등)
+    - limit: 반환할 최대 데이터 수 (기본 500개, 1~5000, 범위 밖이면 422)
+    - mode: random(무작위 샘플), grid(밀도 보존 + 극값 포함 샘플), histogram(2D 히스토그램, limit 무시)
+    """
+    print(f"[API] GET /api/benchmark/scatter-data - industry: {industry}, limit: {limit}, mode: {mode}")
+    context = data_reloader.current
+    benchmark_calc = context.benchmark_calc
+    
+    if benchmark_calc is None or benchmark_calc.merged_df is None:
+        raise HTTPException(status_code=503, detail="벤치마크 데이터가 로드되지 않았습니다.")
+    if mode not in SCATTER_MODES:
+        raise HTTPException(status_code=400, detail=f"mode는 {', '.join(SCATTER_MODES)} 중 하나여야 합니다.")
+    
+    # 프론트엔드 코드를 실제 업종명으로 변환
+    if industry:
+        mapped_industry = map_industry_code(industry)
+        print(f"[MAPPING] '{industry}' -> '{mapped_industry}'")
+    else:
+        mapped_industry = None
+    
+    try:
+        scatter_data = scatter_cache.get_or_create(
+            (mapped_industry, limit, mode),
+            context.version,
+            lambda: benchmark_calc.get_scatter_data(mapped_industry, limit, mode),
+        )
+        print(f"[OK] 산점도 데이터 반환 완료: {len(scatter_data['points'])}개 점 ({mode})")
+        return scatter_data
+    except Exception as e:
+        print(f"[ERROR] 산점도 데이터 조회 실패: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"데이터 조회 실패: {str(e)}")
+
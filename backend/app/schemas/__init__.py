@@ -0,0 +1,465 @@
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel, EmailStr, ConfigDict
+from pydantic.alias_generators import to_camel  # Pydantic 내장 함수 사용
+from fastapi_users import schemas as fastapi_users_schemas
+
+
+# 모든 스키마의 베이스 클래스 - 자동으로 camelCase 변환
+class CamelBaseModel(BaseModel):
+    model_config = ConfigDict(
+        alias_generator=to_camel,
+        populate_by_name=True,
+        from_attributes=True,
+        use_enum_values=True,
+    )
+    
+    def model_dump(self, **kwargs):
+        """기본적으로 by_alias=True로 직렬화"""
+        kwargs.setdefault('by_alias', True)
+        return super().model_dump(**kwargs)
+    
+    def model_dump_json(self, **kwargs):
+        """기본적으로 by_alias=True로 JSON 직렬화"""
+        kwargs.setdefault('by_alias', True)
+        return super().model_dump_json(**kwargs)
+
+
+# ========== User Schemas ==========
+class UserRead(fastapi_users_schemas.BaseUser[int]):
+    """fastapi-users BaseUser를 상속하면서 camelCase 변환"""
+    name: str
+    business_name: Optional[str] = None
+    industry: Optional[str] = None
+    created_at: datetime
+    
+    model_config = ConfigDict(
+        alias_generator=to_camel,
+        populate_by_name=True,
+        from_attributes=True,
+    )
+
+
+class UserCreate(fastapi_users_schemas.BaseUserCreate):
+    """fastapi-users BaseUserCreate를 상속하면서 camelCase 변환"""
+    name: str
+    business_name: Optional[str] = None
+    industry: Optional[str] = None
+    
+    model_config = ConfigDict(
+        alias_generator=to_camel,
+        populate_by_name=True,
+    )
+
+
+class UserUpdate(fastapi_users_schemas.BaseUserUpdate):
+    """fastapi-users BaseUserUpdate를 상속하면서 camelCase 변환"""
+    name: Optional[str] = None
+    business_name: Optional[str] = None
+    industry: Optional[str] = None
+    
+    model_config = ConfigDict(
+        alias_generator=to_camel,
+        populate_by_name=True,
+    )
+
+
+# ========== Auth Schemas ==========
+class LoginRequest(CamelBaseModel):
+    email: EmailStr
+    password: str
+
+
+class SignupRequest(CamelBaseModel):
+    email: EmailStr
+    password: str
+    name: str
+    business_name: Optional[str] = None
+    industry: Optional[str] = None
+
+
+class AuthResponse(CamelBaseModel):
+    user: UserRead
+    token: str
+
+
+# ========== Diagnosis Schemas ==========
+class DiagnosisRequest(CamelBaseModel):
+    encoded_mct: str
+
+
+class BusinessSearchResult(CamelBaseModel):
+    encoded_mct: str
+    name: str
+    area: str
+    business_type: str
+
+
+class BusinessSearchResponse(CamelBaseModel):
+    results: list[BusinessSearchResult]
+
+
+class DiagnosisComponentScore(CamelBaseModel):
+    score: float
+    trend: str
+
+
+class DiagnosisComponents(CamelBaseModel):
+    sales: DiagnosisComponentScore
+    customer: DiagnosisComponentScore
+    market: DiagnosisComponentScore
+
+
+class Recommendation(CamelBaseModel):
+    title: str
+    description: str
+    priority: str
+
+
+class DiagnosisResponse(CamelBaseModel):
+    id: str
+    overall_score: float
+    risk_level: str
+    components: DiagnosisComponents
+    recommendations: list[Recommendation]
+    insights: list[str]
+    created_at: str
+    ta_ym: Optional[str] = None
+    revenue_ratio: Optional[float] = None  # 업종 평균 대비 매출 비율 (100% = 평균)
+
+
+class DiagnosisHistory(CamelBaseModel):
+    diagnoses: list[DiagnosisResponse]
+
+
+class BatchDiagnosisRequest(CamelBaseModel):
+    encoded_mcts: list[str]
+
+
+class BatchDiagnosisItem(CamelBaseModel):
+    encoded_mct: str
+    business_name: str
+    diagnosis: DiagnosisResponse
+
+
+class BatchDiagnosisResponse(CamelBaseModel):
+    diagnoses: list[BatchDiagnosisItem]
+    not_found: list[str]  # 데이터가 없는 ENCODED_MCT
+
+
+# ========== Diagnosis Record Schemas (저장용) ==========
+class DiagnosisRecordSimple(CamelBaseModel):
+    """최근 진단 기록 (간단한 정보만)"""
+    encoded_mct: str
+    business_name: str
+    created_at: str
+
+
+class DiagnosisRecordListItem(CamelBaseModel):
+    """진단 기록 목록 아이템"""
+    id: int
+    encoded_mct: str
+    business_name: str
+    created_at: str
+
+
+class DiagnosisRecordList(CamelBaseModel):
+    """사용자의 진단 기록 목록"""
+    records: list[DiagnosisRecordListItem]
+    total: int
+
+
+# ========== Action Plan Schemas ==========
+class ActionPlanItem(CamelBaseModel):
+    id: str
+    title: str
+    description: str
+    priority: str
+    status: str
+    due_date: Optional[str] = None
+
+
+class ActionPlanRequest(CamelBaseModel):
+    diagnosis_id: str
+    items: list[ActionPlanItem]
+
+
+class ActionPlan(CamelBaseModel):
+    id: str
+    user_id: int
+    diagnosis_id: str
+    items: list[ActionPlanItem]
+    created_at: str
+    updated_at: str
+
+
+# ========== Benchmark Schemas ==========
+class MetricValue(CamelBaseModel):
+    average: float
+    median: float
+
+
+class BenchmarkMetrics(CamelBaseModel):
+    revenue: MetricValue
+    expenses: MetricValue
+    customers: MetricValue
+    profit_margin: MetricValue
+
+
+class RiskDistribution(CamelBaseModel):
+    GREEN: int
+    YELLOW: int
+    ORANGE: int
+    RED: int
+
+
+class BenchmarkData(CamelBaseModel):
+    industry: str
+    region: str
+    average_risk_score: float
+    metrics: BenchmarkMetrics
+    risk_distribution: RiskDistribution
+    month: Optional[int] = None  # risk_distribution 기준년월 (yyyymm)
+
+
+class BenchmarkBulkResponse(CamelBaseModel):
+    benchmarks: list[BenchmarkData]
+    total_count: int
+
+
+class BenchmarkTrend(CamelBaseModel):
+    industry: str  # 실제 업종명 또는 카테고리 코드
+    window: int  # 이동 구간 (개월 수)
+    months: list[int]  # 기준년월 (yyyymm, 오름차순)
+    revenue: list[Optional[float]]  # 평균 매출 (원)
+    customers: list[Optional[float]]  # 평균 고객수 (명)
+    safety_score: list[Optional[float]]  # 평균 안전점수 (높을수록 안전)
+    sample_size: list[int]  # 매출 표본 수
+    alerts: dict[str, list[int]]  # Alert 등급별 건수
+
+
+class CompareRequest(CamelBaseModel):
+    industry: str
+    revenue: float
+    expenses: float
+    customers: int
+    risk_score: float
+
+
+class ComparisonMetric(CamelBaseModel):
+    user: float
+    average: float
+    difference: float
+    percentile: Optional[float] = None  # 업종 내 가맹점 대비 백분위 (데이터가 없으면 None)
+
+
+class ComparisonMetrics(CamelBaseModel):
+    revenue: ComparisonMetric
+    expenses: ComparisonMetric
+    customers: ComparisonMetric
+
+
+class CompareResponse(CamelBaseModel):
+    user_score: float
+    industry_average: float
+    percentile: int
+    comparison: ComparisonMetrics
+    insights: list[str]
+
+
+class CustomerMixMetric(CamelBaseModel):
+    metric: str  # 지표명 (male, age_30, female_1020, revisit, resident 등)
+    group: str  # gender, age, gender_age, retention, customer_type
+    label: str  # 표시명
+    average: Optional[float] = None  # 동종 가맹점 평균 (%)
+    median: Optional[float] = None  # 동종 가맹점 중앙값 (%)
+    count: int  # 값이 있는 가맹점 수
+
+
+class CustomerMixBenchmark(CamelBaseModel):
+    industry: str  # 실제 업종명 또는 카테고리 코드
+    region: str
+    merchant_count: int
+    metrics: list[CustomerMixMetric]
+
+
+class CustomerMixComparisonMetric(CustomerMixMetric):
+    value: Optional[float] = None  # 가맹점 값 (%)
+    difference: Optional[float] = None  # 가맹점 값 - 평균 (%p)
+    percentile: Optional[float] = None  # 동종 가맹점 대비 백분위
+
+
+class CustomerMixCompareResponse(CamelBaseModel):
+    encoded_mct: str
+    merchant_name: Optional[str] = None
+    industry: str
+    region: str
+    month: int  # 가맹점 고객 데이터 기준년월 (yyyymm)
+    peer_count: int  # 비교 대상 가맹점 수
+    metrics: list[CustomerMixComparisonMetric]
+    insights: list[str]
+
+
+# ========== Scatter Plot Schemas ==========
+class ScatterPoint(CamelBaseModel):
+    merchant_id: str
+    merchant_name: str  # 가맹점명
+    revenue: float  # 월평균 매출
+    customers: float  # 월평균 고객수
+    risk_score: float  # 위험도
+    industry: str  # 업종명
+
+
+class ScatterHistogramBin(CamelBaseModel):
+    x: int  # 매출 구간 번호
+    y: int  # 고객수 구간 번호
+    count: int  # 가맹점 수
+    avg_risk: float  # 평균 위험도
+
+
+class ScatterHistogram(CamelBaseModel):
+    x_edges: list[float]  # 매출 백분위 구간 경계
+    y_edges: list[float]  # 고객수 백분위 구간 경계
+    bins: list[ScatterHistogramBin]  # 가맹점이 있는 구간만
+
+
+class ScatterData(CamelBaseModel):
+    points: list[ScatterPoint]
+    industry: str
+    total_count: int
+    avg_revenue: float
+    avg_customers: float
+    avg_risk: float
+    mode: str = "random"  # random, grid, histogram
+    histogram: Optional[ScatterHistogram] = None  # histogram 모드에서만
+
+
+# ========== Chat Schemas ==========
+class ChatMessage(CamelBaseModel):
+    role: str
+    content: str
+
+
+class ChatRequest(CamelBaseModel):
+    messages: list[ChatMessage]
+    context: Optional[dict] = None
+
+
+class ChatResponse(CamelBaseModel):
+    message: str
+
+
+# ========== FAQ Schemas ==========
+class FAQ(CamelBaseModel):
+    id: str
+    category: str
+    question: str
+    answer: str
+
+
+# ========== Insight Schemas ==========
+class Insight(CamelBaseModel):
+    id: str
+    industry: str
+    title: str
+    summary: str
+    key_points: list[str]
+    published_at: str
+
+
+# ========== Notification Schemas ==========
+class Notification(CamelBaseModel):
+    id: str
+    user_id: int
+    title: str
+    message: str
+    type: str
+    is_read: bool
+    created_at: str
+
+
+class NotificationSettings(CamelBaseModel):
+    email_alerts: bool
+    weekly_reports: bool
+    risk_threshold: str
+
+
+# ========== Statistics Schemas ==========
+class IndustryStatistic(CamelBaseModel):
+    industry: str
+    count: int
+    closure_rate: float
+
+
+class TrendsData(CamelBaseModel):
+    labels: list[str]
+    openings: list[int]
+    closures: list[int]
+
+
+class Statistics(CamelBaseModel):
+    total_businesses: int
+    closure_rate: float
+    average_survival_years: float
+    by_industry: list[IndustryStatistic]
+    trends: TrendsData
+
+
+# ========== Success Story Schemas ==========
+class SuccessStory(CamelBaseModel):
+    id: str
+    business_name: str
+    industry: str
+    location: str
+    story: str
+    before_score: float
+    after_score: float
+    improvements: list[str]
+    testimonial: str
+    image_url: str
+
+
+# ========== Support Schemas ==========
+class ContactRequest(CamelBaseModel):
+    name: str
+    email: EmailStr
+    subject: str
+    message: str
+
+
+class ContactResponse(CamelBaseModel):
+    success: bool
+    id: str
+
+
+# ========== Admin Schemas ==========
+class IngestResponse(CamelBaseModel):
+    """월 단위 데이터 추가 결과"""
+    ta_ym: int
+    rows: dict[str, int]  # 데이터셋별 추가된 행 수
+    replaced: bool  # 같은 월 데이터를 교체했는지 여부
+    affected_merchants: int
+    affected_industries: list[str]  # 벤치마크를 다시 계산한 업종
+    version: int  # 추가 후 데이터 버전
+    persisted: bool
+    elapsed_ms: float
+
+
+# ========== Common Response Schemas ==========
+class SuccessResponse(CamelBaseModel):
+    success: bool
+
+
+class UserResponse(CamelBaseModel):
+    user: UserRead
+
+
+class NotificationSettingsResponse(CamelBaseModel):
+    success: bool
+    settings: NotificationSettings
+
+
+# ========== Error Response ==========
+class ErrorResponse(CamelBaseModel):
+    error: str
+
@@ -0,0 +1,1166 @@
+import threading
+import pandas as pd
+import numpy as np
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
+from app.config import settings
+from app.services.benchmark_cube import BenchmarkCube
+from app.services.benchmark_percentiles import PercentileRanker
+from app.services.benchmark_trend import TREND_WINDOWS, build_trend_table, rollup_monthly
+from app.services.customer_benchmarks import CustomerBenchmarks
+from app.services.data_snapshot import decode_categories
+from app.services.data_store import MerchantDataStore, data_store, month_values
+from app.services.merchant_ids import merchant_ids
+from app.services.response_cache import ResponseCache
+from app.services.risk_series import ALERT_LEVELS
+from app.services.scatter_density import (
+    SCATTER_MODES, assign_cells, build_histogram, extreme_positions, grid_sample, sampling_order,
+)
+
+# 프론트엔드 카테고리 -> 실제 데이터 업종명 매핑 (6개 대분류)
+CATEGORY_MAPPING = {
+    # 1. 음식점 (한식/양식/일식/중식 등)
+    "restaurant": [
+        # 한식 전체
+        "한식-육류/고기", "백반/가정식", "한식-단품요리일반", "한식-해물/생선",
+        "한식-국수/만두", "한식-국밥/설렁탕", "한식-찌개/전골", "한식-냉면",
+        "한식뷔페", "한식-감자탕", "한식-죽", "한식-두부요리", "한정식",
+        # 양식/일식/중식
+        "양식", "일식당", "일식-덮밥/돈가스", "일식-우동/소바/라면",
+        "일식-초밥/롤", "일식-샤브샤브", "일식-참치회",
+        "중식당", "중식-훠궈/마라탕", "중식-딤섬/중식만두",
+        "동남아/인도음식", "기타세계요리", "스테이크",
+        # 분식/간편식
+        "분식", "도시락", "기사식당", "구내식당/푸드코트"
+    ],
+    
+    # 2. 카페/베이커리
+    "cafe": [
+        "카페", "커피전문점", "베이커리", "아이스크림/빙수", "도너츠",
+        "마카롱", "테마카페", "테이크아웃커피", "와플/크로플", "탕후루"
+    ],
+    
+    # 3. 패스트푸드/치킨
+    "fastfood": [
+        "치킨", "피자", "햄버거", "샌드위치/토스트", "꼬치구이"
+    ],
+    
+    # 4. 주점/술집
+    "pub": [
+        "호프/맥주", "요리주점", "일반 유흥주점", "이자카야", "와인바",
+        "룸살롱/단란주점", "민속주점", "포장마차"
+    ],
+    
+    # 5. 식자재/편의점
+    "retail": [
+        "축산물", "식료품", "농산물", "청과물", "수산물", "주류",
+        "반찬", "떡/한과", "떡/한과 제조", "미곡상", "담배", "건어물", "유제품",
+        "인삼제품", "건강식품", "건강원", "차", "와인샵", "주스"
+    ],
+    
+    # 6. 기타
+    "other": [
+        "식품 제조"
+    ]
+}
+
+# 업종명 -> 카테고리 코드 (벤치마크 큐브의 카테고리 차원)
+INDUSTRY_CATEGORY = {
+    industry: category
+    for category, industries in CATEGORY_MAPPING.items()
+    for industry in industries
+}
+
+# 하위호환성을 위한 단일 매핑 (대표 업종)
+INDUSTRY_MAPPING = {
+    "restaurant": "한식-육류/고기",
+    "cafe": "카페",
+    "fastfood": "치킨",
+    "pub": "호프/맥주",
+    "retail": "식료품",
+    "other": "식품 제조"
+}
+
+# 벤치마크 계산에 쓰는 ds2 백분위 구간 컬럼 -> 구간 중앙값(0~100) 컬럼명
+# (나머지 ds2 컬럼은 조인 전에 제외 - 다른 구간 컬럼도 decode_percentile_buckets로 같은 방식으로 변환 가능)
+BENCHMARK_BUCKET_COLUMNS = {
+    "RC_M1_SAA": "Revenue_num",          # 매출금액 구간
+    "RC_M1_UE_CUS_CN": "Customers_num",  # 유니크 고객 수 구간
+}
+
+# 데이터셋 간 조인 키 (ENCODED_MCT를 인터닝한 int32 가맹점 id)
+MERCHANT_ID_COLUMN = "MCT_ID"
+
+# 산점도용 병합 데이터(merged_df)에 남기는 컬럼
+SCATTER_SOURCE_COLUMNS = (
+    "ENCODED_MCT", "MCT_ID", "TA_YM", "HPSN_MCT_ZCD_NM", "MCT_NM", "Revenue_num", "Customers_num", "RiskScore",
+)
+
+# 백분위를 금액/인원으로 환산할 때의 기본 기준값 (API에서 사용하는 값)
+DEFAULT_BASE_REVENUE = 50000000  # 5천만원
+DEFAULT_BASE_CUSTOMERS = 1000    # 1000명
+
+# 산점도 응답 캐시 ((업종, limit) 단위, 데이터 버전이 바뀌면 비움)
+scatter_cache = ResponseCache(max_size=256)
+
+# 편의 함수로 export
+def map_industry_code(industry_code: str) -> str:
+    """
+    프론트엔드 업종 코드를 실제 데이터의 업종명으로 변환
+    (모듈 레벨에서도 사용 가능하도록)
+    """
+    return BenchmarkCalculator.map_industry_code(industry_code)
+
+class BenchmarkCalculator:
+    def __init__(self, store: Optional[MerchantDataStore] = None):
+        self.store = store or data_store
+        self.merchants = None
+        self.monthly_usage = None
+        self.risk_data = None
+        self.merged_df = None  # scatter plot용 병합 데이터 (SCATTER_SOURCE_COLUMNS)
+        self.industry_stats = None
+        self.cube: Optional[BenchmarkCube] = None  # 업종 x 지역 집계 큐브
+        self.percentiles: Optional[PercentileRanker] = None  # 업종별 정렬 배열 (비교 백분위)
+        self.monthly_stats = None  # 업종 x 기준년월별 지표 합계/건수와 Alert 등급 건수
+        # ((업종/카테고리/None, yyyymm) -> (등급별 건수, 비율), 업종/카테고리/None -> 최신 yyyymm)
+        self._alert_lookup: Optional[tuple] = None
+        self._trend_table: Optional[Mapping] = None  # (업종/카테고리/None, 이동 구간) -> 월별 배열
+        self._scatter_table: Optional[Mapping] = None  # 업종/카테고리/None -> 산점도 컬럼 배열/격자
+        # (업종/카테고리 -> 벤치마크, 대체 업종 벤치마크) - 통계가 바뀔 때마다 통째로 교체
+        self._benchmark_lookup: Optional[tuple] = None
+        # ds3 고객 구성 벤치마크 - (고객, 가맹점) 데이터셋 버전이 바뀌면 다시 생성
+        self._customer_benchmarks: Optional[CustomerBenchmarks] = None
+        self._customer_lock = threading.Lock()
+    
+    @staticmethod
+    def map_industry_code(industry_code: str) -> str:
+        """
+        프론트엔드 업종 코드를 실제 데이터의 업종명으로 변환
+        
+        Args:
+            industry_code: 프론트엔드에서 보낸 업종 코드 (예: "restaurant", "cafe")
+        
+        Returns:
+            실제 데이터의 업종명 (예: "한식-육류/고기", "카페")
+        """
+        # 매핑 딕셔너리에서 찾기
+        if industry_code in INDUSTRY_MAPPING:
+            return INDUSTRY_MAPPING[industry_code]
+        
+        # 매핑이 없으면 원본 그대로 반환 (이미 한글 업종명일 수도 있음)
+        return industry_code
+        
+    @property
+    def monthly_customers(self) -> pd.DataFrame:
+        """ds3 고객 데이터 (벤치마크 계산에는 쓰지 않으므로 처음 접근할 때 저장소에서 로드)"""
+        return self.store.customers
+
+    def load_data(self):
+        """공유 데이터 저장소에서 데이터셋 참조 (복사하지 않음)"""
+        try:
+            self.merchants = self.store.merchants
+            self.monthly_usage = self.store.usage
+            self.risk_data = self.store.risk
+            
+            print("[OK] 데이터 로드 완료")
+            print(f"   - 가맹점: {len(self.merchants):,}개")
+            print(f"   - 월별 사용 데이터: {len(self.monthly_usage):,}개")
+            print(f"   - 위험도 데이터: {len(self.risk_data):,}개")
+            return True
+        except Exception as e:
+            print(f"[ERROR] 데이터 로드 실패: {e}")
+            import traceback
+            traceback.print_exc()
+            return False
+    
+    @staticmethod
+    def parse_percentile_range(range_str) -> Optional[float]:
+        """
+        백분위 구간 문자열을 숫자로 변환
+        예: '5_75-90%' -> 82.5, '1_10%미만' -> 5.0, '6_90%초과' -> 95.0
+        """
+        if pd.isna(range_str) or range_str == '-999999.9':
+            return None
+        
+        range_str = str(range_str)
+        
+        # '10%미만' 처리
+        if '10%미만' in range_str or '10% 미만' in range_str or '10%����' in range_str:
+            return 5.0
+        
+        # '90%초과' 처리
+        if '90%초과' in range_str or '90% 초과' in range_str or '90%�ʰ�' in range_str:
+            return 95.0
+        
+        # 구간 처리 (예: '5_75-90%')
+        try:
+            if '_' in range_str:
+                parts = range_str.split('_')[1]
+                if '-' in parts:
+                    # '75-90%' -> [75, 90]
+                    values = parts.replace('%', '').split('-')
+                    return (float(values[0]) + float(values[1])) / 2
+        except:
+            pass
+        
+        return None
+    
+    @classmethod
+    def decode_percentile_buckets(cls, series: pd.Series) -> pd.Series:
+        """
+        백분위 구간 컬럼 전체를 구간 중앙값으로 변환
+        
+        구간 라벨은 몇 종류뿐이므로 고유 라벨만 parse_percentile_range로 한 번씩 해석하고,
+        컬럼 전체는 라벨 코드 배열로 인덱싱한다. (행마다 문자열 파싱하지 않음)
+        """
+        codes, labels = pd.factorize(series)  # 결측은 코드 -1
+        lookup = np.array([cls.parse_percentile_range(label) for label in labels] + [None], dtype=float)
+        return pd.Series(lookup[codes], index=series.index)
+    
+    def calculate_industry_benchmarks(self, recent_months: int = 6) -> Dict:
+        """
+        업종별 벤치마크 통계 계산 (매출, 고객수, 위험도)
+        
+        Args:
+            recent_months: 최근 몇 개월 데이터를 사용할지 (기본 6개월)
+        
+        Returns:
+            업종별 통계 딕셔너리
+        """
+        if self.merchants is None or self.monthly_usage is None or self.risk_data is None:
+            print("데이터가 로드되지 않았습니다. load_data()를 먼저 실행하세요.")
+            return {}
+
+        self.recent_months = recent_months
+        frames = self._join_frames()
+        self.industry_stats, self.merged_df, cube_rows = self._compute_industry_stats(recent_months, frames)
+        self.cube = BenchmarkCube.build(*cube_rows)
+        self.monthly_stats = self._aggregate_monthly(*frames)
+        self._build_benchmark_lookup()
+        self._build_scatter_table()
+        return self.industry_stats.to_dict('index')
+
+    def _with_ids(self, name: str, df: pd.DataFrame, columns: list) -> pd.DataFrame:
+        """
+        데이터셋의 일부 컬럼 + 가맹점 정수 id (저장소 프레임이면 저장소의 id 배열 재사용)
+        mmap category 컬럼은 이 집계용 사본에서만 object로 되돌린다 (decode_categories)
+        """
+        if self.store.is_loaded(name) and df is self.store.frame(name):
+            ids = self.store.merchant_ids(name)
+        else:
+            ids = merchant_ids.intern(df['ENCODED_MCT'])
+        rows = decode_categories(df[[column for column in columns if column in df.columns]])
+        return rows.assign(**{MERCHANT_ID_COLUMN: ids})
+
+    def _join_frames(self, scope=None) -> tuple:
+        """
+        조인에 쓰는 컬럼만 남긴 (가맹점, 이용, 위험도) 프레임 - 조인 키는 문자열 대신 MCT_ID
+
+        Args:
+            scope: 남길 가맹점 id 배열 (None이면 전체)
+        """
+        frames = (
+            self._with_ids('merchants', self.merchants,
+                           ['HPSN_MCT_ZCD_NM', 'HPSN_MCT_BZN_CD_NM', 'MCT_SIGUNGU_NM', 'MCT_NM']),
+            self._with_ids('usage', self.monthly_usage, ['ENCODED_MCT', 'TA_YM', *BENCHMARK_BUCKET_COLUMNS]),
+            self._with_ids('risk', self.risk_data, ['TA_YM', 'RiskScore', 'Alert']),
+        )
+        if scope is None:
+            return frames
+        # 일부 가맹점만 다시 집계하는 경우 (refresh_industries)
+        return tuple(df[df[MERCHANT_ID_COLUMN].isin(scope)] for df in frames)
+
+    def _compute_industry_stats(self, recent_months: int, frames: tuple) -> tuple:
+        """
+        업종별 통계와 scatter plot용 병합 데이터 계산
+
+        Args:
+            recent_months: 가맹점별 최근 몇 개월 데이터를 사용할지
+            frames: _join_frames 결과 (가맹점, 이용, 위험도)
+
+        Returns:
+            (업종별 통계 DataFrame, 병합 데이터 DataFrame, 큐브 기본 행 (이용, 위험도))
+        """
+        merchants, monthly_usage, risk_data = frames
+
+        # 1. 가맹점과 월별 데이터 조인 (매출, 고객수) - HPSN_MCT_ZCD_NM이 업종 컬럼
+        merged = monthly_usage.merge(
+            merchants[[MERCHANT_ID_COLUMN, 'HPSN_MCT_ZCD_NM', 'HPSN_MCT_BZN_CD_NM', 'MCT_SIGUNGU_NM', 'MCT_NM']],
+            on=MERCHANT_ID_COLUMN,
+            how='inner'
+        )
+        
+        # 최근 N개월 데이터만 사용
+        merged['TA_YM'] = merged['TA_YM'].astype(str)
+        merged = merged.sort_values('TA_YM', ascending=False)
+        recent_months_data = merged.groupby(MERCHANT_ID_COLUMN).head(recent_months).copy()
+        
+        # 백분위 구간을 중앙값으로 변환 (벤치마크에 쓰는 구간 컬럼만)
+        for bucket_col, num_col in BENCHMARK_BUCKET_COLUMNS.items():
+            recent_months_data[num_col] = self.decode_percentile_buckets(recent_months_data[bucket_col])
+        
+        # 2. 위험도 데이터 조인
+        risk_recent = risk_data[[MERCHANT_ID_COLUMN, 'TA_YM', 'RiskScore']].copy()
+        risk_recent['TA_YM'] = pd.to_datetime(risk_recent['TA_YM']).dt.strftime('%Y%m')
+        risk_recent = risk_recent.sort_values('TA_YM', ascending=False)
+        risk_recent = risk_recent.groupby(MERCHANT_ID_COLUMN).head(recent_months)
+        
+        # 가맹점 정보와 조인하여 업종 추가
+        risk_with_industry = risk_recent.merge(
+            merchants[[MERCHANT_ID_COLUMN, 'HPSN_MCT_ZCD_NM', 'HPSN_MCT_BZN_CD_NM', 'MCT_SIGUNGU_NM']],
+            on=MERCHANT_ID_COLUMN,
+            how='inner'
+        )
+        
+        # 3. merged_df 생성 (scatter plot용) - 매출/고객/위험도 모두 포함
+        merged_df = self._scatter_rows(recent_months_data.merge(
+            risk_recent,
+            on=[MERCHANT_ID_COLUMN, 'TA_YM'],
+            how='inner'
+        ))
+        
+        # 4. 업종별 매출/고객수 집계 (HPSN_MCT_ZCD_NM 사용)
+        usage_stats = recent_months_data.groupby('HPSN_MCT_ZCD_NM').agg({
+            'Revenue_num': ['mean', 'median', 'std', 'count'],
+            'Customers_num': ['mean', 'median', 'std'],
+            MERCHANT_ID_COLUMN: 'nunique'
+        }).round(2)
+        
+        usage_stats.columns = [
+            'sales_mean', 'sales_median', 'sales_std', 'sales_count',
+            'customers_mean', 'customers_median', 'customers_std',
+            'merchant_count'
+        ]
+        
+        # 5. 업종별 위험도 집계
+        risk_stats = risk_with_industry.groupby('HPSN_MCT_ZCD_NM').agg({
+            'RiskScore': ['mean', 'median', 'std'],
+            MERCHANT_ID_COLUMN: 'nunique'
+        }).round(4)
+        
+        risk_stats.columns = [
+            'risk_mean', 'risk_median', 'risk_std', 'risk_merchant_count'
+        ]
+        
+        # 5. 두 통계 합치기
+        combined_stats = usage_stats.join(risk_stats, how='outer')
+
+        # 6. 업종 x 지역 큐브 기본 행
+        cube_rows = (
+            self._cube_rows(recent_months_data, ['Revenue_num', 'Customers_num']),
+            self._cube_rows(risk_with_industry, ['RiskScore']),
+        )
+
+        return combined_stats, merged_df, cube_rows
+
+    @staticmethod
+    def _scatter_rows(merged: pd.DataFrame) -> pd.DataFrame:
+        """
+        산점도 테이블 계산에 쓰는 컬럼만 남긴 병합 데이터
+        메모리 절감 모드에서는 문자열 컬럼을 category, 기준년월을 int32로 바꾸고
+        float32로 값이 그대로 표현되는 지표(구간 중앙값)는 float32로 저장
+        """
+        rows = merged[list(SCATTER_SOURCE_COLUMNS)].reset_index(drop=True)
+        if not settings.compact_frames:
+            return rows
+        rows = rows.astype({
+            'ENCODED_MCT': 'category',
+            'HPSN_MCT_ZCD_NM': 'category',
+            'MCT_NM': 'category',
+            'TA_YM': np.int32,
+        })
+        for column in ('Revenue_num', 'Customers_num'):
+            narrowed = rows[column].astype(np.float32)
+            if np.array_equal(narrowed.to_numpy(np.float64), rows[column].to_numpy(np.float64), equal_nan=True):
+                rows[column] = narrowed
+        return rows
+
+    @staticmethod
+    def _cube_rows(df: pd.DataFrame, value_columns: list) -> pd.DataFrame:
+        """큐브 차원(업종/카테고리/시군구/상권)과 지표 컬럼만 남긴 기본 행"""
+        rows = pd.DataFrame({
+            MERCHANT_ID_COLUMN: df[MERCHANT_ID_COLUMN].values,
+            'industry': df['HPSN_MCT_ZCD_NM'].values,
+            'category': df['HPSN_MCT_ZCD_NM'].map(INDUSTRY_CATEGORY).values,
+            'sigungu': df['MCT_SIGUNGU_NM'].values,
+            'district': df['HPSN_MCT_BZN_CD_NM'].values,
+        })
+        for column in value_columns:
+            rows[column] = df[column].values
+        return rows
+
+    def clone(self, store: MerchantDataStore) -> "BenchmarkCalculator":
+        """
+        계산 결과를 공유하는 복사본 (다른 저장소 기준)
+        refresh_industries는 통계를 새 DataFrame으로 교체하므로 복사본을 갱신해도 원본은 그대로다.
+        """
+        calc = BenchmarkCalculator(store)
+        calc.merchants = self.merchants
+        calc.monthly_usage = self.monthly_usage
+        calc.risk_data = self.risk_data
+        calc.merged_df = self.merged_df
+        calc.industry_stats = self.industry_stats
+        calc.cube = self.cube
+        calc.percentiles = self.percentiles
+        calc.monthly_stats = self.monthly_stats
+        calc._alert_lookup = self._alert_lookup
+        calc._trend_table = self._trend_table
+        calc._scatter_table = self._scatter_table
+        calc.recent_months = self.recent_months
+        calc._benchmark_lookup = self._benchmark_lookup
+        calc._customer_benchmarks = self._customer_benchmarks
+        return calc
+
+    def refresh_industries(self, encoded_mcts) -> list:
+        """
+        새 월 데이터가 들어온 가맹점이 속한 업종만 다시 집계
+
+        가맹점별 최근 N개월 구간이 바뀌는 업종의 통계와 병합 데이터만 교체하고
+        나머지 업종은 기존 계산 결과를 그대로 사용한다.
+
+        Args:
+            encoded_mcts: 데이터가 추가/교체된 가맹점 ENCODED_MCT 목록
+
+        Returns:
+            다시 계산한 업종명 목록
+        """
+        # 저장소의 최신 데이터프레임으로 참조 갱신
+        self.merchants = self.store.merchants
+        self.monthly_usage = self.store.usage
+        self.risk_data = self.store.risk
+
+        industry_of = self._with_ids('merchants', self.merchants, ['HPSN_MCT_ZCD_NM'])
+        changed = merchant_ids.lookup_many(list(encoded_mcts))
+        affected = industry_of.loc[
+            industry_of[MERCHANT_ID_COLUMN].isin(changed[changed >= 0]), 'HPSN_MCT_ZCD_NM'
+        ].dropna().unique().tolist()
+
+        if self.industry_stats is None:
+            self.calculate_industry_benchmarks(self.recent_months)
+            return affected
+        if not affected:
+            return []
+
+        # 같은 가맹점이 여러 업종 행을 가질 수 있으므로 해당 업종 가맹점 전체를 다시 집계
+        scope = industry_of.loc[industry_of['HPSN_MCT_ZCD_NM'].isin(affected), MERCHANT_ID_COLUMN].unique()
+        frames = self._join_frames(scope)
+        stats, merged_df, cube_rows = self._compute_industry_stats(self.recent_months, frames)
+        stats = stats[stats.index.isin(affected)]
+
+        self.industry_stats = pd.concat([
+            self.industry_stats.drop(index=affected, errors='ignore'), stats
+        ]).sort_index()
+        self.merged_df = self._scatter_rows(pd.concat([
+            self.merged_df[~self.merged_df[MERCHANT_ID_COLUMN].isin(scope)], merged_df
+        ], ignore_index=True))
+        self.cube = self.cube.updated(*cube_rows, scope, affected, INDUSTRY_CATEGORY)
+        monthly_stats = self._aggregate_monthly(*frames)
+        self.monthly_stats = pd.concat([
+            self.monthly_stats.drop(index=affected, level='HPSN_MCT_ZCD_NM', errors='ignore'),
+            monthly_stats[monthly_stats.index.get_level_values('HPSN_MCT_ZCD_NM').isin(affected)],
+        ]).sort_index()
+        self._build_benchmark_lookup()
+        self._build_scatter_table()
+        return affected
+
+    def _build_benchmark_lookup(self) -> None:
+        """
+        모든 업종과 카테고리의 벤치마크를 기본 기준값으로 미리 계산
+        요청 시에는 사전 조회만 하도록 읽기 전용 매핑으로 만들어 한 번에 교체한다.
+        비교 백분위용 정렬 배열, Alert 등급 분포와 월별 추이도 함께 다시 만든다.
+        """
+        table = {}
+        for industry in self.industry_stats.index:
+            if pd.notna(industry) and industry != '':
+                table[industry] = self._compute_benchmark(industry)
+        for category in CATEGORY_MAPPING:
+            table[category] = self._compute_benchmark(category)
+
+        # 데이터에 없는 업종 요청 시 사용할 대체 벤치마크 (가맹점이 가장 많은 업종)
+        if len(self.industry_stats) > 0:
+            fallback = table.get(self.industry_stats['merchant_count'].idxmax())
+        else:
+            fallback = None
+        if fallback is None:
+            fallback = self._get_default_benchmark()
+
+        self._benchmark_lookup = (MappingProxyType(table), MappingProxyType(fallback))
+        if self.cube is not None:
+            self.percentiles = PercentileRanker.build(
+                self.cube, INDUSTRY_CATEGORY, DEFAULT_BASE_REVENUE, DEFAULT_BASE_CUSTOMERS
+            )
+        if self.monthly_stats is not None:
+            rollups = rollup_monthly(self.monthly_stats, INDUSTRY_CATEGORY)
+            self._alert_lookup = self._build_alert_lookup(rollups)
+            self._trend_table = build_trend_table(rollups, DEFAULT_BASE_REVENUE, DEFAULT_BASE_CUSTOMERS)
+
+    @classmethod
+    def _aggregate_monthly(cls, merchants: pd.DataFrame, monthly_usage: pd.DataFrame,
+                           risk_data: pd.DataFrame) -> pd.DataFrame:
+        """
+        업종 x 기준년월별 매출/고객수/위험도 합계와 건수, Alert 등급 건수
+        데이터셋마다 groupby 한 번이며, 결과는 합산 가능한 값만 담는다 (benchmark_trend.MONTHLY_SUM_COLUMNS).
+        입력은 _join_frames 결과 (가맹점, 이용, 위험도 - MCT_ID로 조인)
+        """
+        industry_of = merchants[[MERCHANT_ID_COLUMN, 'HPSN_MCT_ZCD_NM']]
+        usage = pd.DataFrame({
+            MERCHANT_ID_COLUMN: monthly_usage[MERCHANT_ID_COLUMN].values,
+            'month': month_values('usage', monthly_usage),
+            'revenue': cls.decode_percentile_buckets(monthly_usage['RC_M1_SAA']).values,
+            'customers': cls.decode_percentile_buckets(monthly_usage['RC_M1_UE_CUS_CN']).values,
+        }).merge(industry_of, on=MERCHANT_ID_COLUMN, how='inner')
+        usage_stats = usage.groupby(['HPSN_MCT_ZCD_NM', 'month']).agg(
+            revenue_sum=('revenue', 'sum'), revenue_count=('revenue', 'count'),
+            customers_sum=('customers', 'sum'), customers_count=('customers', 'count'),
+        )
+
+        alerts = risk_data['Alert'].values
+        risk = pd.DataFrame({
+            MERCHANT_ID_COLUMN: risk_data[MERCHANT_ID_COLUMN].values,
+            'month': month_values('risk', risk_data),
+            'risk': risk_data['RiskScore'].values,
+            **{level: (alerts == level).astype(np.int64) for level in ALERT_LEVELS},
+        }).merge(industry_of, on=MERCHANT_ID_COLUMN, how='inner')
+        risk_stats = risk.groupby(['HPSN_MCT_ZCD_NM', 'month']).agg(
+            risk_sum=('risk', 'sum'), risk_count=('risk', 'count'),
+            **{level: (level, 'sum') for level in ALERT_LEVELS},
+        )
+
+        monthly = usage_stats.join(risk_stats, how='outer').fillna(0)
+        count_columns = ['revenue_count', 'customers_count', 'risk_count', *ALERT_LEVELS]
+        return monthly.astype({column: np.int64 for column in count_columns})
+
+    @staticmethod
+    def _build_alert_lookup(rollups: Dict[Optional[str], pd.DataFrame]) -> tuple:
+        """업종/카테고리/전체 월별 표에서 (키, 월) -> (등급별 건수, 비율) 사전 생성"""
+        table, latest = {}, {}
+        for key, frame in rollups.items():
+            for month, row in zip(frame.index, frame[list(ALERT_LEVELS)].itertuples(index=False)):
+                counts = tuple(int(v) for v in row)
+                if sum(counts) == 0:
+                    continue  # 위험도 데이터가 없는 월
+                table[(key, int(month))] = (counts, BenchmarkCalculator._to_percentages(counts))
+                latest[key] = max(latest.get(key, 0), int(month))
+        return MappingProxyType(table), MappingProxyType(latest)
+
+    def get_alert_distribution(self, industry_code: Optional[str],
+                               month: Optional[int] = None) -> Optional[Dict]:
+        """
+        업종/카테고리의 Alert 등급 분포 (미리 계산된 사전 조회)
+
+        Args:
+            industry_code: 업종 코드 (영문 카테고리 또는 한글 업종명, None/"전체"면 전체 업종)
+            month: 기준년월 yyyymm (None이면 해당 업종의 최신 월)
+
+        Returns:
+            {"month": yyyymm, "counts": {등급: 건수}, "distribution": {등급: 비율(%, 합계 100)}}
+            또는 데이터가 없으면 None
+        """
+        if self._alert_lookup is None:
+            return None
+        table, latest = self._alert_lookup
+        key = self._industry_key(industry_code)
+        month = month or latest.get(key)
+        entry = table.get((key, month))
+        if entry is None:
+            return None
+        counts, percentages = entry
+        return {
+            "month": month,
+            "counts": dict(zip(ALERT_LEVELS, counts)),
+            "distribution": dict(zip(ALERT_LEVELS, percentages)),
+        }
+
+    def get_trend(self, industry_code: Optional[str], window: int = 1,
+                  months: Optional[int] = None) -> Optional[Dict]:
+        """
+        업종/카테고리의 월별 추이 (미리 계산된 배열 조회)
+
+        Args:
+            industry_code: 업종 코드 (영문 카테고리 또는 한글 업종명, None/"전체"면 전체 업종)
+            window: 이동 구간 (TREND_WINDOWS 중 하나, 1이면 월별 값)
+            months: 최근 몇 개월만 반환할지 (None이면 전체)
+
+        Returns:
+            {"industry", "window", "months", "revenue", "customers", "safety_score", "sample_size", "alerts"}
+            또는 데이터가 없으면 None
+        """
+        if window not in TREND_WINDOWS:
+            raise ValueError(f"window는 {TREND_WINDOWS} 중 하나여야 합니다")
+        if self._trend_table is None:
+            return None
+        key = self._industry_key(industry_code)
+        series = self._trend_table.get((key, window))
+        if series is None:
+            return None
+        if months:
+            series = {
+                name: ({level: values[-months:] for level, values in value.items()}
+                       if isinstance(value, dict) else value[-months:])
+                for name, value in series.items()
+            }
+        return {"industry": key or "전체", "window": window, **series}
+
+    @staticmethod
+    def _to_percentages(counts: tuple) -> tuple:
+        """건수를 합계 100인 정수 비율로 (최대 잔여 방식)"""
+        total = sum(counts)
+        if total == 0:
+            return (0,) * len(counts)
+        shares = [count * 100 / total for count in counts]
+        result = [int(share) for share in shares]
+        remainders = sorted(range(len(shares)), key=lambda i: shares[i] - result[i], reverse=True)
+        for i in remainders[:100 - sum(result)]:
+            result[i] += 1
+        return tuple(result)
+
+    @property
+    def benchmark_table(self) -> Mapping[str, Dict]:
+        """업종명/카테고리 코드 -> 벤치마크 (기본 기준값)"""
+        if self._benchmark_lookup is None:
+            self.calculate_industry_benchmarks()
+        return self._benchmark_lookup[0]
+
+    def get_benchmark_for_industry(self, industry_code: str, 
+                                   base_revenue: int = DEFAULT_BASE_REVENUE,
+                                   base_customers: int = DEFAULT_BASE_CUSTOMERS) -> Dict:
+        """
+        특정 업종의 벤치마크 데이터 반환
+        기본 기준값이면 미리 계산된 테이블에서 조회 (기준값이 다르면 직접 계산)
+        
+        Args:
+            industry_code: 업종 코드 (영문 카테고리 또는 한글 업종명)
+            base_revenue: 기준 매출 (백분위를 실제 금액으로 변환할 때 사용)
+            base_customers: 기준 고객 수
+        
+        Returns:
+            벤치마크 딕셔너리
+        """
+        if self._benchmark_lookup is None:
+            self.calculate_industry_benchmarks()
+            if self._benchmark_lookup is None:
+                return self._get_default_benchmark()
+        
+        if base_revenue != DEFAULT_BASE_REVENUE or base_customers != DEFAULT_BASE_CUSTOMERS:
+            return self._compute_benchmark(industry_code, base_revenue, base_customers)
+        
+        table, fallback = self._benchmark_lookup
+        benchmark = table.get(industry_code)
+        if benchmark is None:
+            benchmark = table.get(self.map_industry_code(industry_code))
+        if benchmark is None:
+            # 데이터에 없는 업종은 가맹점이 가장 많은 업종의 데이터 (요청 코드는 그대로 표시)
+            if 'industry_code' not in fallback:
+                return dict(fallback)
+            return {**fallback, "industry_code": industry_code}
+        return dict(benchmark)
+    
+    def _industry_key(self, industry_code: Optional[str]) -> Optional[str]:
+        """요청 업종 코드 -> 큐브/정렬 배열 키 (카테고리 코드, 실제 업종명 또는 전체는 None)"""
+        if not industry_code or industry_code == "전체":
+            return None
+        if industry_code in CATEGORY_MAPPING:
+            return industry_code
+        industry = self.map_industry_code(industry_code)
+        if industry not in self.industry_stats.index and len(self.industry_stats) > 0:
+            # 데이터에 없는 업종은 가맹점이 가장 많은 업종 (get_benchmark_for_industry와 동일)
+            industry = self.industry_stats['merchant_count'].idxmax()
+        return industry
+
+    def get_percentiles(self, industry_code: Optional[str], **values: float) -> Dict[str, Optional[float]]:
+        """
+        업종 내 가맹점 대비 백분위 (정렬 배열 이진 탐색, 요청 시 pandas 미사용)
+
+        Args:
+            industry_code: 업종 코드 (영문 카테고리 또는 한글 업종명)
+            values: safety_score(0~100), revenue(원), customers(명) 중 필요한 값
+
+        Returns:
+            지표명 -> 백분위 (0~100, 데이터가 없으면 None)
+        """
+        if self.percentiles is None:
+            return {metric: None for metric in values}
+        return self.percentiles.rank(self._industry_key(industry_code), **values)
+
+    def get_regional_benchmark(self, industry_code: Optional[str], region: Optional[str] = None,
+                               district: Optional[str] = None,
+                               base_revenue: int = DEFAULT_BASE_REVENUE,
+                               base_customers: int = DEFAULT_BASE_CUSTOMERS) -> Optional[Dict]:
+        """
+        업종 x 지역 벤치마크 (집계 큐브에서 조회)
+
+        Args:
+            industry_code: 업종 코드 (영문 카테고리 또는 한글 업종명, None/"전체"면 전체 업종)
+            region: 시군구명 또는 상권명
+            district: 상권명 (region과 함께 지정 가능)
+
+        Returns:
+            벤치마크 딕셔너리 (region 포함) 또는 지역을 해석할 수 없거나 해당 조합 데이터가 없으면 None
+        """
+        if self.cube is None:
+            self.calculate_industry_benchmarks()
+            if self.cube is None:
+                return None
+
+        sigungu, region_district = self.cube.resolve_region(region)
+        district = district or region_district
+        if sigungu is None and district is None:
+            return None
+
+        industry = self._industry_key(industry_code)
+        cell = self.cube.get(industry, sigungu, district)
+        if cell is None:
+            return None
+
+        def scaled(stats: Dict, stat: str, base: int) -> int:
+            value = stats[stat]
+            return int((value if pd.notna(value) else 50) * base / 100)
+
+        def safety(stat: str) -> float:
+            risk = cell['risk'][stat]
+            return round((1 - (risk if pd.notna(risk) else 0.65)) * 100, 2)
+
+        return {
+            "industry": industry or "전체",
+            "industry_code": industry_code,
+            "region": " ".join(part for part in (sigungu, district) if part) or "전국",
+            "average_revenue": scaled(cell['revenue'], 'mean', base_revenue),
+            "median_revenue": scaled(cell['revenue'], 'median', base_revenue),
+            "average_customers": scaled(cell['customers'], 'mean', base_customers),
+            "median_customers": scaled(cell['customers'], 'median', base_customers),
+            "average_risk_score": safety('mean'),  # 안전점수 (높을수록 안전)
+            "median_risk_score": safety('median'),
+            "merchant_count": int(cell['merchant_count']) if pd.notna(cell['merchant_count']) else 0,
+            "sample_size": int(cell['revenue']['count']) if pd.notna(cell['revenue']['count']) else 0,
+        }
+
+    # ========== 고객 구성 벤치마크 (ds3) ==========
+    def _customer_version(self) -> tuple:
+        return self.store.dataset_versions['customers'], self.store.dataset_versions['merchants']
+
+    def _build_customer_benchmarks(self) -> Optional[CustomerBenchmarks]:
+        """
+        ds3 고객 구성 벤치마크 생성 (데이터셋 버전이 그대로면 기존 결과 재사용)
+        서버 시작/리로드 시에는 만들지 않고 첫 고객 구성 요청 때 만든다 (ds3 지연 로드).
+        고객 데이터셋이 저장소에 없으면 올리지 않고 한 번 읽어 집계 결과만 남긴다.
+        """
+        version = self._customer_version()
+        table = self._customer_benchmarks
+        if table is not None and table.version == version:
+            return table
+        with self._customer_lock:
+            table = self._customer_benchmarks
+            if table is not None and table.version == version:
+                return table
+            try:
+                customers = self.store.peek('customers')
+                if self.store.is_loaded('customers'):
+                    ids = self.store.merchant_ids('customers')
+                else:
+                    ids = merchant_ids.intern(customers['ENCODED_MCT'])
+                merchants = self._with_ids('merchants', self.store.merchants, [
+                    'HPSN_MCT_ZCD_NM', 'MCT_SIGUNGU_NM', 'HPSN_MCT_BZN_CD_NM',
+                ])
+                table = CustomerBenchmarks.build(
+                    customers, ids, month_values('customers', customers), merchants, INDUSTRY_CATEGORY, version,
+                )
+            except (OSError, KeyError, ValueError) as e:
+                print(f"[WARN] 고객 구성 벤치마크를 만들 수 없습니다: {e}")
+                return None
+            self._customer_benchmarks = table
+            print(f"[OK] 고객 구성 벤치마크 생성: {len(table):,}개 업종 x 지역 조합")
+            return table
+
+    def _resolve_region_filter(self, region: Optional[str], district: Optional[str]) -> Optional[tuple]:
+        """지역 필터 -> (시군구, 상권) (지정하지 않으면 (None, None), 해석할 수 없으면 None)"""
+        if not region and not district:
+            return None, None
+        if self.cube is None:
+            return None
+        sigungu, region_district = self.cube.resolve_region(region)
+        district = district or region_district
+        if sigungu is None and district is None:
+            return None
+        return sigungu, district
+
+    def get_customer_mix(self, industry_code: Optional[str], region: Optional[str] = None,
+                         district: Optional[str] = None) -> Optional[Dict]:
+        """
+        업종 x 지역 고객 구성 벤치마크 (성별/연령대 비중, 재방문/신규, 거주/직장/유동 고객 비율)
+
+        Returns:
+            {"industry", "industry_code", "region", "merchant_count", "metrics"}
+            또는 지역을 해석할 수 없거나 해당 조합 데이터가 없으면 None
+        """
+        table = self._build_customer_benchmarks()
+        location = self._resolve_region_filter(region, district)
+        if table is None or location is None:
+            return None
+        industry = self._industry_key(industry_code) if self.industry_stats is not None else None
+        cell = table.get(industry, *location)
+        if cell is None:
+            return None
+        return {
+            "industry": industry or "전체",
+            "industry_code": industry_code,
+            "region": " ".join(part for part in location if part) or "전국",
+            **cell,
+        }
+
+    def compare_customer_mix(self, encoded_mct: str, region: Optional[str] = None,
+                             district: Optional[str] = None) -> Optional[Dict]:
+        """
+        가맹점의 최신 월 고객 구성을 같은 업종 가맹점(지역 지정 시 해당 지역) 분포와 비교
+
+        Returns:
+            {"encoded_mct", "industry", "region", "month", "peer_count", "metrics"}
+            또는 가맹점 고객 데이터나 비교 대상이 없으면 None
+        """
+        table = self._build_customer_benchmarks()
+        location = self._resolve_region_filter(region, district)
+        if table is None or location is None:
+            return None
+        merchant_id = merchant_ids.lookup(encoded_mct)
+        merchant = table.merchant(merchant_id)
+        if merchant is None:
+            return None
+        result = table.compare(merchant_id, merchant["industry"], *location)
+        if result is None:
+            return None
+        return {
+            "encoded_mct": encoded_mct,
+            "industry": merchant["industry"],
+            "region": " ".join(part for part in location if part) or "전국",
+            **result,
+        }
+
+    def _compute_benchmark(self, industry_code: str,
+                           base_revenue: int = DEFAULT_BASE_REVENUE,
+                           base_customers: int = DEFAULT_BASE_CUSTOMERS) -> Dict:
+        """업종 통계에서 벤치마크 딕셔너리 계산"""
+        # 프론트엔드 카테고리인지 확인
+        if industry_code in CATEGORY_MAPPING:
+            # 카테고리에 속한 모든 업종의 평균 계산
+            return self._get_category_average(industry_code, base_revenue, base_customers)
+        
+        # 단일 업종명으로 처리
+        mapped_industry = self.map_industry_code(industry_code)
+        
+        # 업종 코드가 없으면 전체 평균 반환
+        if mapped_industry not in self.industry_stats.index:
+            # 가장 많은 가맹점이 있는 업종 사용
+            if len(self.industry_stats) > 0:
+                mapped_industry = self.industry_stats['merchant_count'].idxmax()
+            else:
+                return self._get_default_benchmark()
+        
+        stats = self.industry_stats.loc[mapped_industry]
+        
+        # 백분위를 실제 값으로 변환 (백분위 * 기준값 / 100)
+        avg_revenue = int(stats.get('sales_mean', 50) * base_revenue / 100)
+        median_revenue = int(stats.get('sales_median', 50) * base_revenue / 100)
+        avg_customers = int(stats.get('customers_mean', 50) * base_customers / 100)
+        median_customers = int(stats.get('customers_median', 50) * base_customers / 100)
+        
+        # 위험도를 안전점수로 변환 (0~1 스케일을 0~100 안전점수로)
+        # risk_mean이 0.2면 -> 안전점수 80
+        avg_risk = float(stats.get('risk_mean', 0.65))
+        median_risk = float(stats.get('risk_median', 0.65))
+        
+        # 안전점수로 변환: (1 - risk) * 100
+        avg_safety_score = round((1 - avg_risk) * 100, 2)
+        median_safety_score = round((1 - median_risk) * 100, 2)
+        
+        return {
+            "industry": mapped_industry,  # 실제 업종명 반환
+            "industry_code": industry_code,  # 원본 코드도 포함
+            "average_revenue": avg_revenue,
+            "median_revenue": median_revenue,
+            "average_customers": avg_customers,
+            "median_customers": median_customers,
+            "average_risk_score": avg_safety_score,  # 이제 안전점수 (높을수록 안전)
+            "median_risk_score": median_safety_score,
+            "merchant_count": int(stats.get('merchant_count', 0)),
+            "sample_size": int(stats.get('sales_count', 0))
+        }
+    
+    def _get_category_average(self, category_code: str, 
+                             base_revenue: int = 50000000,
+                             base_customers: int = 1000) -> Dict:
+        """
+        카테고리 벤치마크 (집계 큐브의 (카테고리, 전체, 전체) 셀 - 지역 벤치마크와 같은 값)
+        
+        Args:
+            category_code: 카테고리 코드 (예: "restaurant", "cafe")
+            base_revenue: 기준 매출
+            base_customers: 기준 고객 수
+        
+        Returns:
+            카테고리 평균 벤치마크
+        """
+        if self.industry_stats is None:
+            self.calculate_industry_benchmarks()
+        
+        # 카테고리에 속한 업종 목록
+        industries_in_category = CATEGORY_MAPPING.get(category_code, [])
+        
+        if not industries_in_category:
+            return self._get_default_benchmark()
+        
+        # 해당 업종들의 통계만 필터링
+        valid_industries = [ind for ind in industries_in_category if ind in self.industry_stats.index]
+        
+        if not valid_industries:
+            return self._get_default_benchmark()
+        
+        # 카테고리 전체 행에서 직접 집계한 큐브 셀 사용 (업종별 중앙값의 평균은 실제 중앙값이 아님)
+        cell = self.cube.get(category_code) if self.cube is not None else None
+        if cell is None or not cell['merchant_count']:
+            return self._get_default_benchmark()
+        
+        def stat(measure: str, name: str, default: float) -> float:
+            value = cell[measure][name]
+            return float(value) if pd.notna(value) else default
+        
+        # 백분위를 실제 값으로 변환
+        avg_revenue = int(stat('revenue', 'mean', 50) * base_revenue / 100)
+        median_revenue = int(stat('revenue', 'median', 50) * base_revenue / 100)
+        avg_customers = int(stat('customers', 'mean', 50) * base_customers / 100)
+        median_customers = int(stat('customers', 'median', 50) * base_customers / 100)
+        
+        # 위험도를 안전점수로 변환 (0~1 스케일을 0~100 안전점수로)
+        avg_safety_score = round((1 - stat('risk', 'mean', 0.65)) * 100, 2)
+        median_safety_score = round((1 - stat('risk', 'median', 0.65)) * 100, 2)
+        
+        return {
+            "industry": f"{category_code}_category",
+            "industry_code": category_code,
+            "category_name": category_code,
+            "industries_count": len(valid_industries),
+            "average_revenue": avg_revenue,
+            "median_revenue": median_revenue,
+            "average_customers": avg_customers,
+            "median_customers": median_customers,
+            "average_risk_score": avg_safety_score,  # 안전점수 (높을수록 안전)
+            "median_risk_score": median_safety_score,
+            "merchant_count": int(cell['merchant_count']),
+            "sample_size": int(stat('revenue', 'count', 0))
+        }
+    
+    def _get_default_benchmark(self) -> Dict:
+        """기본 벤치마크 반환"""
+        return {
+            "industry": "전체",
+            "average_revenue": 45000000,
+            "median_revenue": 38000000,
+            "average_customers": 850,
+            "median_customers": 720,
+            "average_risk_score": 35.0,  # 안전점수 (0.65 위험도 -> 35 안전점수)
+            "median_risk_score": 37.0,  # 안전점수 (0.63 위험도 -> 37 안전점수)
+            "merchant_count": 0,
+            "sample_size": 0
+        }
+    
+    def print_all_industries(self):
+        """모든 업종 목록 출력"""
+        if self.merchants is None:
+            self.load_data()
+        
+        # HPSN_MCT_ZCD_NM이 실제 업종 컬럼
+        industries = self.merchants['HPSN_MCT_ZCD_NM'].value_counts()
+        print("\n[INFO] 업종별 가맹점 수:")
+        print("=" * 50)
+        for industry, count in industries.items():
+            if pd.notna(industry) and industry != '':
+                print(f"{industry}: {count}개")
+        print("=" * 50)
+    
+    def get_all_industry_benchmarks(self) -> Dict:
+        """모든 업종의 벤치마크 반환 (카테고리 제외)"""
+        return {
+            code: benchmark for code, benchmark in self.get_benchmarks().items()
+            if code not in CATEGORY_MAPPING
+        }
+
+    def get_benchmarks(self, industry_codes: Optional[list] = None) -> Dict[str, Dict]:
+        """
+        여러 업종/카테고리의 벤치마크를 한 번에 반환 (미리 계산된 테이블 조회)
+
+        Args:
+            industry_codes: 업종 코드 목록 (None이면 테이블의 모든 업종과 카테고리)
+
+        Returns:
+            요청 코드 -> 벤치마크 딕셔너리 (요청 순서 유지)
+        """
+        if self._benchmark_lookup is None:
+            self.calculate_industry_benchmarks()
+            if self._benchmark_lookup is None:
+                return {code: self._get_default_benchmark() for code in industry_codes or []}
+        
+        if industry_codes is None:
+            table, _ = self._benchmark_lookup
+            return {code: dict(benchmark) for code, benchmark in table.items()}
+        return {code: self.get_benchmark_for_industry(code) for code in industry_codes}
+    
+    def _build_scatter_table(self) -> None:
+        """
+        산점도용 가맹점별 최신 월 데이터를 업종/카테고리/전체 단위로 미리 계산
+
+        키마다 해당 범위의 최신 월 행만 가맹점별로 집계하고 이상치를 걸러
+        컬럼별 numpy 배열로 보관한다 (가맹점 순서는 ENCODED_MCT 정렬, 요청 시 샘플링 기준).
+        grid/histogram 모드용 격자 칸 배정과 2D 히스토그램도 함께 계산한다.
+        """
+        df = self.merged_df
+        df = df.assign(
+            category=df['HPSN_MCT_ZCD_NM'].astype(object).map(INDUSTRY_CATEGORY), _all=0,
+            # float32로 저장된 지표도 평균은 float64로 계산
+            Revenue_num=df['Revenue_num'].astype(np.float64),
+            Customers_num=df['Customers_num'].astype(np.float64),
+        )
+        aggregations = {
+            'Revenue_num': 'mean',
+            'Customers_num': 'mean',
+            'RiskScore': 'mean',
+            'HPSN_MCT_ZCD_NM': 'first',  # 업종명
+            'MCT_NM': 'first',  # 가맹점명
+        }
+
+        table = {}
+        for level in ('HPSN_MCT_ZCD_NM', 'category', '_all'):
+            # 범위별 최신 월의 데이터만 사용
+            scoped = df[df[level].notna()]
+            scoped = scoped[scoped['TA_YM'] == scoped.groupby(level, observed=True)['TA_YM'].transform('max')]
+            merchant_data = scoped.groupby([level, 'ENCODED_MCT'], observed=True).agg(aggregations)
+
+            # NaN 제거 및 이상치 필터링
+            merchant_data = merchant_data.dropna()
+            merchant_data = merchant_data[
+                (merchant_data['Revenue_num'] > 0) &
+                (merchant_data['Customers_num'] > 0) &
+                (merchant_data['RiskScore'] >= 0) &
+                (merchant_data['RiskScore'] <= 100)
+            ]
+
+            for key, group in merchant_data.groupby(level=0, sort=False, observed=True):
+                columns = {
+                    "merchant_id": group.index.get_level_values('ENCODED_MCT').astype(str).str[:8].to_numpy(),
+                    "merchant_name": group['MCT_NM'].astype(str).to_numpy(),
+                    "revenue": group['Revenue_num'].to_numpy(dtype=np.float64),
+                    "customers": group['Customers_num'].to_numpy(dtype=np.float64),
+                    "risk_score": group['RiskScore'].to_numpy(dtype=np.float64) * 100,  # 0-1 -> 0-100%
+                    "industry": group['HPSN_MCT_ZCD_NM'].astype(str).to_numpy(),
+                }
+                cells = assign_cells(columns["revenue"], columns["customers"])
+                table[None if level == '_all' else key] = {
+                    "columns": columns,
+                    "cells": cells,
+                    "order": sampling_order(cells),
+                    "extremes": extreme_positions(columns),
+                    "histogram": build_histogram(cells, columns["risk_score"]),
+                }
+
+        self._scatter_table = MappingProxyType(table)
+
+    def get_scatter_data(self, industry: str = None, limit: int = 500, mode: str = "random"):
+        """
+        특정 업종의 개별 가게 데이터를 반환 (산점도용)
+        미리 계산된 산점도 테이블에서 샘플링만 하고 점 목록은 컬럼 단위로 변환한다.
+        
+        Parameters:
+        -----------
+        industry : str
+            업종명 (한글) 또는 카테고리 코드. None이면 전체
+        limit : int
+            반환할 최대 데이터 개수 (성능 최적화)
+        mode : str
+            random - 무작위 샘플링 (평균은 샘플 기준)
+            grid - 격자 칸별 밀도 보존 샘플링 + 지표별 극값 포함 (평균은 전체 가맹점 기준)
+            histogram - 점 대신 매출 x 고객수 2D 히스토그램 (칸별 가맹점 수, 평균 위험도)
+        
+        Returns:
+        --------
+        dict : ScatterData 형식의 데이터
+        """
+        if mode not in SCATTER_MODES:
+            raise ValueError(f"지원하지 않는 mode입니다: {mode}")
+        if self.merged_df is None:
+            raise ValueError("데이터가 로드되지 않았습니다")
+        if self._scatter_table is None:
+            self._build_scatter_table()
+        
+        key = industry if industry and industry != "전체" else None
+        entry = self._scatter_table.get(key)
+        columns = entry["columns"] if entry else None
+        count = len(columns["revenue"]) if columns else 0
+        
+        if count == 0:
+            return {
+                "points": [],
+                "industry": industry or "전체",
+                "total_count": 0,
+                "avg_revenue": 0.0,
+                "avg_customers": 0.0,
+                "avg_risk": 0.0,
+                "mode": mode,
+                "histogram": None,
+            }
+        
+        # grid/histogram은 전체 가맹점 기준 평균
+        averaged = columns
+        if mode == "histogram":
+            points = []
+        else:
+            if mode == "grid":
+                positions = grid_sample(entry["cells"], entry["order"], entry["extremes"], limit)
+            elif count > limit:
+                # DataFrame.sample(n=limit, random_state=42)와 같은 위치 선택
+                positions = np.random.RandomState(42).choice(count, size=limit, replace=False)
+            else:
+                positions = None
+            if positions is not None:
+                columns = {name: values[positions] for name, values in columns.items()}
+                if mode == "random":
+                    averaged = columns
+            
+            # ScatterPoint 형식으로 변환 (컬럼 단위)
+            names = list(columns)
+            points = [dict(zip(names, row)) for row in zip(*(columns[name].tolist() for name in names))]
+        
+        return {
+            "points": points,
+            "industry": industry or "전체",
+            "total_count": count if mode == "histogram" else len(points),
+            "avg_revenue": float(averaged["revenue"].mean()),
+            "avg_customers": float(averaged["customers"].mean()),
+            "avg_risk": float(averaged["risk_score"].mean()),
+            "mode": mode,
+            "histogram": entry["histogram"] if mode == "histogram" else None,
+        }
+
+# 사용 예시
+if __name__ == "__main__":
+    calc = BenchmarkCalculator()
+    
+    # 데이터 로드
+    if calc.load_data():
+        # 업종 목록 확인
+        calc.print_all_industries()
+        
+        # 벤치마크 계산
+        print("\n[INFO] 업종별 벤치마크 계산 중...")
+        benchmarks = calc.calculate_industry_benchmarks(recent_months=6)
+        
+        # 결과 출력
+        print("\n[OK] 계산 완료!")
+        print(calc.industry_stats.head(10))
+        
+        # 모든 업종 벤치마크 출력
+        print("\n[INFO] 업종별 벤치마크:")
+        all_benchmarks = calc.get_all_industry_benchmarks()
+        for industry, data in list(all_benchmarks.items())[:5]:
+            print(f"\n{industry}:")
+            print(f"  평균 매출: 원{data['average_revenue']:,}")
+            print(f"  평균 고객수: {data['average_customers']:,}명")
+            print(f"  평균 위험도: {data['average_risk_score']:.2f}")
+            print(f"  가맹점 수: {data['merchant_count']}개")
+
@@ -0,0 +1,237 @@
+"""
+업종 x 지역 벤치마크 집계 큐브
+
+업종(HPSN_MCT_ZCD_NM), 카테고리, 시군구(MCT_SIGUNGU_NM), 상권(HPSN_MCT_BZN_CD_NM) 차원의
+모든 조합(롤업 포함)에 대해 매출/고객수/위험도의 평균, 중앙값, 표준편차, 건수를 미리 집계한다.
+요청 시에는 DataFrame을 다시 필터링하지 않고 (업종, 시군구, 상권) 키로 셀 하나만 조회한다.
+
+- 셀 키: (업종명 또는 카테고리 코드 또는 None, 시군구 또는 None, 상권 또는 None) - None은 전체
+- 셀 값: CELL_FIELDS 순서의 float 튜플 (데이터가 있는 조합만 저장)
+- 중앙값은 하위 셀에서 합칠 수 없으므로 롤업 셀도 원본 행에서 직접 집계
+- 데이터 갱신 시 바뀐 업종과 그 카테고리, 전체(None) 셀만 다시 집계 (updated)
+"""
+from types import MappingProxyType
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# 큐브 기본 행의 가맹점 컬럼 (정수 id, merchant_ids) - 가맹점 수 집계와 증분 갱신 범위 판단에 사용
+MERCHANT_COLUMN = 'MCT_ID'
+
+# 큐브 기본 행의 차원 컬럼
+DIMENSION_COLUMNS = ('industry', 'category', 'sigungu', 'district')
+
+# 지표 이름 -> 기본 행의 값 컬럼 (매출/고객수는 이용 데이터, 위험도는 위험도 데이터 행)
+USAGE_MEASURES = {"revenue": "Revenue_num", "customers": "Customers_num"}
+RISK_MEASURES = {"risk": "RiskScore"}
+MEASURE_STATS = ('mean', 'median', 'std', 'count')
+MEASURE_ROUNDING = {"revenue": 2, "customers": 2, "risk": 4}  # 업종 통계(industry_stats)와 같은 반올림
+
+# 업종 차원 수준 x 지역 차원 조합 = 12개 그룹 (None/빈 튜플은 전체로 롤업)
+INDUSTRY_LEVELS = ('industry', 'category', None)
+REGION_LEVELS = (('sigungu', 'district'), ('sigungu',), ('district',), ())
+
+CELL_FIELDS = tuple(
+    f"{measure}_{stat}"
+    for measure in (*USAGE_MEASURES, *RISK_MEASURES)
+    for stat in MEASURE_STATS
+) + ('merchant_count', 'risk_merchant_count')
+_FIELD_INDEX = {field: i for i, field in enumerate(CELL_FIELDS)}
+
+CellKey = Tuple[Optional[str], Optional[str], Optional[str]]
+
+
+class AmbiguousRegionError(ValueError):
+    """지역 문자열이 여러 시군구에 해당해 하나로 해석할 수 없음"""
+
+    def __init__(self, region: str, candidates: list):
+        self.region = region
+        self.candidates = candidates
+        super().__init__(f"'{region}'에 해당하는 시군구가 여러 개입니다: {', '.join(candidates)}")
+
+
+def _compact(rows: pd.DataFrame) -> pd.DataFrame:
+    """차원 컬럼을 category 타입으로 바꿔 기본 행 메모리를 줄임 (가맹점은 이미 정수 id)"""
+    return rows.astype({column: 'category' for column in DIMENSION_COLUMNS})
+
+
+def _aggregate(rows: pd.DataFrame, measures: Dict[str, str], count_field: str,
+               industry_level: Optional[str]) -> Dict[CellKey, Dict[str, float]]:
+    """한 업종 수준에서 지역 조합별 셀 값(부분) 계산"""
+    partial: Dict[CellKey, Dict[str, float]] = {}
+    if rows.empty:
+        return partial
+
+    aggregations = {
+        f"{measure}_{stat}": (column, stat)
+        for measure, column in measures.items()
+        for stat in MEASURE_STATS
+    }
+    aggregations[count_field] = (MERCHANT_COLUMN, 'nunique')
+
+    for region_level in REGION_LEVELS:
+        keys = [level for level in (industry_level, *region_level) if level]
+        if keys:
+            grouped = rows.groupby(keys, observed=True, sort=False)
+        else:
+            grouped = rows.groupby(np.zeros(len(rows), dtype=np.int8))
+        table = grouped.agg(**aggregations)
+        for measure in measures:
+            columns = [f"{measure}_{stat}" for stat in MEASURE_STATS if stat != 'count']
+            table[columns] = table[columns].round(MEASURE_ROUNDING[measure])
+
+        for group, values in zip(table.index, table.itertuples(index=False)):
+            group = group if isinstance(group, tuple) else (group,)
+            labels = dict(zip(keys, group))
+            key = (
+                labels.get(industry_level) if industry_level else None,
+                labels.get('sigungu'),
+                labels.get('district'),
+            )
+            partial[key] = dict(zip(table.columns, values))
+    return partial
+
+
+class BenchmarkCube:
+    """업종/카테고리 x 시군구 x 상권 집계 셀 (만든 뒤에는 수정하지 않음)"""
+
+    def __init__(self, usage_rows: pd.DataFrame, risk_rows: pd.DataFrame,
+                 cells: Dict[CellKey, tuple]):
+        self.usage_rows = usage_rows  # 증분 갱신용 기본 행
+        self.risk_rows = risk_rows
+        self._cells = MappingProxyType(cells)
+        self._sigungus = frozenset(usage_rows['sigungu'].dropna().unique())
+        self._districts = frozenset(usage_rows['district'].dropna().unique())
+
+    @classmethod
+    def build(cls, usage_rows: pd.DataFrame, risk_rows: pd.DataFrame) -> "BenchmarkCube":
+        """
+        기본 행에서 전체 큐브 생성
+
+        Args:
+            usage_rows: MCT_ID, DIMENSION_COLUMNS, Revenue_num, Customers_num (가맹점 x 최근 월)
+            risk_rows: MCT_ID, DIMENSION_COLUMNS, RiskScore (가맹점 x 최근 월)
+        """
+        usage_rows, risk_rows = _compact(usage_rows), _compact(risk_rows)
+        cells = cls._compute_cells(usage_rows, risk_rows, INDUSTRY_LEVELS)
+        return cls(usage_rows, risk_rows, cells)
+
+    @staticmethod
+    def _compute_cells(usage_rows: pd.DataFrame, risk_rows: pd.DataFrame,
+                       industry_levels: Iterable[Optional[str]]) -> Dict[CellKey, tuple]:
+        partial: Dict[CellKey, Dict[str, float]] = {}
+        for level in industry_levels:
+            for key, values in _aggregate(usage_rows, USAGE_MEASURES, 'merchant_count', level).items():
+                partial.setdefault(key, {}).update(values)
+            for key, values in _aggregate(risk_rows, RISK_MEASURES, 'risk_merchant_count', level).items():
+                partial.setdefault(key, {}).update(values)
+
+        nan = float('nan')
+        return {
+            key: tuple(float(values.get(field, nan)) for field in CELL_FIELDS)
+            for key, values in partial.items()
+        }
+
+    def updated(self, usage_rows: pd.DataFrame, risk_rows: pd.DataFrame,
+                scope, industries: Iterable[str],
+                industry_categories: Dict[str, str]) -> "BenchmarkCube":
+        """
+        일부 가맹점의 기본 행을 교체한 새 큐브 (바뀐 업종/카테고리/전체 셀만 다시 집계)
+
+        Args:
+            usage_rows, risk_rows: scope 가맹점의 새 기본 행
+            scope: 기본 행을 교체할 가맹점 id 배열
+            industries: 다시 집계할 업종명 목록
+            industry_categories: 업종명 -> 카테고리 코드
+        """
+        usage = _compact(pd.concat([
+            self.usage_rows[~self.usage_rows[MERCHANT_COLUMN].isin(scope)].astype(
+                {column: object for column in DIMENSION_COLUMNS}),
+            usage_rows,
+        ], ignore_index=True))
+        risk = _compact(pd.concat([
+            self.risk_rows[~self.risk_rows[MERCHANT_COLUMN].isin(scope)].astype(
+                {column: object for column in DIMENSION_COLUMNS}),
+            risk_rows,
+        ], ignore_index=True))
+
+        industries = set(industries)
+        categories = {industry_categories[i] for i in industries if i in industry_categories}
+
+        cells = {
+            key: value for key, value in self._cells.items()
+            if key[0] is not None and key[0] not in industries and key[0] not in categories
+        }
+        cells.update(self._compute_cells(
+            usage[usage['industry'].isin(industries)],
+            risk[risk['industry'].isin(industries)],
+            ['industry'],
+        ))
+        cells.update(self._compute_cells(
+            usage[usage['category'].isin(categories)],
+            risk[risk['category'].isin(categories)],
+            ['category'],
+        ))
+        cells.update(self._compute_cells(usage, risk, [None]))
+        return BenchmarkCube(usage, risk, cells)
+
+    # ========== 조회 ==========
+    def __len__(self) -> int:
+        return len(self._cells)
+
+    def get(self, industry: Optional[str] = None, sigungu: Optional[str] = None,
+            district: Optional[str] = None) -> Optional[Dict]:
+        """
+        집계 셀 조회 (None인 차원은 전체)
+
+        Returns:
+            {"revenue": {"mean", "median", "std", "count"}, "customers": ..., "risk": ...,
+             "merchant_count", "risk_merchant_count"} 또는 해당 조합 데이터가 없으면 None
+        """
+        cell = self._cells.get((industry, sigungu, district))
+        if cell is None:
+            return None
+        result = {
+            measure: {stat: cell[_FIELD_INDEX[f"{measure}_{stat}"]] for stat in MEASURE_STATS}
+            for measure in (*USAGE_MEASURES, *RISK_MEASURES)
+        }
+        result['merchant_count'] = cell[_FIELD_INDEX['merchant_count']]
+        result['risk_merchant_count'] = cell[_FIELD_INDEX['risk_merchant_count']]
+        return result
+
+    def resolve_region(self, region: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+        """
+        지역 문자열을 (시군구, 상권)으로 해석
+        시군구명("서울 성동구")/상권명("성수")이 정확히 일치하거나, 구 이름만("성동구")처럼
+        시군구명의 단어 단위 접미사가 하나의 시군구에만 해당할 때 허용하며
+        해석할 수 없으면 (None, None)
+
+        Raises:
+            AmbiguousRegionError: 접미사가 여러 시군구에 해당하는 경우 (예: "중구")
+        """
+        if not region:
+            return None, None
+        region = region.strip()
+        if region in self._sigungus:
+            return region, None
+        if region in self._districts:
+            return None, region
+        words = region.split()
+        if not words:
+            return None, None
+        candidates = sorted(
+            sigungu for sigungu in self._sigungus if sigungu.split()[-len(words):] == words
+        )
+        if len(candidates) > 1:
+            raise AmbiguousRegionError(region, candidates)
+        if candidates:
+            return candidates[0], None
+        return None, None
+
+    def regions(self) -> Dict[str, list]:
+        """조회 가능한 시군구/상권 목록"""
+        return {
+            "sigungu": sorted(self._sigungus),
+            "districts": sorted(self._districts),
+        }
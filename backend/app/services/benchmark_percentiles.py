@@ -0,0 +1,97 @@
+"""
+업종/카테고리별 정렬 배열 기반 백분위 순위
+
+가맹점별 최근 N개월 평균(안전점수, 매출, 고객수)을 업종/카테고리/전체 단위로 정렬해 두고,
+비교 요청 값의 백분위는 이진 탐색(np.searchsorted)만으로 O(log n)에 계산한다.
+요청 처리 중에는 pandas를 사용하지 않는다.
+
+- 매출/고객수는 벤치마크와 같은 기준값으로 환산한 금액/인원 단위
+- 동점은 중간 순위로 처리 (값보다 작은 비율 + 같은 비율의 절반)
+"""
+from types import MappingProxyType
+from typing import Dict, Optional
+
+import numpy as np
+
+from app.services.benchmark_cube import MERCHANT_COLUMN, BenchmarkCube
+
+# 백분위 지표 (배열 순서)
+PERCENTILE_METRICS = ('safety_score', 'revenue', 'customers')
+
+
+def percentile_rank(values: np.ndarray, value: float) -> Optional[float]:
+    """정렬된 배열에서 value의 백분위 (0~100, 배열이 비어 있으면 None)"""
+    n = len(values)
+    if n == 0:
+        return None
+    lower = np.searchsorted(values, value, side='left')
+    upper = np.searchsorted(values, value, side='right')
+    return round(float(lower + upper) * 50.0 / n, 1)
+
+
+class PercentileRanker:
+    """업종명/카테고리 코드/None(전체) -> 지표별 정렬 배열"""
+
+    def __init__(self, arrays: Dict[Optional[str], Dict[str, np.ndarray]]):
+        self._arrays = MappingProxyType(arrays)
+
+    @classmethod
+    def build(cls, cube: BenchmarkCube, industry_categories: Dict[str, str],
+              base_revenue: int, base_customers: int) -> "PercentileRanker":
+        """
+        큐브 기본 행에서 가맹점별 평균을 구해 업종/카테고리/전체별로 정렬
+
+        Args:
+            cube: 업종 x 지역 집계 큐브 (가맹점 x 최근 월 기본 행 보유)
+            industry_categories: 업종명 -> 카테고리 코드
+            base_revenue, base_customers: 백분위 구간 값을 금액/인원으로 환산할 기준값
+        """
+        usage = cube.usage_rows.groupby(['industry', MERCHANT_COLUMN], observed=True).agg(
+            revenue=('Revenue_num', 'mean'), customers=('Customers_num', 'mean'))
+        usage['revenue'] *= base_revenue / 100
+        usage['customers'] *= base_customers / 100
+        risk = cube.risk_rows.groupby(['industry', MERCHANT_COLUMN], observed=True)['RiskScore'].mean()
+        safety = ((1 - risk) * 100).rename('safety_score')
+
+        series = {
+            'safety_score': safety,
+            'revenue': usage['revenue'],
+            'customers': usage['customers'],
+        }
+        arrays: Dict[Optional[str], Dict[str, list]] = {}
+        for metric, values in series.items():
+            values = values.dropna()
+            industries = values.index.get_level_values('industry')
+            for industry, group in values.groupby(industries, observed=True):
+                group = group.to_numpy(dtype=np.float64)
+                keys = {industry, industry_categories.get(industry), None}
+                for key in keys:
+                    arrays.setdefault(key, {}).setdefault(metric, []).append(group)
+
+        sorted_arrays = {
+            key: {
+                metric: np.sort(np.concatenate(metrics.get(metric, [np.empty(0)])))
+                for metric in PERCENTILE_METRICS
+            }
+            for key, metrics in arrays.items()
+        }
+        return cls(sorted_arrays)
+
+    def __contains__(self, key: Optional[str]) -> bool:
+        return key in self._arrays
+
+    def rank(self, key: Optional[str], **values: float) -> Dict[str, Optional[float]]:
+        """
+        지표 값들의 백분위 조회
+
+        Args:
+            key: 업종명/카테고리 코드 (None이면 전체)
+            values: 지표명=값 (safety_score, revenue, customers)
+
+        Returns:
+            지표명 -> 백분위 (해당 업종 데이터가 없으면 None)
+        """
+        arrays = self._arrays.get(key)
+        if arrays is None:
+            return {metric: None for metric in values}
+        return {metric: percentile_rank(arrays[metric], value) for metric, value in values.items()}
@@ -0,0 +1,108 @@
+"""
+업종/카테고리별 월별 추이 (매출, 고객수, 위험도, Alert 등급 건수)
+
+업종 x 기준년월 합계/건수 표(monthly_stats) 하나를 카테고리/전체로 합산(rollup_monthly)한 뒤
+이동 구간(TREND_WINDOWS)별 평균 배열을 미리 만들어 둔다.
+합계와 건수를 따로 보관하므로 카테고리/전체 합산과 이동 평균 모두 정확한 평균이 된다.
+모든 키는 첫 월~마지막 월의 연속된 달력 월로 맞추므로 (빠진 월은 합계/건수 0)
+이동 구간은 행 수가 아니라 실제 개월 수이고 months 배열은 키와 관계없이 같다.
+"""
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.services.risk_series import ALERT_LEVELS
+
+# monthly_stats 컬럼 (모두 합산 가능한 값)
+MONTHLY_SUM_COLUMNS = (
+    'revenue_sum', 'revenue_count',
+    'customers_sum', 'customers_count',
+    'risk_sum', 'risk_count',
+    *ALERT_LEVELS,
+)
+TREND_WINDOWS = (1, 3, 6, 12)  # 이동 구간 (개월 수, 1이면 월별 값)
+
+
+def rollup_monthly(monthly_stats: pd.DataFrame,
+                   industry_categories: Dict[str, str]) -> Dict[Optional[str], pd.DataFrame]:
+    """
+    업종 x 기준년월 표를 업종/카테고리/전체(None) 키별 월 인덱스 표로 분리
+
+    Args:
+        monthly_stats: (HPSN_MCT_ZCD_NM, month) 인덱스, MONTHLY_SUM_COLUMNS 컬럼
+        industry_categories: 업종명 -> 카테고리 코드
+
+    Returns:
+        키 -> 전체 월 범위(month_range) 인덱스 DataFrame (데이터가 없는 월은 0)
+    """
+    industries = monthly_stats.index.get_level_values('HPSN_MCT_ZCD_NM')
+    months = monthly_stats.index.get_level_values('month')
+    calendar = pd.Index(month_range(months), name='month')
+
+    rollups: Dict[Optional[str], pd.DataFrame] = {}
+    for industry, frame in monthly_stats.groupby(level='HPSN_MCT_ZCD_NM'):
+        rollups[industry] = frame.droplevel('HPSN_MCT_ZCD_NM').sort_index()
+    by_category = monthly_stats.groupby([industries.map(industry_categories), months]).sum()
+    for category, frame in by_category.groupby(level=0):
+        rollups[category] = frame.droplevel(0).sort_index()
+    rollups[None] = monthly_stats.groupby(months).sum().sort_index()
+    return {key: frame.reindex(calendar, fill_value=0) for key, frame in rollups.items()}
+
+
+def month_range(months) -> list:
+    """가장 이른 월부터 가장 늦은 월까지 빠짐없는 yyyymm 목록"""
+    months = np.asarray(months, dtype=np.int64)
+    if not len(months):
+        return []
+    first, last = int(months.min()), int(months.max())
+    ordinals = np.arange((first // 100) * 12 + first % 100 - 1, (last // 100) * 12 + last % 100)
+    return ((ordinals // 12) * 100 + ordinals % 12 + 1).tolist()
+
+
+def _rolling_sum(values: np.ndarray, window: int) -> np.ndarray:
+    """최근 window개월 합 (행은 연속된 월, 앞쪽은 있는 만큼만)"""
+    if window == 1:
+        return values
+    cumulative = np.cumsum(values, axis=0)
+    shifted = np.zeros_like(cumulative)
+    shifted[window:] = cumulative[:-window]
+    return cumulative - shifted
+
+
+def _mean_list(sums: np.ndarray, counts: np.ndarray, scale: float, digits: int) -> list:
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = np.round(sums / counts * scale, digits)
+    return [None if count == 0 else value for value, count in zip(means.tolist(), counts.tolist())]
+
+
+def build_trend_table(rollups: Dict[Optional[str], pd.DataFrame],
+                      base_revenue: int, base_customers: int) -> Mapping[Tuple[Optional[str], int], Dict]:
+    """
+    (키, 이동 구간) -> 응답용 월별 배열
+
+    매출/고객수는 벤치마크와 같은 기준값으로 환산하고, 위험도는 안전점수((1 - risk) * 100)로 변환한다.
+    Alert 등급 건수는 이동 구간 합계.
+    """
+    table = {}
+    for key, frame in rollups.items():
+        values = frame.reindex(columns=list(MONTHLY_SUM_COLUMNS), fill_value=0).to_numpy(dtype=np.float64)
+        column = {name: i for i, name in enumerate(MONTHLY_SUM_COLUMNS)}
+        months = [int(month) for month in frame.index]
+        for window in TREND_WINDOWS:
+            rolled = _rolling_sum(values, window)
+            risk_sum, risk_count = rolled[:, column['risk_sum']], rolled[:, column['risk_count']]
+            table[(key, window)] = {
+                "months": months,
+                "revenue": _mean_list(rolled[:, column['revenue_sum']], rolled[:, column['revenue_count']],
+                                      base_revenue / 100, 0),
+                "customers": _mean_list(rolled[:, column['customers_sum']], rolled[:, column['customers_count']],
+                                        base_customers / 100, 1),
+                "safety_score": _mean_list(risk_count - risk_sum, risk_count, 100, 2),
+                "sample_size": rolled[:, column['revenue_count']].astype(np.int64).tolist(),
+                "alerts": {
+                    level: rolled[:, column[level]].astype(np.int64).tolist() for level in ALERT_LEVELS
+                },
+            }
+    return MappingProxyType(table)
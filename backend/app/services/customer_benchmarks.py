@@ -0,0 +1,246 @@
+"""
+ds3(월별 고객 데이터) 기반 업종 x 지역 고객 구성 벤치마크
+
+가맹점별 최신 월의 고객 구성(성별/연령대 비중, 재방문/신규 고객 비율, 거주/직장/유동 고객 비율)을
+업종/카테고리/전체 x 시군구/상권 조합(benchmark_cube와 같은 셀 키)마다 한 번에 집계한다.
+그룹 안에서 지표별로 정렬한 배열(CSR)도 함께 만들어 두어, 가맹점 비교 요청은
+가맹점 id -> 행 위치 조회와 np.searchsorted만으로 처리한다 (요청 시 pandas 미사용).
+
+- 셀 키: (업종명 또는 카테고리 코드 또는 None, 시군구 또는 None, 상권 또는 None) - None은 전체
+- 가맹점 차원(업종/지역)은 big_data_set1에서 먼저 나온 행 기준 (저장소 가맹점 정보와 동일)
+- 결측(-999999.9 -> NaN)은 지표별로 제외하고 집계
+- 정렬 배열은 float32 (ds3 비율은 소수 첫째 자리 값이라 순위가 달라지지 않으며, 비교 값도 float32로 변환)
+- version: 만들 때의 (고객, 가맹점) 데이터셋 버전 - 다르면 호출자가 다시 만든다
+"""
+from types import MappingProxyType
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.services.benchmark_cube import INDUSTRY_LEVELS, REGION_LEVELS, CellKey
+from app.services.benchmark_percentiles import percentile_rank
+
+_GENDERS = (("male", "MAL", "남성"), ("female", "FME", "여성"))
+_AGE_GROUPS = (("1020", "20대 이하"), ("30", "30대"), ("40", "40대"), ("50", "50대"), ("60", "60대 이상"))
+
+
+def _metric_definitions() -> tuple:
+    """(지표명, 지표 그룹, 표시명, 합산할 ds3 컬럼) - 성별/연령대 비중은 성별 x 연령대 컬럼의 합"""
+    metrics = [
+        (gender, "gender", label, tuple(f"M12_{code}_{age}_RAT" for age, _ in _AGE_GROUPS))
+        for gender, code, label in _GENDERS
+    ]
+    metrics += [
+        (f"age_{age}", "age", label, tuple(f"M12_{code}_{age}_RAT" for _, code, _ in _GENDERS))
+        for age, label in _AGE_GROUPS
+    ]
+    metrics += [
+        (f"{gender}_{age}", "gender_age", f"{gender_label} {age_label}", (f"M12_{code}_{age}_RAT",))
+        for gender, code, gender_label in _GENDERS
+        for age, age_label in _AGE_GROUPS
+    ]
+    metrics += [
+        ("revisit", "retention", "재방문 고객", ("MCT_UE_CLN_REU_RAT",)),
+        ("new", "retention", "신규 고객", ("MCT_UE_CLN_NEW_RAT",)),
+        ("resident", "customer_type", "거주 고객", ("RC_M1_SHC_RSD_UE_CLN_RAT",)),
+        ("worker", "customer_type", "직장 고객", ("RC_M1_SHC_WP_UE_CLN_RAT",)),
+        ("floating", "customer_type", "유동 고객", ("RC_M1_SHC_FLP_UE_CLN_RAT",)),
+    ]
+    return tuple(metrics)
+
+
+# 고객 구성 지표 (응답 순서)
+CUSTOMER_METRICS = _metric_definitions()
+
+# 집계에 필요한 ds3 컬럼
+CUSTOMER_COLUMNS = tuple(dict.fromkeys(column for *_, columns in CUSTOMER_METRICS for column in columns))
+
+# 가맹점 차원 컬럼 -> 셀 키 차원
+_DIMENSIONS = {'HPSN_MCT_ZCD_NM': 'industry', 'MCT_SIGUNGU_NM': 'sigungu', 'HPSN_MCT_BZN_CD_NM': 'district'}
+
+
+class _Level:
+    """업종 수준 x 지역 조합 하나의 그룹별 통계와 정렬 배열 (그룹 g의 행은 offsets[g] ~ offsets[g + 1])"""
+    __slots__ = ('offsets', 'sorted_values', 'mean', 'median', 'count', 'merchant_count')
+
+    def __init__(self, codes: np.ndarray, values: np.ndarray, n_groups: int):
+        counts = np.bincount(codes, minlength=n_groups)
+        self.offsets = np.zeros(n_groups + 1, dtype=np.int64)
+        np.cumsum(counts, out=self.offsets[1:])
+        self.merchant_count = counts.astype(np.int32)
+
+        stats = pd.DataFrame(values).groupby(codes).agg(['mean', 'median', 'count'])
+        self.mean = stats.xs('mean', axis=1, level=1).round(2).to_numpy(np.float64)
+        self.median = stats.xs('median', axis=1, level=1).round(2).to_numpy(np.float64)
+        self.count = stats.xs('count', axis=1, level=1).to_numpy(np.int32)
+
+        # 지표마다 (그룹 오름차순, 값 오름차순) 정렬 - 결측은 그룹 구간의 뒤쪽 (count 개까지만 유효)
+        self.sorted_values = np.empty((values.shape[1], len(codes)), dtype=np.float32)
+        for m in range(values.shape[1]):
+            self.sorted_values[m] = values[np.lexsort((values[:, m], codes)), m]
+
+    def peers(self, group: int, metric: int) -> np.ndarray:
+        start = self.offsets[group]
+        return self.sorted_values[metric, start:start + self.count[group, metric]]
+
+
+class CustomerBenchmarks:
+    """고객 구성 벤치마크 (만든 뒤에는 수정하지 않음)"""
+
+    def __init__(self, version: tuple, levels: List[_Level], cells: Dict[CellKey, Tuple[int, int]],
+                 merchant_rows: Dict[int, int], values: np.ndarray, months: np.ndarray,
+                 dimensions: np.ndarray):
+        self.version = version
+        self._levels = levels
+        self._cells = MappingProxyType(cells)  # 셀 키 -> (수준 번호, 그룹 번호)
+        self._merchant_rows = MappingProxyType(merchant_rows)  # 가맹점 id -> 가맹점 행
+        self._values = values  # 가맹점 행 x 지표 (float64)
+        self._months = months  # 가맹점 행의 기준년월 (yyyymm)
+        self._dimensions = dimensions  # 가맹점 행 x (업종, 카테고리, 시군구, 상권)
+
+    @classmethod
+    def build(cls, customers: pd.DataFrame, ids: np.ndarray, months: np.ndarray, merchants: pd.DataFrame,
+              industry_categories: Dict[str, str], version: tuple) -> "CustomerBenchmarks":
+        """
+        고객/가맹점 데이터에서 한 번에 생성 (고객 데이터는 가맹점별 최신 월 행만 복사)
+
+        Args:
+            customers: ds3 데이터셋 (CUSTOMER_COLUMNS 포함, 가맹점 x 월)
+            ids, months: customers 행과 같은 순서의 가맹점 id와 기준년월 (yyyymm)
+            merchants: MCT_ID, HPSN_MCT_ZCD_NM, MCT_SIGUNGU_NM, HPSN_MCT_BZN_CD_NM
+            industry_categories: 업종명 -> 카테고리 코드
+            version: (고객, 가맹점) 데이터셋 버전
+        """
+        # 가맹점별 최신 월 행 (id 오름차순, 같은 가맹점은 기준년월 오름차순으로 정렬한 뒤 마지막 행)
+        order = np.lexsort((months, ids))
+        order = order[ids[order] >= 0]
+        last = np.append(ids[order][1:] != ids[order][:-1], True) if len(order) else np.zeros(0, dtype=bool)
+        rows = order[last]
+
+        # 가맹점 차원 (같은 id가 여러 행이면 먼저 나온 행)
+        merchant_ids, first = np.unique(merchants['MCT_ID'].to_numpy(), return_index=True)
+        positions = np.minimum(np.searchsorted(merchant_ids, ids[rows]), max(len(merchant_ids) - 1, 0))
+        known = (merchant_ids[positions] == ids[rows]) if len(merchant_ids) else np.zeros(len(rows), dtype=bool)
+        rows, dimension_rows = rows[known], first[positions[known]]
+
+        raw = {column: customers[column].to_numpy(np.float64)[rows] for column in CUSTOMER_COLUMNS}
+        # 합계 지표의 부동소수점 오차 제거 (ds3 비율은 소수 첫째 자리 값)
+        values = np.column_stack([
+            np.sum([raw[column] for column in columns], axis=0).round(2)
+            for *_, columns in CUSTOMER_METRICS
+        ]) if len(rows) else np.empty((0, len(CUSTOMER_METRICS)))
+
+        profile = merchants.iloc[dimension_rows][list(_DIMENSIONS)].rename(columns=_DIMENSIONS)
+        profile = profile.reset_index(drop=True)
+        profile['category'] = profile['industry'].map(industry_categories)
+
+        levels, cells = [], {}
+        for industry_level in INDUSTRY_LEVELS:
+            for region_level in REGION_LEVELS:
+                keys = [level for level in (industry_level, *region_level) if level]
+                if keys:
+                    codes = profile.groupby(keys, sort=False).ngroup().to_numpy()
+                else:
+                    codes = np.zeros(len(profile), dtype=np.int64)
+                grouped = codes >= 0  # 차원 값이 결측인 가맹점은 해당 조합에서 제외
+                codes = codes[grouped].astype(np.int64)
+                if len(codes) == 0:
+                    continue
+                n_groups = int(codes.max()) + 1
+                _, group_first = np.unique(codes, return_index=True)
+                labels = profile.loc[grouped, keys].to_numpy(dtype=object)[group_first] if keys else [()] * n_groups
+
+                for group, label in enumerate(labels):
+                    label = dict(zip(keys, label))
+                    key = (
+                        label.get(industry_level) if industry_level else None,
+                        label.get('sigungu'),
+                        label.get('district'),
+                    )
+                    cells[key] = (len(levels), group)
+                levels.append(_Level(codes, values[grouped], n_groups))
+
+        merchant_rows = {mct_id: row for row, mct_id in enumerate(ids[rows].tolist())}
+        dimensions = profile[['industry', 'category', 'sigungu', 'district']].to_numpy(dtype=object)
+        return cls(version, levels, cells, merchant_rows, values, months[rows].astype(np.int32), dimensions)
+
+    # ========== 조회 ==========
+    def __len__(self) -> int:
+        return len(self._cells)
+
+    def get(self, industry: Optional[str] = None, sigungu: Optional[str] = None,
+            district: Optional[str] = None) -> Optional[Dict]:
+        """
+        셀 하나의 지표별 평균/중앙값/표본 수
+
+        Returns:
+            {"merchant_count", "metrics": [{"metric", "group", "label", "average", "median", "count"}]}
+            또는 해당 조합 데이터가 없으면 None
+        """
+        located = self._cells.get((industry, sigungu, district))
+        if located is None:
+            return None
+        level, group = self._levels[located[0]], located[1]
+        return {
+            "merchant_count": int(level.merchant_count[group]),
+            "metrics": [self._peer_stats(level, group, m) for m in range(len(CUSTOMER_METRICS))],
+        }
+
+    def merchant(self, merchant_id: int) -> Optional[Dict]:
+        """가맹점의 최신 월 고객 구성과 차원 (고객 데이터가 없으면 None)"""
+        row = self._merchant_rows.get(merchant_id)
+        if row is None:
+            return None
+        industry, category, sigungu, district = self._dimensions[row]
+        return {
+            "month": int(self._months[row]),
+            "industry": industry,
+            "category": None if pd.isna(category) else category,
+            "sigungu": None if pd.isna(sigungu) else sigungu,
+            "district": None if pd.isna(district) else district,
+        }
+
+    def compare(self, merchant_id: int, industry: Optional[str] = None, sigungu: Optional[str] = None,
+                district: Optional[str] = None) -> Optional[Dict]:
+        """
+        가맹점 고객 구성을 셀(동종 가맹점) 분포와 비교
+
+        Returns:
+            {"month", "peer_count", "metrics": [... + "value", "difference", "percentile"]}
+            또는 가맹점 고객 데이터나 셀이 없으면 None
+        """
+        row = self._merchant_rows.get(merchant_id)
+        located = self._cells.get((industry, sigungu, district))
+        if row is None or located is None:
+            return None
+        level, group = self._levels[located[0]], located[1]
+
+        metrics = []
+        for m, value in enumerate(self._values[row].tolist()):
+            stats = self._peer_stats(level, group, m)
+            has_value = not np.isnan(value)
+            stats["value"] = value if has_value else None
+            stats["difference"] = (
+                round(value - stats["average"], 2) if has_value and stats["average"] is not None else None
+            )
+            stats["percentile"] = percentile_rank(level.peers(group, m), np.float32(value)) if has_value else None
+            metrics.append(stats)
+        return {
+            "month": int(self._months[row]),
+            "peer_count": int(level.merchant_count[group]),
+            "metrics": metrics,
+        }
+
+    @staticmethod
+    def _peer_stats(level: _Level, group: int, m: int) -> Dict:
+        name, metric_group, label, _ = CUSTOMER_METRICS[m]
+        count = int(level.count[group, m])
+        return {
+            "metric": name,
+            "group": metric_group,
+            "label": label,
+            "average": float(level.mean[group, m]) if count else None,
+            "median": float(level.median[group, m]) if count else None,
+            "count": count,
+        }
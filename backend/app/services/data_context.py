@@ -0,0 +1,329 @@
+"""
+데이터 컨텍스트 (저장소 + 벤치마크 계산 결과)와 무중단 핫 리로드
+
+요청 처리 코드는 항상 data_reloader.current 하나만 읽는다.
+리로드는 새 컨텍스트를 백그라운드 스레드에서 완전히 만든 뒤 참조 하나만 교체하므로,
+처리 중인 요청은 기존 컨텍스트로 끝나고 이후 요청부터 새 데이터를 본다.
+
+- 리로드 중 실패하면 기존 컨텍스트를 그대로 유지
+- 월 단위 추가(ingest)도 기존 저장소의 복사본에 반영한 뒤 교체 (copy-on-write)
+- 리로드/추가는 한 번에 하나씩만 실행 (조회 요청은 잠금 없이 진행)
+- data_watch_interval > 0이면 원본 CSV 변경(크기/수정 시각)을 감지해 자동 리로드
+- 서버 시작 시에는 start_background_load()로 최초 로드를 백그라운드에서 진행하고,
+  완료 전 요청은 DataNotReadyError(503)로 응답 (import만으로는 데이터를 읽지 않음)
+- 공유 모드(shared_data_dir)에서는 데이터셋을 공유 세대에 연결하고, 다른 워커가 새 세대를
+  게시하면(버전 헤더 변경) 감지 스레드가 리로드해 따라간다 (shared_datasets 참고)
+"""
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, Optional
+
+import pandas as pd
+
+from app.services.benchmark_calculator import BenchmarkCalculator
+from app.config import settings
+from app.services.data_snapshot import DATASETS, load_frame, source_signatures
+from app.services.data_store import MerchantDataStore, data_store
+from app.services.ingestion import ingest_month
+from app.services.shared_datasets import SharedDatasets, shared_datasets
+
+
+class DataNotReadyError(RuntimeError):
+    """최초 데이터 로드가 아직 끝나지 않음 (main에서 503으로 변환)"""
+
+
+class DataContext:
+    """한 시점의 데이터 (만든 뒤에는 수정하지 않고 통째로 교체)"""
+    __slots__ = ('store', 'benchmark_calc', 'signatures', 'shared_version', 'loaded_at')
+
+    def __init__(self, store: MerchantDataStore, benchmark_calc: Optional[BenchmarkCalculator],
+                 signatures: Dict[str, Dict], shared_version: Optional[int] = None):
+        self.store = store
+        self.benchmark_calc = benchmark_calc  # 데이터 로드 실패 시 None
+        self.signatures = signatures  # 로드 시점의 원본 CSV 서명
+        self.shared_version = shared_version  # 연결한 공유 세대 버전 (공유 모드가 아니면 None)
+        self.loaded_at = datetime.now()
+
+    @property
+    def version(self) -> int:
+        return self.store.version
+
+
+def build_context(store: MerchantDataStore,
+                  progress: Optional[Callable[[str], None]] = None,
+                  shared: Optional[SharedDatasets] = None, republish: bool = False) -> DataContext:
+    """
+    저장소의 데이터셋/인덱스를 모두 로드하고 업종 벤치마크까지 계산
+
+    Args:
+        progress: 단계가 바뀔 때마다 호출 (datasets, benchmarks, indexes)
+        shared: 공유 모드면 데이터셋을 직접 읽지 않고 공유 세대에 연결 (없거나 오래되었으면 게시)
+        republish: 공유 세대가 최신이어도 원본에서 다시 읽어 게시
+    """
+    progress = progress or (lambda phase: None)
+    signatures = source_signatures(store.data_dir)
+    shared_version = None
+    calc = BenchmarkCalculator(store)
+    progress("datasets")
+    if shared is not None:
+        header, frames = shared.load_or_publish(
+            store.data_dir,
+            lambda name: load_frame(name, store.data_dir, store.snapshot_dir),
+            force=republish,
+        )
+        store.adopt(frames)
+        signatures, shared_version = header["signatures"], header["version"]
+    if calc.load_data():
+        progress("benchmarks")
+        calc.calculate_industry_benchmarks(recent_months=6)
+        progress("indexes")
+        store.preload()
+    else:
+        calc = None
+    return DataContext(store, calc, signatures, shared_version)
+
+
+class DataReloader:
+    def __init__(self, store: MerchantDataStore, shared: Optional[SharedDatasets] = None):
+        self._initial_store = store
+        self._shared = shared
+        self._context: Optional[DataContext] = None
+        self._init_lock = threading.Lock()
+        self._thread_lock = threading.Lock()
+        self._write_lock = threading.Lock()  # 리로드/추가 직렬화
+        self._reload_thread: Optional[threading.Thread] = None
+        self._watcher: Optional[threading.Thread] = None
+        self._watcher_stop = threading.Event()
+
+        self.state = "idle"  # idle, loading(최초 로드), reloading, failed
+        self.phase: Optional[str] = None  # 로드 중인 단계 (datasets, benchmarks, indexes)
+        self.reload_count = 0
+        self.last_error: Optional[str] = None
+        self.last_duration: Optional[float] = None
+        self._failed_signatures: Optional[Dict] = None  # 같은 파일로 실패한 리로드를 반복하지 않도록
+        self._failed_shared_version: Optional[int] = None  # 같은 공유 세대로 실패한 리로드를 반복하지 않도록
+
+    # ========== 현재 컨텍스트 ==========
+    def initialize(self) -> DataContext:
+        """최초 컨텍스트 생성 (이미 있으면 그대로 반환)"""
+        if self._context is None:
+            with self._init_lock:
+                if self._context is None:
+                    self._context = build_context(self._initial_store, self._set_phase, self._shared)
+                    self.phase = None
+        return self._context
+
+    @property
+    def current(self) -> DataContext:
+        """
+        현재 컨텍스트
+        백그라운드 최초 로드 중이거나 실패했으면 기다리지 않고 DataNotReadyError,
+        백그라운드 로드를 시작하지 않은 경우(CLI/테스트)에는 여기서 바로 로드한다.
+        """
+        context = self._context
+        if context is not None:
+            return context
+        if self.state == "loading":
+            raise DataNotReadyError(f"데이터를 불러오는 중입니다 ({self.phase or 'starting'})")
+        if self.state == "failed":
+            raise DataNotReadyError(f"데이터 로드에 실패했습니다: {self.last_error}")
+        return self.initialize()
+
+    @property
+    def ready(self) -> bool:
+        context = self._context
+        return context is not None and context.benchmark_calc is not None
+
+    def _set_phase(self, phase: str) -> None:
+        self.phase = phase
+        print(f"[INFO] 데이터 로드 중: {phase}")
+
+    def start_background_load(self) -> bool:
+        """
+        최초 데이터 로드를 백그라운드 스레드에서 시작 (앱 lifespan에서 호출)
+
+        Returns:
+            새로 시작했으면 True, 이미 로드됐거나 진행 중이면 False
+        """
+        with self._thread_lock:
+            if self._context is not None or self.state == "loading":
+                return False
+            self.state = "loading"
+            self._reload_thread = threading.Thread(target=self._run_initial_load, name="data-load", daemon=True)
+            self._reload_thread.start()
+        return True
+
+    def _run_initial_load(self) -> None:
+        started = time.time()
+        try:
+            context = self.initialize()
+            if context.benchmark_calc is None:
+                raise RuntimeError("데이터셋을 로드하지 못했습니다.")
+            self.state = "idle"
+            print(f"[OK] 데이터 로드 완료 (버전 {context.version}, {time.time() - started:.1f}초)")
+        except Exception as e:
+            self.state = "failed"
+            self.last_error = str(e)
+            print(f"[ERROR] 데이터 로드 실패: {e}")
+        finally:
+            self.phase = None
+            self.last_duration = round(time.time() - started, 2)
+
+    def _swap(self, context: DataContext) -> None:
+        # 참조 하나만 교체 (이전 컨텍스트를 잡고 있는 요청은 그대로 끝까지 사용)
+        self._context = context
+
+    # ========== 전체 리로드 ==========
+    def reload(self, republish: bool = True) -> bool:
+        """
+        백그라운드 리로드 시작
+
+        Args:
+            republish: 공유 모드에서 원본을 다시 읽어 새 세대를 게시 (False면 최신 세대에 연결만)
+
+        Returns:
+            새로 시작했으면 True, 이미 리로드 중이면 False
+        """
+        with self._thread_lock:
+            if self._reload_thread is not None and self._reload_thread.is_alive():
+                return False
+            self.state = "reloading"
+            self._reload_thread = threading.Thread(
+                target=self._run_reload, args=(republish,), name="data-reload", daemon=True)
+            self._reload_thread.start()
+        return True
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        """진행 중인 리로드가 끝날 때까지 대기 (CLI/테스트용)"""
+        thread = self._reload_thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def _run_reload(self, republish: bool = True) -> None:
+        started = time.time()
+        signatures = shared_header = None
+        try:
+            with self._write_lock:
+                base = self._initial_store
+                signatures = source_signatures(base.data_dir)
+                shared_header = self._shared.read_header() if self._shared is not None else None
+                context = build_context(
+                    MerchantDataStore(base.data_dir, base.snapshot_dir), self._set_phase,
+                    self._shared, republish,
+                )
+                if context.benchmark_calc is None:
+                    raise RuntimeError("데이터셋을 로드하지 못했습니다.")
+                self._swap(context)
+            self.state = "idle"
+            self.last_error = None
+            self.reload_count += 1
+            print(f"[OK] 데이터 리로드 완료 (버전 {context.version}, {time.time() - started:.1f}초)")
+        except Exception as e:
+            self.state = "failed"
+            self.last_error = str(e)
+            self._failed_signatures = signatures
+            self._failed_shared_version = shared_header["version"] if shared_header else None
+            print(f"[ERROR] 데이터 리로드 실패 - 기존 데이터 유지: {e}")
+        finally:
+            self.phase = None
+            self.last_duration = round(time.time() - started, 2)
+
+    # ========== 월 단위 추가 ==========
+    def ingest(self, ta_ym, usage: pd.DataFrame, customers: Optional[pd.DataFrame] = None,
+               risk: Optional[pd.DataFrame] = None, persist: bool = False) -> Dict:
+        """현재 컨텍스트의 복사본에 한 달치 데이터를 추가한 뒤 교체"""
+        with self._write_lock:
+            context = self.current
+            store = context.store.copy()
+            calc = context.benchmark_calc.clone(store) if context.benchmark_calc else None
+            summary = ingest_month(
+                ta_ym, usage, customers, risk,
+                store=store, calculators=[calc], persist=persist,
+            )
+            # 저장한 경우 변경 감지가 다시 리로드하지 않도록 현재 파일 서명으로 갱신
+            signatures = source_signatures(store.data_dir) if persist else context.signatures
+            shared_version = self._publish_shared(store, signatures, context.shared_version)
+            self._swap(DataContext(store, calc, signatures, shared_version))
+        return summary
+
+    def _publish_shared(self, store: MerchantDataStore, signatures: Dict,
+                        shared_version: Optional[int]) -> Optional[int]:
+        """공유 모드면 추가 결과를 새 세대로 게시 (다른 워커는 버전 헤더 변경을 감지해 따라옴)"""
+        if self._shared is None:
+            return shared_version
+        try:
+            header = self._shared.publish_locked({name: store.frame(name) for name in DATASETS}, signatures)
+            return header["version"]
+        except OSError as e:
+            print(f"[WARN] 공유 데이터 게시 실패 - 이 워커에만 반영됨: {e}")
+            return shared_version
+
+    # ========== 원본 변경 감지 ==========
+    def start_watcher(self, interval: float) -> None:
+        """
+        원본 CSV 변경 감지 시작 (interval <= 0이면 원본은 감지하지 않음)
+        공유 모드에서는 shared_poll_interval마다 새 세대(버전 헤더)도 확인
+        """
+        shared_interval = settings.shared_poll_interval if self._shared is not None else 0
+        intervals = [i for i in (interval, shared_interval) if i > 0]
+        if not intervals or (self._watcher is not None and self._watcher.is_alive()):
+            return
+        self._watcher_stop.clear()
+        self._watcher = threading.Thread(
+            target=self._watch, args=(min(intervals), interval > 0), name="data-watcher", daemon=True)
+        self._watcher.start()
+        print(f"[INFO] 데이터 변경 감지 시작 ({min(intervals)}초 주기)")
+
+    def stop_watcher(self) -> None:
+        self._watcher_stop.set()
+
+    def _watch(self, interval: float, watch_sources: bool = True) -> None:
+        while not self._watcher_stop.wait(interval):
+            context = self._context
+            if context is None or self.state == "reloading":
+                continue
+            if self._shared is not None:
+                header = self._shared.read_header()
+                version = header["version"] if header else None
+                if version not in (None, context.shared_version, self._failed_shared_version):
+                    print(f"[INFO] 새 공유 데이터 세대 감지 (버전 {version}) - 백그라운드 리로드 시작")
+                    self.reload(republish=False)
+                    continue
+            if not watch_sources:
+                continue
+            try:
+                signatures = source_signatures(context.store.data_dir)
+            except OSError:
+                continue
+            if signatures != context.signatures and signatures != self._failed_signatures:
+                print("[INFO] 원본 데이터 변경 감지 - 백그라운드 리로드 시작")
+                # 공유 모드에서는 먼저 잠금을 잡은 워커만 다시 게시하고 나머지는 그 세대에 연결
+                self.reload(republish=False)
+
+    def status(self) -> dict:
+        context = self._context
+        return {
+            "state": self.state,
+            "phase": self.phase,
+            "ready": self.ready,
+            "version": context.version if context else None,
+            "loaded_at": context.loaded_at.isoformat() if context else None,
+            "reload_count": self.reload_count,
+            "last_duration_s": self.last_duration,
+            "last_error": self.last_error,
+            "watching": self._watcher is not None and self._watcher.is_alive(),
+            "shared": {
+                **self._shared.status(),
+                "attached_version": context.shared_version if context else None,
+            } if self._shared is not None else None,
+        }
+
+
+# 싱글톤 인스턴스
+data_reloader = DataReloader(data_store, shared_datasets)
+
+
+def get_data_context() -> DataContext:
+    """FastAPI Depends용"""
+    return data_reloader.current
@@ -0,0 +1,281 @@
+"""
+CSV 원본 데이터셋을 컬럼 단위 바이너리 스냅샷으로 변환/로드
+
+- 컬럼마다 .npy 파일 하나 (숫자형은 그대로, 문자열은 사전 인코딩된 int32 코드)
+- 결측 표시값(-999999.9)은 변환 시 NaN으로 통일
+- 로드 시 np.load(mmap_mode='r')로 열어 워커 간 페이지 캐시 공유 (문자열 컬럼은 코드 위의 category 타입)
+- 스냅샷이 없거나 원본 CSV보다 오래되었으면 CSV를 직접 읽음
+
+사용법 (backend 디렉토리에서):
+    python -m app.services.data_snapshot            # 4개 데이터셋 모두 변환
+    python -m app.services.data_snapshot risk usage # 일부만 변환
+"""
+import json
+import os
+import shutil
+import sys
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from app.config import settings
+
+# 데이터 결측 표시값 (SV)
+SENTINEL = -999999.9
+
+# 스냅샷 포맷 버전 - 저장 구조가 바뀌면 올려서 기존 스냅샷을 무효화
+SNAPSHOT_FORMAT = 1
+
+# 데이터셋 이름 -> (CSV 파일명, 인코딩)
+DATASETS: Dict[str, tuple] = {
+    "merchants": ("big_data_set1_f.csv", "cp949"),
+    "usage": ("ds2_monthly_usage.csv", "cp949"),
+    "customers": ("ds3_monthly_customers.csv", "cp949"),
+    "risk": ("risk_output.csv", "utf-8"),
+}
+
+
+def get_data_dir() -> str:
+    return settings.data_dir
+
+
+def get_snapshot_dir() -> str:
+    return settings.snapshot_dir or os.path.join(get_data_dir(), ".snapshot")
+
+
+def source_path(name: str, data_dir: Optional[str] = None) -> str:
+    filename, _ = DATASETS[name]
+    return os.path.join(data_dir or get_data_dir(), filename)
+
+
+def _source_signature(path: str) -> Dict:
+    """원본 CSV의 변경 여부 판단용 (크기 + 수정 시각)"""
+    stat = os.stat(path)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def source_signatures(data_dir: Optional[str] = None) -> Dict[str, Dict]:
+    """존재하는 원본 CSV 전체의 변경 여부 판단용 서명 (데이터셋 이름 -> 크기/수정 시각)"""
+    signatures = {}
+    for name in DATASETS:
+        path = source_path(name, data_dir)
+        if os.path.exists(path):
+            signatures[name] = _source_signature(path)
+    return signatures
+
+
+def _normalize(df: pd.DataFrame) -> pd.DataFrame:
+    """결측 표시값(-999999.9)을 NaN으로 변환 (숫자/문자열 컬럼 모두)"""
+    for col in df.columns:
+        series = df[col]
+        if pd.api.types.is_float_dtype(series):
+            mask = series == SENTINEL
+        elif series.dtype == object:
+            mask = series == str(SENTINEL)
+        else:
+            continue
+        if mask.any():
+            df[col] = series.mask(mask)
+    return df
+
+
+def share_strings(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    문자열 컬럼에서 같은 값은 문자열 객체 하나를 공유하도록 교체 (dtype은 object 유지)
+    CSV 파서는 행마다 문자열 객체를 만들므로, 값 종류가 적은 컬럼(업종, 구간 라벨 등)에서 효과가 크다.
+    """
+    for col in df.columns:
+        if df[col].dtype == object:
+            codes, uniques = pd.factorize(df[col], use_na_sentinel=True)
+            values = np.array(list(uniques) + [np.nan], dtype=object)
+            df[col] = values[codes]
+    return df
+
+
+def decode_categories(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    category 컬럼(read_columns로 읽은 문자열 컬럼)을 object로 되돌린 DataFrame
+    집계용 사본에만 사용 - groupby/merge/map 결과를 CSV로 읽은 프레임과 같게 맞춘다.
+    """
+    decoded = {
+        col: df[col].astype(object) for col in df.columns
+        if isinstance(df[col].dtype, pd.CategoricalDtype)
+    }
+    return df.assign(**decoded) if decoded else df
+
+
+def read_csv(name: str, source) -> pd.DataFrame:
+    """
+    데이터셋 형식의 CSV(경로 또는 파일 객체)를 읽고 결측 표시값 정규화
+    데이터셋 기본 인코딩으로 읽히지 않으면 UTF-8로 다시 시도
+    메모리 절감 모드(compact_frames)에서는 문자열 객체도 공유
+    """
+    _, encoding = DATASETS[name]
+    for candidate in dict.fromkeys((encoding, "utf-8-sig")):
+        if hasattr(source, "seek"):
+            source.seek(0)
+        try:
+            df = _normalize(pd.read_csv(source, encoding=candidate))
+        except UnicodeDecodeError:
+            continue
+        return share_strings(df) if settings.compact_frames else df
+    raise ValueError(f"'{name}' CSV 인코딩을 읽을 수 없습니다. ({encoding} 또는 UTF-8)")
+
+
+def read_source_csv(name: str, data_dir: Optional[str] = None) -> pd.DataFrame:
+    """원본 CSV를 pandas로 읽고 결측 표시값 정규화"""
+    return read_csv(name, source_path(name, data_dir))
+
+
+def write_source_csv(name: str, df: pd.DataFrame, data_dir: Optional[str] = None) -> str:
+    """DataFrame을 원본 CSV로 저장 (임시 파일에 쓴 뒤 교체하므로 읽는 중인 파일이 깨지지 않음)"""
+    _, encoding = DATASETS[name]
+    path = source_path(name, data_dir)
+    tmp_path = f"{path}.tmp-{os.getpid()}"
+    df.to_csv(tmp_path, index=False, encoding=encoding)
+    os.replace(tmp_path, path)
+    return path
+
+
+def write_columns(df: pd.DataFrame, target: str, meta: Dict) -> str:
+    """
+    DataFrame을 컬럼 단위 .npy 디렉토리로 저장 (meta에 rows/columns를 채워 meta.json으로 기록)
+
+    임시 디렉토리에 모두 쓴 뒤 교체하므로 중간 상태의 디렉토리가 읽히지 않는다.
+    """
+    tmp_target = f"{target}.tmp-{os.getpid()}"
+    shutil.rmtree(tmp_target, ignore_errors=True)
+    os.makedirs(tmp_target)
+
+    columns = []
+    for i, col in enumerate(df.columns):
+        series = df[col]
+        filename = f"{i:03d}.npy"
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            # read_columns로 읽은 category 컬럼은 코드를 그대로 저장
+            np.save(os.path.join(tmp_target, filename), series.cat.codes.to_numpy(np.int32))
+            columns.append({
+                "name": col,
+                "file": filename,
+                "kind": "dict",
+                "categories": [str(v) for v in series.cat.categories],
+            })
+        elif series.dtype == object:
+            # 문자열 컬럼: 사전 인코딩 (결측은 -1)
+            codes, uniques = pd.factorize(series, use_na_sentinel=True)
+            np.save(os.path.join(tmp_target, filename), codes.astype(np.int32))
+            columns.append({
+                "name": col,
+                "file": filename,
+                "kind": "dict",
+                "categories": [str(v) for v in uniques],
+            })
+        else:
+            np.save(os.path.join(tmp_target, filename), series.to_numpy())
+            columns.append({"name": col, "file": filename, "kind": "numeric"})
+
+    meta = {**meta, "rows": len(df), "columns": columns}
+    with open(os.path.join(tmp_target, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False)
+
+    shutil.rmtree(target, ignore_errors=True)
+    os.replace(tmp_target, target)
+    return target
+
+
+def read_columns(base: str, meta: Dict) -> pd.DataFrame:
+    """
+    write_columns로 저장한 디렉토리를 mmap으로 열어 DataFrame 구성
+
+    숫자 컬럼은 memmap 배열(읽기 전용)을 복사 없이 그대로 사용하고,
+    문자열 컬럼은 memmap 코드 배열 위의 category 컬럼으로 만들어 복사 없이 공유한다
+    (행마다 문자열 객체 배열을 만들지 않으므로 워커마다 늘어나는 것은 카테고리 값뿐).
+    """
+    data = {}
+    for col in meta["columns"]:
+        values = np.load(os.path.join(base, col["file"]), mmap_mode="r")
+        if col["kind"] == "dict":
+            # 결측 코드(-1)는 category의 NaN
+            dtype = pd.CategoricalDtype(pd.Index(col["categories"], dtype=object))
+            data[col["name"]] = pd.Categorical.from_codes(values, dtype=dtype, validate=False)
+        else:
+            data[col["name"]] = values
+    return pd.DataFrame(data, copy=False)
+
+
+def build_snapshot(name: str, data_dir: Optional[str] = None,
+                   snapshot_dir: Optional[str] = None) -> str:
+    """
+    CSV 하나를 컬럼 스냅샷 디렉토리로 변환
+
+    Returns:
+        생성된 스냅샷 디렉토리 경로
+    """
+    src = source_path(name, data_dir)
+    signature = _source_signature(src)
+    df = read_source_csv(name, data_dir)
+    target = os.path.join(snapshot_dir or get_snapshot_dir(), name)
+    return write_columns(df, target, {
+        "format": SNAPSHOT_FORMAT,
+        "dataset": name,
+        "source": signature,
+    })
+
+
+def _read_meta(name: str, snapshot_dir: Optional[str] = None) -> Optional[Dict]:
+    meta_path = os.path.join(snapshot_dir or get_snapshot_dir(), name, "meta.json")
+    if not os.path.exists(meta_path):
+        return None
+    try:
+        with open(meta_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def is_snapshot_fresh(name: str, data_dir: Optional[str] = None,
+                      snapshot_dir: Optional[str] = None) -> bool:
+    """스냅샷이 존재하고 원본 CSV와 일치하는지 확인"""
+    meta = _read_meta(name, snapshot_dir)
+    if meta is None or meta.get("format") != SNAPSHOT_FORMAT:
+        return False
+    src = source_path(name, data_dir)
+    if not os.path.exists(src):
+        # 원본 없이 스냅샷만 배포된 경우도 허용
+        return True
+    return meta.get("source") == _source_signature(src)
+
+
+def load_snapshot(name: str, data_dir: Optional[str] = None,
+                  snapshot_dir: Optional[str] = None) -> Optional[pd.DataFrame]:
+    """스냅샷을 mmap으로 열어 DataFrame 구성 (없거나 오래되었으면 None)"""
+    if not is_snapshot_fresh(name, data_dir, snapshot_dir):
+        return None
+
+    meta = _read_meta(name, snapshot_dir)
+    return read_columns(os.path.join(snapshot_dir or get_snapshot_dir(), name), meta)
+
+
+def load_frame(name: str, data_dir: Optional[str] = None,
+               snapshot_dir: Optional[str] = None) -> pd.DataFrame:
+    """스냅샷 우선 로드, 없거나 오래되었으면 CSV로 대체"""
+    df = load_snapshot(name, data_dir, snapshot_dir)
+    if df is not None:
+        return df
+    if os.path.isdir(os.path.join(snapshot_dir or get_snapshot_dir(), name)):
+        print(f"[WARN] '{name}' 스냅샷이 원본과 다릅니다. CSV에서 로드합니다.")
+    return read_source_csv(name, data_dir)
+
+
+def build_all(names: Optional[list] = None) -> None:
+    for name in names or list(DATASETS):
+        if not os.path.exists(source_path(name)):
+            print(f"[WARN] 원본 파일 없음: {source_path(name)}")
+            continue
+        target = build_snapshot(name)
+        print(f"[OK] {name} 스냅샷 생성: {target}")
+
+
+if __name__ == "__main__":
+    build_all(sys.argv[1:] or None)
@@ -0,0 +1,322 @@
+"""
+프로세스 전역 가맹점 데이터 저장소
+
+DiagnosisService와 BenchmarkCalculator가 같은 DataFrame을 공유하도록
+각 데이터셋을 한 번만 로드하고, 가맹점/월/업종 단위 조회 인덱스를 제공한다.
+가맹점 단위 인덱스는 ENCODED_MCT 문자열 대신 정수 id(merchant_ids)를 키로 사용한다.
+"""
+import itertools
+import threading
+from typing import Dict, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from app.config import settings
+from app.services.data_snapshot import DATASETS, load_frame
+from app.services.merchant_ids import merchant_ids
+from app.services.risk_series import RiskTimeSeries, to_yyyymm
+from app.services.search_index import BusinessSearchIndex
+
+
+# 월 단위로 쌓이는 데이터셋 (append_month 대상)
+MONTHLY_DATASETS = ("usage", "customers", "risk")
+# 메모리 절감 모드에서 저장소에 preload하지 않는 데이터셋 (고객 구성 벤치마크가 첫 요청 시 peek로 한 번 읽어 집계만 보관)
+LAZY_DATASETS = ("customers",)
+
+# 데이터 버전 - 저장소 인스턴스가 교체되어도 겹치지 않도록 프로세스 전역으로 증가
+_version_counter = itertools.count(1)
+
+
+def _optional_str(value) -> Optional[str]:
+    return None if pd.isna(value) else str(value)
+
+
+def month_values(name: str, df: pd.DataFrame) -> np.ndarray:
+    """데이터셋의 기준년월 컬럼을 정수 yyyymm 배열로 (risk는 "YYYY-MM-01" 표기)"""
+    if name == "risk":
+        # 서로 다른 월은 수십 개뿐이므로 고유값만 파싱
+        codes, uniques = pd.factorize(df['TA_YM'])
+        if (codes < 0).any():
+            # 결측 코드(-1)가 마지막 월로 인덱싱되지 않도록 거부
+            raise ValueError(f"'{name}'의 TA_YM에 빈 값이 {int((codes < 0).sum())}개 있습니다.")
+        months = pd.to_datetime(uniques).strftime('%Y%m').astype(int).to_numpy()
+        return months[codes]
+    return df['TA_YM'].astype(int).to_numpy()
+
+
+class MerchantInfo:
+    """가맹점 메타데이터 (가맹점 수만큼 생성되므로 __slots__로 dict 오버헤드 제거)"""
+    __slots__ = ('encoded_mct', 'name', 'area', 'industry', 'sigungu', 'district')
+
+    def __init__(self, encoded_mct: str, name: str, area: str, industry: str,
+                 sigungu: Optional[str], district: Optional[str]):
+        self.encoded_mct = encoded_mct
+        self.name = name
+        self.area = area  # 가맹점주소 (MCT_BSE_AR)
+        self.industry = industry  # 업종 (HPSN_MCT_ZCD_NM)
+        self.sigungu = sigungu  # 가맹점지역 (MCT_SIGUNGU_NM)
+        self.district = district  # 상권 (HPSN_MCT_BZN_CD_NM)
+
+    def to_dict(self) -> dict:
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+
+class MerchantDataStore:
+    def __init__(self, data_dir: Optional[str] = None, snapshot_dir: Optional[str] = None):
+        self.data_dir = data_dir
+        self.snapshot_dir = snapshot_dir
+        self.version = 0  # 데이터가 (재)로드/추가될 때마다 증가
+        self.dataset_versions: Dict[str, int] = {name: 0 for name in DATASETS}
+        self._frames: Dict[str, pd.DataFrame] = {}
+        self._indexes: Dict[str, dict] = {}
+        self._lock = threading.RLock()
+
+    # ========== 데이터셋 로드 ==========
+    def frame(self, name: str) -> pd.DataFrame:
+        """데이터셋을 최초 접근 시 한 번만 로드"""
+        df = self._frames.get(name)
+        if df is not None:
+            return df
+        with self._lock:
+            if name not in self._frames:
+                self._frames[name] = load_frame(name, self.data_dir, self.snapshot_dir)
+                self.version = next(_version_counter)
+                self.dataset_versions[name] = next(_version_counter)
+            return self._frames[name]
+
+    def load_all(self) -> None:
+        for name in DATASETS:
+            self.frame(name)
+
+    def preload(self) -> None:
+        """
+        데이터셋과 조회 인덱스를 미리 생성 (첫 요청이 인덱스 생성을 기다리지 않도록)
+        메모리 절감 모드에서는 LAZY_DATASETS를 제외
+        """
+        for name in DATASETS:
+            if not (settings.compact_frames and name in LAZY_DATASETS):
+                self.frame(name)
+        self.get_merchant("")
+        self.get_usage("", 0)
+        _ = self.risk_series
+        _ = self.search_index
+
+    def copy(self) -> "MerchantDataStore":
+        """
+        같은 데이터프레임/인덱스를 가리키는 얕은 복사본
+        append_month는 프레임과 인덱스를 새 객체로 교체하므로, 복사본을 수정해도
+        원본을 조회 중인 요청에는 영향이 없다.
+        """
+        with self._lock:
+            other = MerchantDataStore(self.data_dir, self.snapshot_dir)
+            other.version = self.version
+            other.dataset_versions = dict(self.dataset_versions)
+            other._frames = dict(self._frames)
+            other._indexes = dict(self._indexes)
+        return other
+
+    def adopt(self, frames: Dict[str, pd.DataFrame]) -> None:
+        """외부에서 만든 데이터셋(공유 세대 등)을 로드된 것으로 등록 (기존 인덱스는 버림)"""
+        with self._lock:
+            for name, df in frames.items():
+                self._frames[name] = df
+                self.dataset_versions[name] = next(_version_counter)
+            self._indexes.clear()
+            self.version = next(_version_counter)
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._frames
+
+    def peek(self, name: str) -> pd.DataFrame:
+        """
+        로드된 데이터셋은 그대로, 아니면 저장소에 올리지 않고 한 번 읽어 반환
+        (지연 로드 데이터셋에서 집계 결과만 남길 때 사용)
+        """
+        df = self._frames.get(name)
+        return df if df is not None else load_frame(name, self.data_dir, self.snapshot_dir)
+
+    @property
+    def merchants(self) -> pd.DataFrame:
+        return self.frame("merchants")
+
+    @property
+    def usage(self) -> pd.DataFrame:
+        return self.frame("usage")
+
+    @property
+    def customers(self) -> pd.DataFrame:
+        return self.frame("customers")
+
+    @property
+    def risk(self) -> pd.DataFrame:
+        return self.frame("risk")
+
+    def _index(self, key: str, builder):
+        index = self._indexes.get(key)
+        if index is not None:
+            return index
+        with self._lock:
+            if key not in self._indexes:
+                self._indexes[key] = builder()
+            return self._indexes[key]
+
+    # ========== 가맹점 단위 조회 ==========
+    def merchant_ids(self, name: str) -> np.ndarray:
+        """데이터셋 행과 같은 순서의 가맹점 정수 id 배열 (int32, 조인/인덱스 키)"""
+        return self._index(f"ids:{name}", lambda: merchant_ids.intern(self.frame(name)['ENCODED_MCT']))
+
+    def _build_merchant_registry(self) -> Dict[int, MerchantInfo]:
+        columns = self.merchants[[
+            'ENCODED_MCT', 'MCT_NM', 'MCT_BSE_AR', 'HPSN_MCT_ZCD_NM',
+            'MCT_SIGUNGU_NM', 'HPSN_MCT_BZN_CD_NM',
+        ]]
+        registry = {}
+        rows = columns.itertuples(index=False, name=None)
+        for mct_id, (mct, name, area, industry, sigungu, district) in zip(self.merchant_ids("merchants").tolist(), rows):
+            # 중복 ENCODED_MCT는 파일에서 먼저 나온 행 기준 (검색 결과와 동일)
+            if mct_id not in registry:
+                registry[mct_id] = MerchantInfo(
+                    mct, name, area, industry,
+                    _optional_str(sigungu), _optional_str(district),
+                )
+        return registry
+
+    def get_merchant(self, encoded_mct: str) -> Optional[MerchantInfo]:
+        """가맹점 기본 정보 (big_data_set1) - 가맹점 id로 O(1) 조회"""
+        return self._index("merchant", self._build_merchant_registry).get(merchant_ids.lookup(encoded_mct))
+
+    @property
+    def search_index(self) -> BusinessSearchIndex:
+        """가게 이름 검색 인덱스"""
+        return self._index("search", lambda: BusinessSearchIndex(self.merchants))
+
+    @property
+    def risk_series(self) -> RiskTimeSeries:
+        """가맹점별로 기준년월 내림차순 정렬된 위험도 컬럼 배열"""
+        return self._index("risk_series", lambda: RiskTimeSeries(self.risk, self.merchant_ids("risk")))
+
+    def get_latest_risk(self, encoded_mct: str) -> Optional[dict]:
+        """가맹점의 최신 월 위험도 행"""
+        return self.risk_series.latest(encoded_mct)
+
+    def get_latest_risks(self, encoded_mcts: list[str]) -> Dict[str, dict]:
+        """여러 가맹점의 최신 월 위험도 행 (데이터 없는 가맹점 제외)"""
+        return self.risk_series.latest_many(encoded_mcts)
+
+    def get_risk_history(self, encoded_mct: str) -> list[dict]:
+        """가맹점의 월별 위험도 이력 (기준년월 내림차순)"""
+        return self.risk_series.history(encoded_mct)
+
+    def _usage_positions(self) -> Dict[tuple, int]:
+        return self._index("usage", lambda: self._usage_index(self.usage, self.merchant_ids("usage")))
+
+    def get_usage(self, encoded_mct: str, ta_ym: Union[str, int]) -> Optional[dict]:
+        """가맹점의 특정 월 이용 정보 (ds2) 한 행"""
+        pos = self._usage_positions().get((merchant_ids.lookup(encoded_mct), to_yyyymm(ta_ym)))
+        if pos is None:
+            return None
+        return self.usage.iloc[pos].to_dict()
+
+    def get_usage_values(self, column: str, encoded_mcts: list[str], months: list) -> np.ndarray:
+        """
+        여러 (가맹점, 기준년월)의 usage 컬럼 값을 한 번에 조회 (float64, 행이 없으면 NaN)
+        행은 있지만 컬럼이 없으면 get_usage(...).get(column, 0)과 같이 0
+        """
+        index = self._usage_positions()
+        keys = zip(merchant_ids.lookup_many(encoded_mcts).tolist(), (to_yyyymm(ym) for ym in months))
+        positions = np.array([index.get(key, -1) for key in keys], dtype=np.int64)
+        found = positions >= 0
+        values = np.full(len(positions), np.nan)
+        if column in self.usage.columns:
+            values[found] = pd.to_numeric(self.usage[column].iloc[positions[found]], errors='coerce').to_numpy(np.float64)
+        else:
+            values[found] = 0.0
+        return values
+
+    @staticmethod
+    def _usage_index(usage: pd.DataFrame, ids: np.ndarray, offset: int = 0) -> Dict[tuple, int]:
+        """(가맹점 id, yyyymm) -> usage 행 위치 (같은 값의 id/월은 int 객체 하나를 공유해 키 메모리 절감)"""
+        shared: Dict[int, int] = {}
+        keys = zip(ids.tolist(), month_values("usage", usage).tolist())
+        return {
+            (shared.setdefault(mct_id, mct_id), shared.setdefault(ym, ym)): pos
+            for pos, (mct_id, ym) in enumerate(keys, start=offset)
+        }
+
+    # ========== 월/업종 단위 조회 ==========
+    def get_month(self, name: str, ta_ym: Union[str, int]) -> pd.DataFrame:
+        """특정 월의 데이터셋 행 (usage, customers, risk)"""
+        df = self.frame(name)
+        return df[month_values(name, df) == to_yyyymm(ta_ym)]
+
+    def get_industry_merchants(self, industry: str) -> pd.DataFrame:
+        """업종명(HPSN_MCT_ZCD_NM)에 속한 가맹점 목록"""
+        return self.merchants[self.merchants['HPSN_MCT_ZCD_NM'] == industry]
+
+    # ========== 월 단위 추가 ==========
+    def append_month(self, ta_ym: Union[str, int], frames: Dict[str, pd.DataFrame]) -> dict:
+        """
+        한 달치 usage/customers/risk 행을 메모리 데이터에 추가 (같은 월이 이미 있으면 교체)
+
+        전체 데이터를 다시 읽지 않고, 가맹점별 조회 인덱스도 새 행만 반영한다.
+        같은 월을 교체하는 경우에는 해당 인덱스만 버리고 다음 조회 시 다시 만든다.
+
+        Returns:
+            {"rows": {데이터셋: 추가된 행 수}, "replaced": 기존 월 교체 여부,
+             "merchants": 추가/교체된 행의 ENCODED_MCT 집합}
+        """
+        ta_ym = to_yyyymm(ta_ym)
+        for name, new_rows in frames.items():
+            if name not in MONTHLY_DATASETS:
+                raise ValueError(f"월 단위로 추가할 수 없는 데이터셋입니다: {name}")
+            if (month_values(name, new_rows) != ta_ym).any():
+                raise ValueError(f"'{name}'에 {ta_ym} 이외의 월 데이터가 포함되어 있습니다.")
+
+        with self._lock:
+            rows, merchants, replaced_any = {}, set(), False
+            for name, new_rows in frames.items():
+                current = self.frame(name)
+                existing = month_values(name, current) == ta_ym
+                replaced = bool(existing.any())
+                new_rows = new_rows.reindex(columns=current.columns)
+
+                merchants.update(current.loc[existing, 'ENCODED_MCT'])
+                merchants.update(new_rows['ENCODED_MCT'])
+                base = current[~existing] if replaced else current
+                self._frames[name] = pd.concat([base, new_rows], ignore_index=True)
+                self._update_indexes(name, new_rows, len(base), replaced)
+
+                self.dataset_versions[name] = next(_version_counter)
+                rows[name] = len(new_rows)
+                replaced_any = replaced_any or replaced
+            self.version = next(_version_counter)
+
+        return {"rows": rows, "replaced": replaced_any, "merchants": merchants}
+
+    def _update_indexes(self, name: str, new_rows: pd.DataFrame, offset: int, replaced: bool) -> None:
+        """추가된 행만 기존 인덱스에 반영 (교체된 경우 인덱스를 버려 다음 조회 시 재생성)"""
+        ids_key = f"ids:{name}"
+        if ids_key not in self._indexes:
+            return  # 가맹점 단위 인덱스는 id 배열에서 만들므로 id 배열이 없으면 갱신할 인덱스도 없음
+        if replaced:
+            self._indexes.pop(ids_key)
+            self._indexes.pop({"usage": "usage", "risk": "risk_series"}.get(name), None)
+            return
+
+        new_ids = merchant_ids.intern(new_rows['ENCODED_MCT'])
+        self._indexes[ids_key] = np.concatenate([self._indexes[ids_key], new_ids])
+        if name == "usage" and "usage" in self._indexes:
+            self._indexes["usage"] = {**self._indexes["usage"], **self._usage_index(new_rows, new_ids, offset)}
+        elif name == "risk" and "risk_series" in self._indexes:
+            self._indexes["risk_series"] = self._indexes["risk_series"].appended(new_rows, new_ids)
+
+
+# 싱글톤 인스턴스
+data_store = MerchantDataStore()
+
+
+def get_data_store() -> MerchantDataStore:
+    """FastAPI Depends용 (핫 리로드 이후에는 교체된 저장소를 반환)"""
+    from app.services.data_context import data_reloader
+    return data_reloader.current.store
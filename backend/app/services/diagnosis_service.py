@@ -0,0 +1,224 @@
+import math
+from typing import Optional
+from datetime import datetime
+from app.services.data_context import data_reloader
+from app.services.data_store import MerchantDataStore, MerchantInfo
+from app.services.merchant_ids import merchant_ids
+from app.services.risk_series import to_yyyymm
+from app.services.response_cache import ResponseCache
+from app.config import settings
+
+
+class DiagnosisService:
+    def __init__(self, store: Optional[MerchantDataStore] = None):
+        self._store = store
+        self._response_cache = ResponseCache(max_size=settings.diagnosis_cache_size)
+    
+    @property
+    def store(self) -> MerchantDataStore:
+        """고정 저장소가 없으면 현재 데이터 컨텍스트의 저장소 (핫 리로드 시 교체됨)"""
+        return self._store or data_reloader.current.store
+    
+    def search_businesses(self, keyword: str, limit: int = 10) -> list[dict]:
+        """가게 이름으로 검색 (시작 매칭 우선, 그 다음 포함 매칭)"""
+        if not keyword or len(keyword.strip()) == 0:
+            return []
+        
+        return self.store.search_index.search(keyword, limit)
+    
+    def get_merchant_info(self, encoded_mct: str) -> Optional[MerchantInfo]:
+        """ENCODED_MCT로 가맹점 메타데이터 조회 (이름, 주소, 업종, 지역, 상권)"""
+        return self.store.get_merchant(encoded_mct)
+    
+    def get_latest_diagnosis(self, encoded_mct: str) -> Optional[dict]:
+        """특정 ENCODED_MCT의 최신 진단 데이터를 반환"""
+        return self.store.get_latest_risk(encoded_mct)
+    
+    def get_latest_diagnoses(self, encoded_mcts: list[str]) -> dict[str, dict]:
+        """여러 ENCODED_MCT의 최신 진단 데이터를 한 번에 반환 (없는 가맹점 제외)"""
+        return self.store.get_latest_risks(encoded_mcts)
+    
+    def get_diagnosis_history(self, encoded_mct: str) -> list[dict]:
+        """특정 ENCODED_MCT의 모든 진단 이력을 반환 (TA_YM 내림차순)"""
+        return self.store.get_risk_history(encoded_mct)
+    
+    def parse_diagnosis_response(self, row: dict) -> dict:
+        """
+        CSV row를 DiagnosisResponse 형태로 변환
+        (ENCODED_MCT, TA_YM) 행은 데이터 버전 안에서 바뀌지 않으므로 계산 결과를
+        (가맹점 id, yyyymm) 키로 캐시하고 created_at만 요청 시점으로 채운다.
+        """
+        store = self.store
+        payload = self._response_cache.get_or_create(
+            (merchant_ids.lookup(row['ENCODED_MCT']), to_yyyymm(row['TA_YM'])),
+            store.version,
+            lambda: self._build_diagnosis_payload(row, store),
+        )
+        return {**payload, "created_at": datetime.now().isoformat()}
+    
+    def cache_stats(self) -> dict:
+        """진단 응답 캐시 적중/미스 통계"""
+        return self._response_cache.stats()
+    
+    def build_latest_diagnoses(self, encoded_mcts: list[str]) -> tuple[list[dict], list[str]]:
+        """
+        여러 가맹점의 최신 진단 응답을 위험도 컬럼 배열에서 한 번에 생성 (일괄 진단용)
+        행 dict 변환/응답 캐시/usage 행 조회를 가맹점마다 거치지 않고,
+        최신 행 위치 -> 컬럼 값 -> 점수를 배열 단위로 계산한 뒤 응답 dict만 조립한다.
+
+        Returns:
+            ([{"encoded_mct", "business_name", "diagnosis"}], 데이터가 없는 ENCODED_MCT 목록) - 요청 순서 유지
+        """
+        store = self.store
+        series = store.risk_series
+        positions = series.latest_positions(encoded_mcts)
+        found = (positions >= 0).tolist()
+        not_found = [mct for mct, ok in zip(encoded_mcts, found) if not ok]
+        encoded_mcts = [mct for mct, ok in zip(encoded_mcts, found) if ok]
+        positions = positions[positions >= 0]
+
+        risks = [series.values(col, positions) for col in ('Sales_Risk', 'Customer_Risk', 'Market_Risk', 'RiskScore')]
+        # 단건 응답과 같은 연산 순서로 점수 계산 (반올림은 Python round와 같도록 값별로)
+        scores = [[round(max(0, min(100, v)), 2) for v in ((1 - values) * 100).tolist()] for values in risks]
+        risks = [values.tolist() for values in risks]
+        ta_yms = series.month_labels[series.month_codes[positions]].tolist()
+        alerts = series.alert_labels[series.alert_codes[positions]].tolist()
+        ratios = store.get_usage_values('M1_SME_RY_SAA_RAT', encoded_mcts, ta_yms).tolist()
+
+        created_at = datetime.now().isoformat()
+        items = []
+        for i, encoded_mct in enumerate(encoded_mcts):
+            merchant = store.get_merchant(encoded_mct)
+            payload = self._compose_payload(
+                encoded_mct, ta_yms[i], alerts[i],
+                [values[i] for values in risks], [values[i] for values in scores],
+                None if math.isnan(ratios[i]) else ratios[i],
+            )
+            items.append({
+                "encoded_mct": encoded_mct,
+                "business_name": merchant.name if merchant else "Unknown",
+                "diagnosis": {**payload, "created_at": created_at},
+            })
+        return items, not_found
+    
+    def _build_diagnosis_payload(self, row: dict, store: MerchantDataStore) -> dict:
+        """created_at을 제외한 진단 응답 본문 생성"""
+        risks = [float(row[col]) for col in ('Sales_Risk', 'Customer_Risk', 'Market_Risk', 'RiskScore')]
+        ta_ym = row['TA_YM']
+        encoded_mct = row['ENCODED_MCT']
+        
+        # 매출 비율 데이터 가져오기 (ds2에서)
+        # risk_output은 "YYYY-MM-DD" 형식, ds2는 "YYYYMM" 형식 - 저장소에서 통일
+        usage_row = store.get_usage(encoded_mct, ta_ym)
+        revenue_ratio = None
+        
+        if usage_row is not None:
+            try:
+                # M1_SME_RY_SAA_RAT: 동일 업종 매출금액 비율 (결측은 NaN으로 로드됨)
+                ratio = float(usage_row.get('M1_SME_RY_SAA_RAT', 0))
+                if not math.isnan(ratio):
+                    revenue_ratio = ratio
+            except (TypeError, ValueError):
+                pass
+        
+        # 0-100 스케일로 변환 (risk를 score로)
+        scores = [round(max(0, min(100, (1 - risk) * 100)), 2) for risk in risks]
+        return self._compose_payload(encoded_mct, ta_ym, row['Alert'], risks, scores, revenue_ratio)
+    
+    def _compose_payload(self, encoded_mct: str, ta_ym: str, alert: str, risks: list[float],
+                         scores: list[float], revenue_ratio: Optional[float]) -> dict:
+        """
+        진단 응답 본문 조립
+        risks/scores: (매출, 고객, 시장, 종합) 리스크 값과 0-100 점수
+        """
+        sales_risk, customer_risk, market_risk, risk_score = risks
+        sales_score, customer_score, market_score, overall_score = scores
+        
+        # 추천사항 생성
+        recommendations = self._generate_recommendations(sales_risk, customer_risk, market_risk)
+        
+        # 인사이트 생성
+        insights = self._generate_insights(risk_score, alert)
+        
+        return {
+            "id": f"diagnosis-{encoded_mct}-{ta_ym}",
+            "overall_score": overall_score,
+            "risk_level": alert,
+            "components": {
+                "sales": {
+                    "score": sales_score,
+                    "trend": self._get_trend_message("매출", sales_risk)
+                },
+                "customer": {
+                    "score": customer_score,
+                    "trend": self._get_trend_message("고객", customer_risk)
+                },
+                "market": {
+                    "score": market_score,
+                    "trend": self._get_trend_message("시장", market_risk)
+                }
+            },
+            "recommendations": recommendations,
+            "insights": insights,
+            "ta_ym": ta_ym,
+            "revenue_ratio": revenue_ratio  # 업종 평균 대비 매출 비율
+        }
+    
+    def _get_trend_message(self, category: str, risk_value: float) -> str:
+        """리스크 값에 따른 트렌드 메시지 생성"""
+        if risk_value < 0.2:
+            return f"{category} 상태가 매우 양호합니다."
+        elif risk_value < 0.4:
+            return f"{category} 상태가 안정적입니다."
+        elif risk_value < 0.6:
+            return f"{category}에 주의가 필요합니다."
+        elif risk_value < 0.8:
+            return f"{category} 상태가 좋지 않습니다."
+        else:
+            return f"{category}이 위험 수준입니다."
+    
+    def _generate_recommendations(self, sales_risk: float, customer_risk: float, market_risk: float) -> list[dict]:
+        """리스크 값에 따른 추천사항 생성"""
+        recommendations = []
+        
+        # 가장 높은 리스크 항목부터 우선순위 부여
+        risks = [
+            ("sales", sales_risk, "매출 개선", "매출 증대를 위한 프로모션 및 마케팅 강화가 필요합니다."),
+            ("customer", customer_risk, "고객 관리", "고객 유지율 향상을 위한 고객 관리 시스템 도입을 고려하세요."),
+            ("market", market_risk, "시장 대응", "시장 변화에 대응하기 위한 전략 수립이 필요합니다.")
+        ]
+        
+        risks.sort(key=lambda x: x[1], reverse=True)
+        
+        for i, (category, risk, title, desc) in enumerate(risks[:3]):
+            priority = "HIGH" if i == 0 else "MEDIUM" if i == 1 else "LOW"
+            recommendations.append({
+                "title": title,
+                "description": desc,
+                "priority": priority
+            })
+        
+        return recommendations
+    
+    def _generate_insights(self, risk_score: float, alert: str) -> list[str]:
+        """데이터 기반 인사이트 생성"""
+        insights = []
+        
+        if alert == "GREEN":
+            insights.append("현재 사업체 상태가 안정적입니다. 현재의 운영 방식을 유지하세요.")
+        elif alert == "YELLOW":
+            insights.append("일부 개선이 필요한 영역이 있습니다. 정기적인 모니터링을 권장합니다.")
+        elif alert == "ORANGE":
+            insights.append("주의가 필요한 상황입니다. 즉각적인 개선 조치를 취하세요.")
+        else:  # RED
+            insights.append("위험 수준입니다. 전문가 상담과 함께 긴급 대응이 필요합니다.")
+        
+        insights.append(f"종합 리스크 점수: {risk_score:.2%}")
+        insights.append("정기적인 재무 분석과 고객 관리가 사업 성공의 핵심입니다.")
+        
+        return insights
+
+
+# 싱글톤 인스턴스
+diagnosis_service = DiagnosisService()
+
@@ -0,0 +1,111 @@
+"""
+월 단위 데이터 추가 (증분 적재)
+
+새 기준년월(TA_YM) 데이터가 들어오면 CSV 전체를 다시 읽고 서버를 재시작하는 대신
+해당 월의 usage/customers/risk 행만 메모리 저장소에 추가하고,
+데이터가 바뀐 가맹점의 업종 벤치마크만 다시 집계한다.
+
+- 진단에 그대로 제공되는 risk 행(모델 산출 risk_output)은 필수 - 없으면 ValueError
+- 같은 월을 다시 넣으면 기존 행을 교체 (여러 번 실행해도 결과 동일)
+- persist=True면 원본 CSV(와 기존 스냅샷)에도 반영하여 재시작 후에도 유지
+
+사용법 (backend 디렉토리에서, 원본 CSV/스냅샷에 반영):
+    python -m app.services.ingestion 202501 --usage ds2_202501.csv --customers ds3_202501.csv --risk risk_202501.csv
+
+실행 중인 서버 메모리에는 POST /api/admin/ingest 로 반영한다.
+"""
+import argparse
+import os
+import time
+from typing import Dict, Iterable, Optional, Union
+
+import pandas as pd
+
+from app.services.data_snapshot import (
+    build_snapshot, get_snapshot_dir, read_csv, write_source_csv,
+)
+from app.services.data_store import MerchantDataStore, data_store
+from app.services.risk_series import to_yyyymm
+
+
+def persist_datasets(store: MerchantDataStore, names: Iterable[str]) -> None:
+    """메모리 데이터셋을 원본 CSV로 저장하고, 스냅샷이 있던 데이터셋은 스냅샷도 다시 생성"""
+    snapshot_dir = store.snapshot_dir or get_snapshot_dir()
+    for name in names:
+        write_source_csv(name, store.frame(name), store.data_dir)
+        if os.path.isdir(os.path.join(snapshot_dir, name)):
+            build_snapshot(name, store.data_dir, store.snapshot_dir)
+
+
+def ingest_month(ta_ym: Union[str, int], usage: pd.DataFrame,
+                 customers: Optional[pd.DataFrame] = None,
+                 risk: Optional[pd.DataFrame] = None,
+                 store: Optional[MerchantDataStore] = None,
+                 calculators: Iterable = (),
+                 persist: bool = False) -> Dict:
+    """
+    한 달치 데이터를 저장소에 추가
+
+    Args:
+        ta_ym: 기준년월 (yyyymm)
+        usage: 해당 월 ds2 행
+        customers: 해당 월 ds3 행 (선택)
+        risk: 해당 월 risk_output 행 (필수, 진단 응답에 그대로 사용)
+        store: 데이터 저장소 (기본 싱글톤)
+        calculators: 업종 통계를 갱신할 BenchmarkCalculator 목록
+        persist: 원본 CSV/스냅샷에도 반영할지 여부
+
+    Returns:
+        적재 결과 요약
+    """
+    store = store or data_store
+    ta_ym = to_yyyymm(ta_ym)
+    started = time.time()
+
+    if risk is None or risk.empty:
+        raise ValueError("해당 월 risk_output 행이 필요합니다 (위험도는 모델 산출 결과만 적재).")
+
+    frames = {"usage": usage, "risk": risk}
+    if customers is not None:
+        frames["customers"] = customers
+    result = store.append_month(ta_ym, frames)
+
+    industries = set()
+    for calc in calculators:
+        if calc is not None:
+            industries.update(calc.refresh_industries(result["merchants"]))
+
+    if persist:
+        persist_datasets(store, frames)
+
+    summary = {
+        "ta_ym": ta_ym,
+        "rows": result["rows"],
+        "replaced": result["replaced"],
+        "affected_merchants": len(result["merchants"]),
+        "affected_industries": sorted(industries),
+        "version": store.version,
+        "persisted": persist,
+        "elapsed_ms": round((time.time() - started) * 1000, 1),
+    }
+    print(f"[OK] {ta_ym} 데이터 추가 완료: {summary['rows']} "
+          f"(가맹점 {summary['affected_merchants']:,}개, 업종 {len(industries)}개 재계산)")
+    return summary
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="한 달치 데이터를 원본 CSV/스냅샷에 추가")
+    parser.add_argument("ta_ym", help="기준년월 (yyyymm)")
+    parser.add_argument("--usage", required=True, help="해당 월 ds2 CSV")
+    parser.add_argument("--customers", help="해당 월 ds3 CSV")
+    parser.add_argument("--risk", required=True, help="해당 월 risk_output CSV")
+    args = parser.parse_args()
+
+    ingest_month(
+        args.ta_ym,
+        read_csv("usage", args.usage),
+        read_csv("customers", args.customers) if args.customers else None,
+        read_csv("risk", args.risk),
+        persist=True,
+    )
+    print("[INFO] 실행 중인 서버에는 POST /api/admin/ingest 로 반영하세요.")
@@ -0,0 +1,114 @@
+"""
+프로세스/데이터프레임별 메모리 사용량 보고 (GET /api/admin/memory)
+
+DataFrame.memory_usage(deep=True)는 여러 행이 공유하는 문자열 객체를 행마다 다시 세므로,
+object 컬럼은 참조 배열 + 고유 객체 크기로 계산한다.
+mmap(스냅샷/공유 세대) 위의 숫자 컬럼과 문자열 컬럼 코드는 페이지 캐시/다른 워커와 공유되므로
+mmap_mb로 따로 집계한다.
+"""
+import os
+import sys
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from app.config import settings
+from app.services.data_snapshot import DATASETS
+
+_MB = 1024 * 1024
+
+
+def _is_mmap(values: np.ndarray) -> bool:
+    base = values
+    while base is not None:
+        if isinstance(base, np.memmap):
+            return True
+        base = getattr(base, "base", None)
+    return False
+
+
+def _object_bytes(values: np.ndarray) -> int:
+    """참조 배열 + 고유 객체 크기 (같은 객체를 여러 행이 가리키면 한 번만)"""
+    unique = {id(value): value for value in values}
+    return values.nbytes + sum(sys.getsizeof(value) for value in unique.values())
+
+
+def _column_bytes(series: pd.Series) -> tuple:
+    """(프로세스 전용 바이트, mmap 바이트)"""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        categories = series.cat.categories.to_numpy()
+        category_bytes = _object_bytes(categories) if categories.dtype == object else categories.nbytes
+        codes = series.array.codes
+        if _is_mmap(codes):
+            # read_columns 문자열 컬럼: 코드는 mmap, 카테고리 값만 프로세스 전용
+            return category_bytes, codes.nbytes
+        return codes.nbytes + category_bytes, 0
+    values = series.to_numpy()
+    if values.dtype == object:
+        return _object_bytes(values), 0
+    if _is_mmap(values):
+        return 0, values.nbytes
+    return values.nbytes, 0
+
+
+def frame_memory(df: Optional[pd.DataFrame]) -> Dict:
+    """DataFrame 하나의 행/컬럼 수와 메모리 (MB)"""
+    if df is None:
+        return {"loaded": False}
+    private, mapped = df.index.memory_usage(deep=True), 0
+    for column in df.columns:
+        column_private, column_mapped = _column_bytes(df[column])
+        private += column_private
+        mapped += column_mapped
+    return {
+        "loaded": True,
+        "rows": len(df),
+        "columns": len(df.columns),
+        "memory_mb": round(private / _MB, 2),
+        "mmap_mb": round(mapped / _MB, 2),
+    }
+
+
+def process_memory() -> Dict:
+    """현재/최대 RSS (MB, /proc가 없는 환경에서는 None)"""
+    values = {"VmRSS": None, "VmHWM": None}
+    try:
+        with open(f"/proc/{os.getpid()}/status", "r") as f:
+            for line in f:
+                key = line.split(":", 1)[0]
+                if key in values:
+                    values[key] = round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+    return {"rss_mb": values["VmRSS"], "peak_rss_mb": values["VmHWM"]}
+
+
+def memory_report(context) -> Dict:
+    """
+    데이터 컨텍스트의 저장소 데이터셋과 벤치마크 계산 프레임별 메모리
+
+    아직 로드하지 않은 데이터셋(지연 로드)은 로드하지 않고 loaded=False로 표시한다.
+    """
+    store, calc = context.store, context.benchmark_calc
+    frames = {
+        f"store.{name}": frame_memory(store.frame(name) if store.is_loaded(name) else None)
+        for name in DATASETS
+    }
+    if calc is not None:
+        frames.update({
+            "benchmark.merged_df": frame_memory(calc.merged_df),
+            "benchmark.cube_usage_rows": frame_memory(calc.cube.usage_rows if calc.cube else None),
+            "benchmark.cube_risk_rows": frame_memory(calc.cube.risk_rows if calc.cube else None),
+            "benchmark.monthly_stats": frame_memory(calc.monthly_stats),
+            "benchmark.industry_stats": frame_memory(calc.industry_stats),
+        })
+    loaded = [frame for frame in frames.values() if frame["loaded"]]
+    return {
+        "process": process_memory(),
+        "compact_frames": settings.compact_frames,
+        "data_version": context.version,
+        "frames": frames,
+        "total_memory_mb": round(sum(frame["memory_mb"] for frame in loaded), 2),
+        "total_mmap_mb": round(sum(frame["mmap_mb"] for frame in loaded), 2),
+    }
@@ -0,0 +1,71 @@
+"""
+가맹점 ID(ENCODED_MCT) 정수 인터닝 표 (프로세스 전역)
+
+ENCODED_MCT 문자열을 처음 등장한 순서대로 조밀한 int32 id(0, 1, 2, ...)에 대응시킨다.
+저장소 인덱스, 데이터셋 간 조인, 응답 캐시는 문자열 대신 id와 (id, yyyymm) 튜플을 키로 사용한다.
+
+- 표는 추가만 하므로 리로드/월 추가 이후에도 같은 가맹점은 같은 id를 유지 (이전 데이터 컨텍스트와 공유 가능)
+- id는 프로세스마다 다르므로 스냅샷/공유 세대 파일에는 저장하지 않는다
+- 조회는 잠금 없이, 새 가맹점 등록만 잠금 안에서 수행
+"""
+import threading
+from typing import Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+# 표에 없는 가맹점 (결측 포함)
+UNKNOWN_ID = -1
+
+
+class MerchantIdTable:
+    def __init__(self):
+        self._ids: dict = {}  # ENCODED_MCT -> id
+        self._names: List[str] = []  # id -> ENCODED_MCT
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def _codes(self, values, assign: bool) -> np.ndarray:
+        """고유값만 사전 조회하고 행 전체는 factorize 코드로 인덱싱"""
+        codes, uniques = pd.factorize(np.asarray(values, dtype=object))
+        unique_ids = np.fromiter(
+            (self._ids.get(value, UNKNOWN_ID) for value in uniques), dtype=np.int32, count=len(uniques)
+        )
+        missing = np.flatnonzero(unique_ids == UNKNOWN_ID)
+        if assign and len(missing):
+            with self._lock:
+                for i in missing.tolist():
+                    value = uniques[i]
+                    if value not in self._ids:
+                        self._ids[value] = len(self._names)
+                        self._names.append(value)
+                    unique_ids[i] = self._ids[value]
+        lookup = np.append(unique_ids, np.int32(UNKNOWN_ID))  # 결측 코드(-1) -> UNKNOWN_ID
+        return lookup[codes]
+
+    def intern(self, values: Iterable) -> np.ndarray:
+        """ENCODED_MCT 배열을 int32 id 배열로 (처음 보는 가맹점은 새 id 등록, 결측은 UNKNOWN_ID)"""
+        return self._codes(values, assign=True)
+
+    def lookup_many(self, values: Iterable) -> np.ndarray:
+        """ENCODED_MCT 배열의 id (등록하지 않으며, 표에 없으면 UNKNOWN_ID)"""
+        return self._codes(values, assign=False)
+
+    def lookup(self, encoded_mct: str) -> int:
+        """ENCODED_MCT 하나의 id (표에 없으면 UNKNOWN_ID)"""
+        return self._ids.get(encoded_mct, UNKNOWN_ID)
+
+    def name(self, merchant_id: int) -> Optional[str]:
+        """id -> ENCODED_MCT"""
+        return self._names[merchant_id] if 0 <= merchant_id < len(self._names) else None
+
+    def names(self, merchant_ids: Iterable[int]) -> List[str]:
+        """id 목록 -> ENCODED_MCT 목록"""
+        names = self._names
+        return [names[i] for i in np.asarray(merchant_ids).tolist()]
+
+
+# 싱글톤 인스턴스
+merchant_ids = MerchantIdTable()
@@ -0,0 +1,67 @@
+"""
+데이터 버전 단위로 무효화되는 LRU 응답 캐시
+
+원본 데이터가 바뀌지 않는 한 같은 입력에 대한 응답이 항상 같으므로,
+계산된 응답을 키별로 보관하고 데이터 버전이 바뀌면 한 번에 비운다.
+"""
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+_MISSING = object()
+
+
+class ResponseCache:
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self.version = None
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _check_version(self, version: Any) -> None:
+        if version != self.version:
+            if self._entries:
+                self.invalidations += 1
+            self._entries.clear()
+            self.version = version
+
+    def get_or_create(self, key: Hashable, version: Any, factory: Callable[[], Any]) -> Any:
+        """캐시에 있으면 반환, 없으면 factory()로 만들어 저장 후 반환"""
+        with self._lock:
+            self._check_version(version)
+            value = self._entries.get(key, _MISSING)
+            if value is not _MISSING:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            self.misses += 1
+
+        value = factory()
+
+        with self._lock:
+            # 계산하는 동안 데이터 버전이 바뀌었으면 저장하지 않음
+            if version == self.version:
+                self._entries[key] = value
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            "invalidations": self.invalidations,
+            "version": self.version,
+        }
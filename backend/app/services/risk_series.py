@@ -0,0 +1,222 @@
+"""
+가맹점별 위험도 시계열 저장소 (struct-of-arrays)
+
+risk_output의 약 8.6만 행을 행 단위 dict 대신 컬럼 배열로 보관한다.
+가맹점 정수 id(merchant_ids) 순서대로, 가맹점 안에서는 기준년월 내림차순으로 미리 정렬해 두고
+CSR 방식의 offsets 배열로 가맹점별 구간을 찾는다.
+
+    offsets[i] ~ offsets[i + 1]  : id i 가맹점의 행 구간 (위험도 행이 없으면 빈 구간)
+    offsets[i]                   : id i 가맹점의 최신 월 행
+"""
+from typing import Dict, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from app.services.merchant_ids import merchant_ids
+
+# risk_output의 Alert 등급 (위험도 낮은 순)
+ALERT_LEVELS = ("GREEN", "YELLOW", "ORANGE", "RED")
+
+# 수치 컬럼 - float32로 보관하고 조회 시 widen()으로 float64 복원
+NUMERIC_COLUMNS = ('Sales_Risk', 'Customer_Risk', 'Market_Risk', 'RiskScore', 'p_model', 'p_final')
+
+
+def to_yyyymm(ta_ym: Union[str, int]) -> int:
+    """
+    기준년월 표기를 정수 yyyymm으로 통일
+    예: "2024-12-01" -> 202412, "202412" -> 202412, 202412 -> 202412
+    """
+    if isinstance(ta_ym, (int, np.integer)):
+        return int(ta_ym)
+    ta_ym = str(ta_ym)
+    if '-' in ta_ym:
+        return int(ta_ym[:7].replace('-', ''))
+    return int(ta_ym[:6])
+
+
+def widen(values: np.ndarray) -> np.ndarray:
+    """
+    float32 값을 원본 CSV 값과 같은 float64로 복원
+    risk_output은 소수 6자리로 기록되어 float32의 최단 표기가 원본 표기와 같으므로,
+    단순 형변환(0.324532 -> 0.32453200221...) 대신 최단 표기를 거쳐 변환한다.
+    (그대로 형변환하면 점수 반올림 경계값 xx.xx5에서 응답이 달라질 수 있음)
+    """
+    return np.asarray(values).astype(str).astype(np.float64)
+
+
+def _check_codes(codes: np.ndarray, column: str) -> None:
+    """factorize 결측 코드(-1)가 마지막 라벨로 인덱싱되지 않도록 거부 (month_values와 같은 오류)"""
+    missing = int((codes < 0).sum())
+    if missing:
+        raise ValueError(f"'risk'의 {column}에 빈 값이 {missing}개 있습니다.")
+
+
+def _factorize(values: pd.Series) -> tuple:
+    """라벨 사전 인코딩 (빈 값이 있으면 ValueError)"""
+    codes, labels = pd.factorize(values)
+    _check_codes(codes, values.name)
+    return codes, np.asarray(labels, dtype=object)
+
+
+def _extend_labels(labels: np.ndarray, values: pd.Series) -> tuple:
+    """
+    기존 사전(labels)에 없는 값을 등장 순서대로 뒤에 추가하고 values의 코드 반환
+    (전체를 다시 factorize한 것과 같은 코드 순서, 빈 값이 있으면 ValueError)
+    """
+    _check_codes(np.where(values.isna(), -1, 0), values.name)
+    values = values.to_numpy(dtype=object)
+    codes = pd.Index(labels).get_indexer(values)
+    missing = codes < 0
+    if missing.any():
+        labels = np.concatenate([labels, np.asarray(pd.unique(values[missing]), dtype=object)])
+        codes[missing] = pd.Index(labels).get_indexer(values[missing])
+    return labels, codes
+
+
+def _merchant_counts(merchant_codes: np.ndarray, minlength: int = 0) -> np.ndarray:
+    """id별 행 수 (id 0 ~ 최대 id까지)"""
+    return np.bincount(merchant_codes, minlength=minlength).astype(np.int64)
+
+
+def _row_keys(merchant_codes: np.ndarray, yyyymm: np.ndarray) -> np.ndarray:
+    """정렬 키 (가맹점 오름차순 + 기준년월 내림차순)"""
+    return merchant_codes.astype(np.int64) * 1_000_000 + (999_999 - yyyymm.astype(np.int64))
+
+
+class RiskTimeSeries:
+    def __init__(self, risk: pd.DataFrame, ids: Optional[np.ndarray] = None):
+        """
+        Args:
+            risk: risk_output 데이터셋
+            ids: risk 행과 같은 순서의 가맹점 정수 id (저장소 인덱스, 없으면 새로 인터닝)
+        """
+        mct_codes = merchant_ids.intern(risk['ENCODED_MCT']) if ids is None else ids
+
+        # 기준년월: 원본 표기("2024-12-01")는 사전 인코딩, 정렬/비교는 int yyyymm
+        month_codes, self.month_labels = _factorize(risk['TA_YM'])
+        label_yyyymm = np.array([to_yyyymm(v) for v in self.month_labels], dtype=np.int32)
+        yyyymm = label_yyyymm[month_codes]
+
+        # 가맹점 오름차순 + 기준년월 내림차순 (안정 정렬이라 동일 월은 원본 순서 유지)
+        order = np.lexsort((-yyyymm, mct_codes))
+        counts = _merchant_counts(mct_codes)
+        self.offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+        np.cumsum(counts, out=self.offsets[1:])
+
+        self.ta_ym = yyyymm[order]
+        self.month_codes = month_codes[order].astype(np.int16)
+        self.columns: Dict[str, np.ndarray] = {
+            col: risk[col].to_numpy(dtype=np.float32)[order]
+            for col in NUMERIC_COLUMNS if col in risk.columns
+        }
+        alert_codes, self.alert_labels = _factorize(risk['Alert'])
+        self.alert_codes = alert_codes[order].astype(np.int8)
+
+    def appended(self, risk: pd.DataFrame, ids: Optional[np.ndarray] = None) -> "RiskTimeSeries":
+        """
+        새로 들어온 행을 끼워 넣은 새 시계열 반환 (기존 객체는 변경하지 않음)
+
+        기존 행은 이미 정렬되어 있으므로 새 행만 정렬한 뒤 searchsorted 위치에
+        삽입한다. 원본 DataFrame 뒤에 행을 이어 붙여 새로 만든 것과 결과가 같다.
+        """
+        series = RiskTimeSeries.__new__(RiskTimeSeries)
+
+        mct_codes = merchant_ids.intern(risk['ENCODED_MCT']) if ids is None else ids
+        series.month_labels, month_codes = _extend_labels(self.month_labels, risk['TA_YM'])
+        series.alert_labels, alert_codes = _extend_labels(self.alert_labels, risk['Alert'])
+        label_yyyymm = np.array([to_yyyymm(v) for v in series.month_labels], dtype=np.int32)
+        yyyymm = label_yyyymm[month_codes]
+
+        # 새 행 정렬 후 기존 정렬 위치에 삽입 (같은 키는 기존 행 뒤)
+        new_keys = _row_keys(mct_codes, yyyymm)
+        order = np.argsort(new_keys, kind='stable')
+        counts = np.diff(self.offsets)
+        old_merchants = np.repeat(np.arange(len(counts)), counts)
+        positions = np.searchsorted(_row_keys(old_merchants, self.ta_ym), new_keys[order], side='right')
+
+        new_counts = _merchant_counts(mct_codes, minlength=len(counts))
+        new_counts[:len(counts)] += counts
+        series.offsets = np.zeros(len(new_counts) + 1, dtype=np.int64)
+        np.cumsum(new_counts, out=series.offsets[1:])
+
+        series.ta_ym = np.insert(self.ta_ym, positions, yyyymm[order])
+        series.month_codes = np.insert(self.month_codes, positions, month_codes[order].astype(np.int16))
+        series.alert_codes = np.insert(self.alert_codes, positions, alert_codes[order].astype(np.int8))
+        series.columns = {
+            col: np.insert(values, positions, risk[col].to_numpy(dtype=np.float32)[order])
+            for col, values in self.columns.items()
+        }
+        return series
+
+    def __len__(self) -> int:
+        return len(self.ta_ym)
+
+    def _slice(self, encoded_mct: str) -> Optional[slice]:
+        i = merchant_ids.lookup(encoded_mct)
+        if not 0 <= i < len(self.offsets) - 1:
+            return None
+        return slice(int(self.offsets[i]), int(self.offsets[i + 1]))
+
+    def _row(self, pos: int, encoded_mct: str) -> dict:
+        """배열 위치 하나를 기존 CSV row와 같은 키의 dict로 변환"""
+        row = {
+            'ENCODED_MCT': encoded_mct,
+            'TA_YM': self.month_labels[self.month_codes[pos]],
+            'Alert': self.alert_labels[self.alert_codes[pos]],
+        }
+        for col, values in self.columns.items():
+            row[col] = float(widen(values[pos]))
+        return row
+
+    def values(self, column: str, positions: np.ndarray) -> np.ndarray:
+        """행 위치들의 수치 컬럼 값 (float64로 복원)"""
+        return widen(self.columns[column][positions])
+
+    def latest(self, encoded_mct: str) -> Optional[dict]:
+        """최신 월 행 (정렬되어 있으므로 구간의 첫 행)"""
+        span = self._slice(encoded_mct)
+        if span is None or span.start == span.stop:
+            return None
+        return self._row(span.start, encoded_mct)
+
+    def history(self, encoded_mct: str) -> list[dict]:
+        """전체 이력 (기준년월 내림차순)"""
+        span = self._slice(encoded_mct)
+        if span is None:
+            return []
+        return [self._row(pos, encoded_mct) for pos in range(span.start, span.stop)]
+
+    def latest_positions(self, encoded_mcts: list[str]) -> np.ndarray:
+        """여러 가맹점의 최신 월 행 위치 (요청 순서, 데이터가 없으면 -1)"""
+        merchants = merchant_ids.lookup_many(encoded_mcts).astype(np.int64)
+        known = (merchants >= 0) & (merchants < len(self.offsets) - 1)
+        positions = np.full(len(merchants), -1, dtype=np.int64)
+        starts = self.offsets[merchants[known]]
+        has_rows = starts < self.offsets[merchants[known] + 1]
+        positions[np.flatnonzero(known)[has_rows]] = starts[has_rows]
+        return positions
+
+    def latest_many(self, encoded_mcts: list[str]) -> Dict[str, dict]:
+        """
+        여러 가맹점의 최신 월 행을 한 번에 조회
+        가맹점 오프셋 -> 행 위치 -> 컬럼 값을 배열 인덱싱으로 일괄 수집한다.
+
+        Returns:
+            {ENCODED_MCT: row} (데이터가 없는 가맹점은 제외)
+        """
+        merchants = merchant_ids.lookup_many(encoded_mcts).astype(np.int64)
+        positions = self.latest_positions(encoded_mcts)
+        merchants, positions = merchants[positions >= 0], positions[positions >= 0]
+
+        months = self.month_labels[self.month_codes[positions]]
+        alerts = self.alert_labels[self.alert_codes[positions]]
+        values = {col: self.values(col, positions).tolist() for col in self.columns}
+
+        rows = {}
+        for i, encoded_mct in enumerate(merchant_ids.names(merchants)):
+            row = {'ENCODED_MCT': encoded_mct, 'TA_YM': months[i], 'Alert': alerts[i]}
+            for col, col_values in values.items():
+                row[col] = col_values[i]
+            rows[encoded_mct] = row
+        return rows
@@ -0,0 +1,106 @@
+"""
+산점도 밀도 보존 다운샘플링과 2D 히스토그램
+
+매출/고객수(백분위 0~100) 평면을 고정 격자로 나눠 가맹점마다 격자 칸을 미리 배정해 두고,
+- grid: 칸마다 최소 1개, 나머지는 칸의 가맹점 수에 비례해 뽑고 지표별 최솟값/최댓값 가맹점은 항상 포함
+- histogram: 칸별 가맹점 수와 평균 위험도만 반환 (가맹점 수와 무관하게 최대 HISTOGRAM_BINS^2 칸)
+"""
+from typing import Dict
+
+import numpy as np
+
+SCATTER_MODES = ("random", "grid", "histogram")
+HISTOGRAM_BINS = 20  # 축별 칸 수
+AXIS_RANGE = (0.0, 100.0)  # 매출/고객수 백분위 범위
+_EDGES = np.linspace(*AXIS_RANGE, HISTOGRAM_BINS + 1)
+
+
+def assign_cells(revenue: np.ndarray, customers: np.ndarray) -> np.ndarray:
+    """가맹점별 격자 칸 번호 (x=매출, y=고객수, 번호 = x * HISTOGRAM_BINS + y)"""
+    x = np.clip(np.searchsorted(_EDGES, revenue, side='right') - 1, 0, HISTOGRAM_BINS - 1)
+    y = np.clip(np.searchsorted(_EDGES, customers, side='right') - 1, 0, HISTOGRAM_BINS - 1)
+    return (x * HISTOGRAM_BINS + y).astype(np.int32)
+
+
+def sampling_order(cells: np.ndarray, seed: int = 42) -> np.ndarray:
+    """칸 순서, 같은 칸 안에서는 고정 시드 난수 순서로 정렬한 위치 (grid 샘플링용)"""
+    noise = np.random.RandomState(seed).random_sample(len(cells))
+    return np.lexsort((noise, cells)).astype(np.int32)
+
+
+def build_histogram(cells: np.ndarray, risk_score: np.ndarray) -> Dict:
+    """칸별 가맹점 수와 평균 위험도 (가맹점이 있는 칸만)"""
+    counts = np.bincount(cells, minlength=HISTOGRAM_BINS ** 2)
+    risk_sums = np.bincount(cells, weights=risk_score, minlength=HISTOGRAM_BINS ** 2)
+    occupied = np.flatnonzero(counts)
+    edges = _EDGES.tolist()
+    return {
+        "x_edges": edges,  # 매출 백분위 구간 경계
+        "y_edges": edges,  # 고객수 백분위 구간 경계
+        "bins": [
+            {"x": x, "y": y, "count": count, "avg_risk": avg_risk}
+            for x, y, count, avg_risk in zip(
+                (occupied // HISTOGRAM_BINS).tolist(),
+                (occupied % HISTOGRAM_BINS).tolist(),
+                counts[occupied].tolist(),
+                (risk_sums[occupied] / counts[occupied]).tolist(),
+            )
+        ],
+    }
+
+
+def extreme_positions(columns: Dict[str, np.ndarray]) -> np.ndarray:
+    """매출/고객수/위험도 각각의 최솟값, 최댓값 가맹점 위치"""
+    positions = []
+    for name in ("revenue", "customers", "risk_score"):
+        values = columns[name]
+        positions.extend((int(values.argmin()), int(values.argmax())))
+    return np.unique(positions)
+
+
+def grid_sample(cells: np.ndarray, order: np.ndarray, extremes: np.ndarray, limit: int) -> np.ndarray:
+    """
+    밀도 보존 격자 다운샘플링 (결과 위치는 정렬되어 있고 가맹점이 limit개보다 많으면 정확히 limit개)
+
+    Args:
+        cells: 가맹점별 칸 번호
+        order: sampling_order(cells)
+        extremes: 항상 포함할 위치 (extreme_positions)
+        limit: 최대 점 개수
+    """
+    n = len(cells)
+    if n <= limit:
+        return np.arange(n)
+    extremes = extremes[:limit]
+    quota = limit - len(extremes)
+
+    # 극값 위치는 이미 포함되므로 칸별 배분 대상에서 빼야 합친 뒤 중복으로 개수가 줄지 않음
+    remaining = np.ones(n, dtype=bool)
+    remaining[extremes] = False
+    order = order[remaining[order]]
+    counts = np.bincount(cells[order], minlength=HISTOGRAM_BINS ** 2)
+    occupied = counts > 0
+    if occupied.sum() >= quota:
+        # 칸이 더 많으면 고정 시드로 고른 칸에서 1개씩
+        chosen = np.random.RandomState(42).permutation(np.flatnonzero(occupied))[:quota]
+        allocation = np.zeros_like(counts)
+        allocation[chosen] = 1
+    else:
+        # 칸마다 1개 + 남은 수를 칸의 나머지 가맹점 수에 비례해 배분
+        rest = counts - occupied
+        share = (quota - occupied.sum()) * rest / max(rest.sum(), 1)
+        extra = np.minimum(np.floor(share).astype(counts.dtype), rest)
+        # 내림으로 남은 수는 나머지가 큰 칸부터 1개씩 (최대 잔여 방식)
+        leftover = quota - occupied.sum() - extra.sum()
+        if leftover > 0:
+            remainders = np.where(extra < rest, share - extra, -1.0)
+            extra[np.argsort(-remainders, kind='stable')[:leftover]] += 1
+            extra = np.minimum(extra, rest)
+        allocation = occupied + extra
+
+    # order 기준 칸 안 순위가 배분 수보다 작은 위치 선택
+    sorted_cells = cells[order]
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    rank = np.arange(len(order)) - starts[sorted_cells]
+    selected = order[rank < allocation[sorted_cells]]
+    return np.union1d(selected, extremes)
@@ -0,0 +1,585 @@
+"""
+가게 이름 검색 인덱스
+
+데이터 로드 시 한 번 만들어 두고, 검색 요청마다 파일을 다시 읽거나
+전체 가맹점을 순회하지 않도록 한다.
+
+- 저장 구조: 정규화 이름을 이어 붙인 문자열 하나 + 오프셋/정렬 순서/포스팅 numpy 배열
+  (가맹점 수만큼 Python 객체를 만들지 않으므로 100만 개 이상에서도 메모리/생성 시간이 선형으로 작게 유지됨)
+- 접두사 검색: 정규화 이름 정렬 순서에서 이분 탐색 후 이름 순으로 필요한 개수만 확인하고 멈춤
+- 포함 검색: 글자 1/2/3-gram 포스팅(CSR, int32 행 번호) 중 가장 짧은 목록을 후보로 삼아 실제 포함 여부 확인
+- 정규화: 소문자 + 마스킹 별표(*) 제거 버전을 함께 색인 (기존 검색과 동일 기준)
+- 한글 초성 검색("ㅎㅂ"): 초성 문자열 색인을 따로 두되 포스팅은 1/2-gram만 생성
+- 입력 중인 미완성 음절("행보") 검색: 자모 색인 없이 이름 색인에서 후보(정확히 일치해야 하는 글자,
+  마지막 음절의 초성/중성 범위)를 좁힌 뒤 자모 분해 문자열로 확인
+"""
+from bisect import bisect_left
+from heapq import merge
+from itertools import chain
+from typing import Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+MAX_GRAM = 3
+CHOSUNG_MAX_GRAM = 2  # 초성 문자열은 글자 종류가 적어 3-gram의 선택도 이득이 작음
+
+# 검색 결과 컬럼
+RESULT_COLUMNS = ('ENCODED_MCT', 'MCT_NM', 'MCT_BSE_AR', 'HPSN_MCT_ZCD_NM')
+
+# ========== 한글 자모 분해 ==========
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+CHOSUNG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+# 겹모음/겹받침은 입력 순서대로 풀어서 저장 ("과" 입력 중인 "고"도 매칭되도록)
+JUNGSUNG = [
+    "ㅏ", "ㅐ", "ㅑ", "ㅒ", "ㅓ", "ㅔ", "ㅕ", "ㅖ", "ㅗ", "ㅗㅏ", "ㅗㅐ",
+    "ㅗㅣ", "ㅛ", "ㅜ", "ㅜㅓ", "ㅜㅔ", "ㅜㅣ", "ㅠ", "ㅡ", "ㅡㅣ", "ㅣ",
+]
+JONGSUNG = [
+    "", "ㄱ", "ㄲ", "ㄱㅅ", "ㄴ", "ㄴㅈ", "ㄴㅎ", "ㄷ", "ㄹ", "ㄹㄱ", "ㄹㅁ",
+    "ㄹㅂ", "ㄹㅅ", "ㄹㅌ", "ㄹㅍ", "ㄹㅎ", "ㅁ", "ㅂ", "ㅂㅅ", "ㅅ", "ㅆ",
+    "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ",
+]
+# 검색어에 단독으로 입력된 겹자모 분해용
+COMPOUND_JAMO = {
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ",
+    "ㄼ": "ㄹㅂ", "ㄽ": "ㄹㅅ", "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ",
+    "ㅄ": "ㅂㅅ", "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ",
+    "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ",
+}
+# 호환용 자모 블록 (ㄱ ~ ㅣ, 모음은 ㅏ부터)
+JAMO_FIRST = 0x3131
+JAMO_VOWEL_FIRST = 0x314F
+JAMO_LAST = 0x3163
+
+# 초성 변환 시 제거하는 공백 문자 (유니코드 공백의 최대 코드 포인트는 U+3000)
+_SPACE_CODES = np.array([c for c in range(0x3001) if chr(c).isspace()], dtype=np.uint32)
+_CHOSUNG_CODES = np.array([ord(ch) for ch in CHOSUNG], dtype=np.uint32)
+# 코드 포인트는 21비트 이내이므로 3글자까지 int64 하나로 표현
+_GRAM_SHIFT = 21
+
+
+def _is_syllable(ch: str) -> bool:
+    return HANGUL_BASE <= ord(ch) <= HANGUL_LAST
+
+
+def _is_jamo(ch: str) -> bool:
+    return JAMO_FIRST <= ord(ch) <= JAMO_LAST
+
+
+def _is_vowel(ch: str) -> bool:
+    return JAMO_VOWEL_FIRST <= ord(ch) <= JAMO_LAST
+
+
+def to_jamo(text: str) -> str:
+    """한글 음절을 자모 단위로 분해: "행복" -> "ㅎㅐㅇㅂㅗㄱ" (그 외 문자는 그대로)"""
+    out = []
+    for ch in text:
+        if _is_syllable(ch):
+            offset = ord(ch) - HANGUL_BASE
+            out.append(CHOSUNG[offset // 588])
+            out.append(JUNGSUNG[(offset % 588) // 28])
+            out.append(JONGSUNG[offset % 28])
+        else:
+            out.append(COMPOUND_JAMO.get(ch, ch))
+    return "".join(out)
+
+
+def to_chosung(text: str) -> str:
+    """한글 음절을 초성으로 변환, 공백 제거: "행복 카페" -> "ㅎㅂㅋㅍ" """
+    return "".join(
+        CHOSUNG[(ord(ch) - HANGUL_BASE) // 588] if _is_syllable(ch) else ch
+        for ch in text
+        if not ch.isspace()
+    )
+
+
+def is_chosung_query(keyword: str) -> bool:
+    """초성(자음)만으로 이루어진 검색어인지 확인 (공백 무시)"""
+    chars = [ch for ch in keyword if not ch.isspace()]
+    return bool(chars) and all(ch in CHOSUNG for ch in chars)
+
+
+def has_hangul(keyword: str) -> bool:
+    return any(_is_syllable(ch) or _is_jamo(ch) for ch in keyword)
+
+
+def _successor(text: str) -> Optional[str]:
+    """text로 시작하는 문자열 전체보다 큰 가장 작은 문자열 (빈 문자열이면 상한 없음)"""
+    return text[:-1] + chr(ord(text[-1]) + 1) if text else None
+
+
+def _gram_key(gram: str) -> int:
+    key = 0
+    for ch in gram:
+        key = (key << _GRAM_SHIFT) | ord(ch)
+    return key
+
+
+def _vowel_span(vowel: str) -> Tuple[int, int]:
+    """vowel로 시작하는 중성 번호 범위 (겹모음은 바로 뒤 번호에 이어져 있음: ㅗ -> ㅗ ~ ㅗㅣ)"""
+    indexes = [i for i, v in enumerate(JUNGSUNG) if v.startswith(vowel)]
+    return indexes[0], indexes[-1]
+
+
+def _syllable_span(chosung: int, vowel: str) -> Tuple[str, str]:
+    """초성 번호 + 중성(으로 시작하는) 음절 전체의 코드 포인트 범위 [첫 글자, 끝 글자]"""
+    first, last = _vowel_span(vowel)
+    base = HANGUL_BASE + chosung * 588
+    return chr(base + first * 28), chr(base + last * 28 + 27)
+
+
+def _vowel_syllable_spans(vowel: str) -> List[Tuple[str, str]]:
+    """중성에 vowel이 들어간 음절 전체의 코드 포인트 범위 목록 (초성별, 겹모음의 뒷부분 포함)"""
+    indexes = [i for i, v in enumerate(JUNGSUNG) if vowel in v]
+    runs = [[indexes[0], indexes[0]]]
+    for i in indexes[1:]:
+        if i == runs[-1][1] + 1:
+            runs[-1][1] = i
+        else:
+            runs.append([i, i])
+    spans = []
+    for chosung in range(len(CHOSUNG)):
+        base = HANGUL_BASE + chosung * 588
+        spans += [(chr(base + first * 28), chr(base + last * 28 + 27)) for first, last in runs]
+    return spans
+
+
+def _partial_syllable_span(ch: str) -> Tuple[str, str]:
+    """입력 중인 음절 ch로 자모가 시작될 수 있는 음절 범위 (초성과 중성 앞부분이 같은 음절, 받침 무관)"""
+    offset = ord(ch) - HANGUL_BASE
+    return _syllable_span(offset // 588, JUNGSUNG[(offset % 588) // 28])
+
+
+def _chosung_span(consonant: str) -> Tuple[str, str]:
+    """초성이 consonant인 음절 전체의 코드 포인트 범위"""
+    return _syllable_span(CHOSUNG.index(consonant), "")
+
+
+def _exact_flags(keyword: str) -> List[bool]:
+    """
+    자모 매칭에서 이름의 같은 글자와 정확히 일치해야 하는 검색어 글자
+
+    한글 외 문자는 항상, 음절은 뒤에 음절/한글 외 문자가 이어질 때만 정확히 일치한다
+    (마지막 음절은 받침이 다음 음절의 초성일 수 있고, 낱자 앞 음절은 겹받침의 일부일 수 있음).
+    """
+    flags = []
+    for i, ch in enumerate(keyword):
+        if _is_jamo(ch):
+            flags.append(False)
+        elif _is_syllable(ch):
+            flags.append(i + 1 < len(keyword) and not _is_jamo(keyword[i + 1]))
+        else:
+            flags.append(True)
+    return flags
+
+
+def _jamo_patterns(keyword: str) -> Optional[List[Tuple[str, str, str]]]:
+    """
+    낱자가 없는 이름의 자모가 검색어 자모를 포함(또는 시작)하려면 이름에 있어야 하는
+    (고정 글자열, 바로 다음 글자의 첫 글자, 끝 글자) 목록 - 입력 중인 검색어 형태만 처리하고 그 외는 None
+
+    - 정확히 일치하는 글자(exact) 뒤에 입력 중인 음절 S: 초성/중성이 같은 음절 범위 ("행보" -> "행" + 보~뵣)
+    - S 뒤에 자음 낱자 L: S + 초성이 L인 음절, 또는 L이 받침에 붙은 음절 ("본ㅎ" -> "본" + 하~힣, 볺)
+    - S 뒤에 모음 낱자: S의 받침이 다음 음절 초성으로 넘어간 음절 쌍, 또는 겹모음 음절
+    - 한글 외 문자 뒤에 자음 낱자 L: 초성이 L인 음절
+    - 검색어 전체가 exact: 이름 매칭과 같으므로 빈 목록
+    """
+    flags = _exact_flags(keyword)
+    fixed = next((i for i, exact in enumerate(flags) if not exact), len(keyword))
+    head, tail = keyword[:fixed], keyword[fixed:]
+    if not tail:
+        return []
+    if len(tail) == 1 and _is_syllable(tail):
+        return [(head, *_partial_syllable_span(tail))]
+    if len(tail) == 1 and tail in CHOSUNG and head:
+        return [(head, *_chosung_span(tail))]
+    if len(tail) == 2 and _is_syllable(tail[0]) and _is_jamo(tail[1]) and not _is_vowel(tail[1]):
+        syllable, consonant = tail[0], COMPOUND_JAMO.get(tail[1], tail[1])
+        offset = ord(syllable) - HANGUL_BASE
+        base = HANGUL_BASE + offset - offset % 28
+        # 자음이 다음 음절의 초성 (겹자음 낱자는 초성이 될 수 없음)
+        patterns = [(head + syllable, *_chosung_span(consonant))] if consonant in CHOSUNG else []
+        # 자음이 받침(또는 겹받침의 뒷부분)으로 붙은 음절
+        jong = JONGSUNG[offset % 28] + consonant
+        merged = [i for i, j in enumerate(JONGSUNG) if j and j.startswith(jong)]
+        if merged:
+            patterns.append((head, chr(base + merged[0]), chr(base + merged[-1])))
+        return patterns
+    if len(tail) == 2 and _is_syllable(tail[0]) and _is_vowel(tail[1]):
+        syllable, vowel = tail[0], COMPOUND_JAMO.get(tail[1], tail[1])
+        offset = ord(syllable) - HANGUL_BASE
+        base = HANGUL_BASE + offset - offset % 28
+        jung, jong = JUNGSUNG[(offset % 588) // 28], JONGSUNG[offset % 28]
+        if jong:
+            # 받침(겹받침은 뒷부분)이 다음 음절의 초성으로 넘어감 ("김ㅐ" -> "기" + 매~맿)
+            kept, moved = jong[:-1], jong[-1]
+            return [(head + chr(base + JONGSUNG.index(kept)), *_syllable_span(CHOSUNG.index(moved), vowel))]
+        # 받침 없는 음절 + 모음 낱자: 겹모음 음절 ("고ㅏ" -> 과~괗)
+        if any(v.startswith(jung + vowel) for v in JUNGSUNG):
+            return [(head, *_syllable_span(offset // 588, jung + vowel))]
+        return []
+    return None
+
+
+def _iter_rows(rows: np.ndarray, chunk: int = 256) -> Iterator[int]:
+    """행 번호 배열을 앞에서부터 필요한 만큼만 Python int로 바꿔 순회 (긴 포스팅 전체를 변환하지 않음)"""
+    for start in range(0, len(rows), chunk):
+        yield from rows[start:start + chunk].tolist()
+
+
+def _lower_code_points(names: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    이름 목록을 소문자로 바꿔 이어 붙인 코드 포인트 배열과 이름별 길이
+
+    이름마다 문자열을 새로 만들지 않도록 전체를 한 번에 소문자화하고,
+    길이가 바뀌는 문자(İ)나 문맥에 따라 바뀌는 문자(Σ)가 있을 때만 이름별로 변환한다.
+    """
+    joined = "".join(names)
+    lowered = joined.lower()
+    if len(lowered) != len(joined) or "Σ" in joined:
+        names = [name.lower() for name in names]
+        lowered = "".join(names)
+    lengths = np.fromiter(map(len, names), dtype=np.int64, count=len(names))
+    return np.frombuffer(lowered.encode("utf-32-le"), dtype=np.uint32), lengths
+
+
+def _offsets(lengths: np.ndarray) -> np.ndarray:
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    return offsets
+
+
+def _sorted_entries(codes: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """
+    항목을 문자열 순(같으면 항목 번호 순)으로 정렬한 항목 번호 (int32)
+
+    Python 문자열을 만들지 않도록 코드 포인트 3개(+1, 끝은 0)를 int64 키 하나로 묶어
+    앞에서부터 정렬하고, 다음 단계에서는 아직 동순위인 항목만 다시 정렬한다.
+    """
+    n = len(offsets) - 1
+    starts, lengths = offsets[:-1], np.diff(offsets)
+    order = np.arange(n, dtype=np.int64)
+    group = np.zeros(n, dtype=np.int64)  # 정렬 위치별 동순위 그룹 (그룹 첫 위치)
+    active = np.arange(n, dtype=np.int64)  # 아직 순서가 정해지지 않은 정렬 위치
+    depth = 0
+    while len(active):
+        entries = order[active]
+        key = np.zeros(len(active), dtype=np.int64)
+        for k in range(3):
+            valid = depth + k < lengths[entries]
+            chars = np.where(valid, codes[np.minimum(starts[entries] + depth + k, len(codes) - 1)].astype(np.int64) + 1, 0)
+            key = (key << _GRAM_SHIFT) | chars
+        idx = np.lexsort((key, group[active]))
+        entries, key = entries[idx], key[idx]
+        order[active] = entries
+
+        groups = group[active]
+        first = np.ones(len(active), dtype=bool)
+        first[1:] = (groups[1:] != groups[:-1]) | (key[1:] != key[:-1])
+        first_idx = np.flatnonzero(first)
+        sizes = np.diff(np.append(first_idx, len(active)))
+        group[active] = np.repeat(active[first_idx], sizes)
+        # 동순위가 남아 있고 이번 키 안에서 문자열이 끝나지 않은 그룹만 다음 글자로 (동순위 항목의 끝 여부는 같음)
+        active = active[np.repeat(sizes > 1, sizes) & (lengths[entries] >= depth + 3)]
+        depth += 3
+    return order.astype(np.int32)
+
+
+class _Postings:
+    """n-gram -> 행 번호 목록 (CSR: 정렬된 gram 키, 키별 시작 오프셋, int32 행 번호)"""
+    __slots__ = ('keys', 'offsets', 'rows')
+
+    def __init__(self, codes: np.ndarray, entry_of: np.ndarray, entry_rows: np.ndarray,
+                 ends: np.ndarray, n: int):
+        starts = np.flatnonzero(np.arange(len(codes)) + n <= ends[entry_of])
+        keys = codes[starts].astype(np.int64)
+        for k in range(1, n):
+            keys = (keys << _GRAM_SHIFT) | codes[starts + k]
+        rows = entry_rows[entry_of[starts]]
+        del starts
+
+        # gram 순 정렬 (stable이므로 같은 gram 안에서는 행 오름차순 = 파일 순서 유지) 후 (gram, 행) 중복 제거
+        order = np.argsort(keys, kind='stable')
+        keys, rows = keys[order], rows[order]
+        del order
+        keep = np.ones(len(keys), dtype=bool)
+        keep[1:] = (keys[1:] != keys[:-1]) | (rows[1:] != rows[:-1])
+        keys, rows = keys[keep], rows[keep]
+
+        first = np.ones(len(keys), dtype=bool)
+        first[1:] = keys[1:] != keys[:-1]
+        starts = np.flatnonzero(first)
+        self.keys = keys[starts]
+        self.offsets = np.append(starts, len(keys))
+        self.rows = rows.astype(np.int32)
+
+    def get(self, gram: str) -> Optional[np.ndarray]:
+        key = _gram_key(gram)
+        i = int(np.searchsorted(self.keys, key))
+        if i == len(self.keys) or self.keys[i] != key:
+            return None
+        return self.rows[self.offsets[i]:self.offsets[i + 1]]
+
+    def range_rows(self, ranges: List[Tuple[str, str]]) -> np.ndarray:
+        """gram 범위 [첫 gram, 끝 gram] 중 하나라도 포함하는 행 번호 (오름차순, 중복 없음)"""
+        lo = np.searchsorted(self.keys, [_gram_key(first) for first, _ in ranges], side='left')
+        hi = np.searchsorted(self.keys, [_gram_key(last) for _, last in ranges], side='right')
+        return np.unique(np.concatenate(
+            [self.rows[self.offsets[a]:self.offsets[b]] for a, b in zip(lo, hi)] or [self.rows[:0]]
+        ))
+
+
+class _TextTable:
+    """
+    레코드별 문자열(항목, 행마다 1~2개) 목록에 대한 접두사 / n-gram 포함 검색 테이블
+
+    항목은 행 순서대로 이어 붙인 문자열 하나에 저장하고, 항목 -> 행 번호, 정렬 순서,
+    포스팅은 모두 numpy 배열로 보관한다 (공유 메모리 세대에 그대로 게시할 수 있는 형태).
+    """
+
+    def __init__(self, codes: np.ndarray, offsets: np.ndarray, entry_rows: np.ndarray,
+                 row_entries: np.ndarray, max_gram: int):
+        self.text = codes.tobytes().decode("utf-32-le")
+        self.offsets = offsets
+        self.entry_rows = entry_rows
+        self.row_entries = row_entries  # 행 r의 항목: row_entries[r] ~ row_entries[r + 1]
+
+        # 접두사 검색용 정렬 순서 (정규화 이름 순)
+        self.order = _sorted_entries(codes, offsets)
+
+        entry_of = np.repeat(np.arange(len(entry_rows), dtype=np.int32), np.diff(offsets))
+        ends = offsets[1:]
+        self.grams = [_Postings(codes, entry_of, entry_rows, ends, n) for n in range(1, max_gram + 1)]
+
+    def entry(self, i) -> str:
+        return self.text[self.offsets[i]:self.offsets[i + 1]]
+
+    def scan(self, lower: str, upper: Optional[str]) -> Iterator[int]:
+        """lower <= 항목 < upper 인 항목 번호를 정렬 순서대로 (필요한 만큼만 확인)"""
+        order = self.order
+        for i in range(bisect_left(order, lower, key=self.entry), len(order)):
+            entry = order[i]
+            if upper is not None and self.entry(entry) >= upper:
+                return
+            yield entry
+
+    def prefix_rows(self, prefix: str) -> Iterator[int]:
+        """prefix로 시작하는 항목의 행 번호 (이름 순, 같은 행이 여러 번 나올 수 있음)"""
+        for entry in self.scan(prefix, _successor(prefix)):
+            yield int(self.entry_rows[entry])
+
+    def contains_candidates(self, keyword: str) -> Iterator[int]:
+        """
+        keyword를 포함하는 행 번호를 파일 순서대로 생성
+
+        keyword의 n-gram 중 포스팅이 가장 짧은 것만 후보로 순회하며
+        실제 포함 여부로 확인하므로, 필요한 개수만큼만 검사하고 멈출 수 있다.
+        """
+        n = min(len(keyword), len(self.grams))
+        postings = self.grams[n - 1]
+        lists = [postings.get(keyword[i:i + n]) for i in range(len(keyword) - n + 1)]
+        if not lists or any(rows is None for rows in lists):
+            return
+        rows = min(lists, key=len)
+        exact = len(keyword) == n  # gram이 곧 검색어면 포스팅이 곧 결과
+        for row in _iter_rows(rows):
+            if exact or any(keyword in text for text in self.row_texts(row)):
+                yield row
+
+    def pattern_rows(self, patterns: List[Tuple[str, str, str]]) -> np.ndarray:
+        """(고정 글자열, 다음 글자 범위) 패턴을 포함할 수 있는 행 번호 - 고정 글자열 끝 (n-1)글자 + 범위의 n-gram 포스팅"""
+        by_length = {}
+        for head, first, last in patterns:
+            head = head[len(head) - min(len(head), len(self.grams) - 1):]
+            by_length.setdefault(len(head) + 1, []).append((head + first, head + last))
+        rows = [self.grams[n - 1].range_rows(ranges) for n, ranges in by_length.items()]
+        return rows[0] if len(rows) == 1 else np.unique(np.concatenate(rows or [np.zeros(0, np.int32)]))
+
+    def row_texts(self, row: int) -> Iterator[str]:
+        for entry in range(self.row_entries[row], self.row_entries[row + 1]):
+            yield self.entry(entry)
+
+
+class BusinessSearchIndex:
+    def __init__(self, merchants: pd.DataFrame):
+        # 결과 레코드는 가맹점 프레임 컬럼에서 결과 행만 꺼내 만든다 (행별 dict를 미리 만들지 않음)
+        self._columns = [merchants[col] for col in RESULT_COLUMNS]
+        self._row_count = len(merchants)
+        # 같은 ENCODED_MCT는 한 번만 (결측은 행마다 다른 값으로 취급)
+        codes, _ = pd.factorize(merchants['ENCODED_MCT'])
+        self._mct_codes = np.where(codes < 0, -1 - np.arange(len(codes)), codes).astype(np.int32)
+
+        # 검색 비교 대상: 소문자 이름, 별표(*)를 제거한 소문자 이름 (다를 때만) - 행 순서대로 항목 1~2개
+        n = len(merchants)
+        lower, lengths = _lower_code_points(merchants['MCT_NM'].astype(str).tolist())
+        char_rows = np.repeat(np.arange(n), lengths)
+        star = lower == ord('*')
+        stars = np.bincount(char_rows[star], minlength=n)
+        masked = stars > 0
+
+        entry_rows = np.repeat(np.arange(n, dtype=np.int32), 1 + masked)
+        row_entries = _offsets(1 + masked.astype(np.int64))
+        first_entry = row_entries[:-1]
+        entry_lengths = np.empty(len(entry_rows), dtype=np.int64)
+        entry_lengths[first_entry] = lengths
+        entry_lengths[first_entry[masked] + 1] = (lengths - stars)[masked]
+        offsets = _offsets(entry_lengths)
+
+        codes = np.empty(offsets[-1], dtype=np.uint32)
+        row_starts = _offsets(lengths)[:-1]
+        codes[offsets[first_entry][char_rows] + np.arange(len(lower)) - row_starts[char_rows]] = lower
+        # 별표 제거 항목: 행 안에서 별표가 아닌 글자의 순번 위치로
+        kept = masked[char_rows] & ~star
+        nonstar = _offsets((~star).astype(np.int64))
+        kept_rank = nonstar[:-1] - nonstar[row_starts][char_rows]
+        codes[offsets[first_entry[char_rows[kept]] + 1] + kept_rank[kept]] = lower[kept]
+        del lower, char_rows, star, kept, nonstar, kept_rank
+
+        self.names = _TextTable(codes, offsets, entry_rows, row_entries, MAX_GRAM)
+
+        entry_of = np.repeat(np.arange(len(entry_rows), dtype=np.int32), np.diff(offsets))
+        # 낱자(호환용 자모)가 들어간 이름: 자모 분해 결과가 음절 이름과 겹칠 수 있어 자모 검색 시 항상 직접 확인
+        jamo = (codes >= JAMO_FIRST) & (codes <= JAMO_LAST)
+        self._irregular_rows = np.unique(entry_rows[entry_of[jamo]])
+
+        # 초성 문자열: 음절 -> 초성, 공백 제거
+        syllable = (codes >= HANGUL_BASE) & (codes <= HANGUL_LAST)
+        folded = codes.copy()
+        folded[syllable] = _CHOSUNG_CODES[(codes[syllable] - HANGUL_BASE) // 588]
+        kept = ~np.isin(codes, _SPACE_CODES)
+        chosung_offsets = np.zeros(len(entry_rows) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(entry_of[kept], minlength=len(entry_rows)), out=chosung_offsets[1:])
+        del entry_of, syllable
+        self.chosung = _TextTable(folded[kept], chosung_offsets, entry_rows, row_entries, CHOSUNG_MAX_GRAM)
+
+    # ========== 자모(입력 중인 음절) 매칭 ==========
+    def _jamo_rows(self, entries: Iterator[int], jamo: str, prefix: bool) -> Iterator[int]:
+        for entry in entries:
+            texts = to_jamo(self.names.entry(entry))
+            if texts.startswith(jamo) if prefix else jamo in texts:
+                yield int(self.names.entry_rows[entry])
+
+    def _row_has_jamo(self, row: int, jamo: str, prefix: bool) -> bool:
+        for text in self.names.row_texts(row):
+            text = to_jamo(text)
+            if text.startswith(jamo) if prefix else jamo in text:
+                return True
+        return False
+
+    def _jamo_prefix_matches(self, keyword: str) -> Iterator[int]:
+        """
+        자모 분해 문자열이 검색어 자모로 시작하는 행 (이름 순, 낱자가 들어간 이름은 마지막에 파일 순)
+
+        _jamo_patterns의 (고정 글자열 + 다음 글자 범위)로 정렬 순서의 구간만 확인하고,
+        패턴으로 좁힐 수 없는 검색어는 정확히 일치하는 앞부분 + 이어지는 첫 글자의 음절 범위를 확인한다.
+        """
+        jamo = to_jamo(keyword)
+        patterns = _jamo_patterns(keyword)
+        if patterns is None:
+            # 정확히 일치하는 앞부분 뒤의 첫 글자로만 좁힘 (모음/겹자음 낱자로 이어지는 음절 이름은 없음)
+            fixed = _exact_flags(keyword).index(False)
+            head, ch = keyword[:fixed], keyword[fixed]
+            spans = [_partial_syllable_span(ch)] if _is_syllable(ch) else [_chosung_span(ch)] if ch in CHOSUNG else []
+            ranges = [(head + first, head + chr(ord(last) + 1)) for first, last in spans]
+        else:
+            ranges = [(head + first, head + chr(ord(last) + 1)) for head, first, last in patterns]
+
+        for lower, upper in ranges:
+            yield from self._jamo_rows(self.names.scan(lower, upper), jamo, prefix=True)
+        for row in self._irregular_rows.tolist():
+            if self._row_has_jamo(row, jamo, prefix=True):
+                yield row
+
+    def _jamo_contains_candidates(self, keyword: str) -> Iterator[int]:
+        """
+        자모 포함 매칭 후보 행 (파일 순서, 낱자가 들어간 이름 제외)
+
+        _jamo_patterns가 있으면 패턴의 n-gram 범위 포스팅, 없으면 정확히 일치해야 하는 가장 긴 글자 구간의
+        포함 검색 결과, 그것도 없으면 첫 음절(또는 자음+모음 낱자, 모음 낱자)이 들어갈 수 있는 음절 범위를 후보로 쓴다.
+        """
+        patterns = _jamo_patterns(keyword)
+        if patterns is not None:
+            return _iter_rows(self.names.pattern_rows(patterns))
+
+        flags = _exact_flags(keyword)
+        best, start = (0, 0), None
+        for i, exact in enumerate(chain(flags, [False])):
+            if exact and start is None:
+                start = i
+            elif not exact and start is not None:
+                best = max(best, (i - start, -start))
+                start = None
+        if best[0]:
+            begin = -best[1]
+            return self.names.contains_candidates(keyword[begin:begin + best[0]])
+
+        syllable = next((ch for ch in keyword if _is_syllable(ch)), None)
+        jamo = to_jamo(keyword)
+        pair = next(((ch, nxt) for ch, nxt in zip(jamo, jamo[1:]) if ch in CHOSUNG and _is_vowel(nxt)), None)
+        vowel = next((ch for ch in jamo if _is_vowel(ch)), None)
+        if syllable is not None:
+            spans = [_partial_syllable_span(syllable)]
+        elif pair is not None:
+            spans = [_syllable_span(CHOSUNG.index(pair[0]), pair[1])]
+        elif vowel is not None:
+            spans = _vowel_syllable_spans(vowel)
+        else:
+            return iter(range(self._row_count))  # 겹자음 낱자만 있는 검색어 등: 전체 확인
+        return _iter_rows(self.names.pattern_rows([("", first, last) for first, last in spans]))
+
+    def _jamo_contains_matches(self, keyword: str, exclude: set) -> Iterator[int]:
+        jamo = to_jamo(keyword)
+        candidates = merge(self._jamo_contains_candidates(keyword), self._irregular_rows.tolist())
+        previous = None
+        for row in candidates:
+            if row != previous and row not in exclude and self._row_has_jamo(row, jamo, prefix=False):
+                yield row
+            previous = row
+
+    # ========== 순위 ==========
+    def _ranked_matches(self, keyword: str) -> Iterator[int]:
+        """
+        순위대로 행 번호 생성 (앞 순위를 모두 낸 뒤에만 다음 순위를 확인하므로 필요한 만큼만 계산)
+        1) 이름 시작 매칭  2) 초성/자모 시작 매칭  3) 이름 포함 매칭  4) 초성/자모 포함 매칭
+        시작 매칭은 이름 순, 포함 매칭은 파일 순
+        """
+        emitted = set()
+        prefix_tiers = [self.names.prefix_rows(keyword)]
+        contains_tiers = [self.names.contains_candidates(keyword)]
+        if is_chosung_query(keyword):
+            query = to_chosung(keyword)
+            prefix_tiers.append(self.chosung.prefix_rows(query))
+            contains_tiers.append(self.chosung.contains_candidates(query))
+        elif has_hangul(keyword):
+            prefix_tiers.append(self._jamo_prefix_matches(keyword))
+            contains_tiers.append(self._jamo_contains_matches(keyword, emitted))
+
+        for row in chain(*prefix_tiers, *contains_tiers):
+            if row not in emitted:
+                emitted.add(row)
+                yield row
+
+    def search(self, keyword: str, limit: int = 10) -> list[dict]:
+        """시작 매칭 우선, 그 다음 포함 매칭 (같은 ENCODED_MCT는 한 번만)"""
+        keyword = keyword.strip().lower()
+        if not keyword:
+            return []
+
+        seen = set()
+        rows = []
+        for row in self._ranked_matches(keyword):
+            code = int(self._mct_codes[row])
+            if code in seen:
+                continue
+            seen.add(code)
+            rows.append(row)
+            if len(rows) >= limit:
+                break
+
+        values = [column.iloc[rows].tolist() for column in self._columns]
+        return [
+            {'encoded_mct': mct, 'name': name, 'area': area, 'business_type': business_type}
+            for mct, name, area, business_type in zip(*values)
+        ]
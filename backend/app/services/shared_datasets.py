@@ -0,0 +1,188 @@
+"""
+워커 프로세스 간 데이터셋 공유 (공유 메모리 디렉토리 + 버전 헤더)
+
+uvicorn 워커마다 CSV를 따로 읽으면 메모리가 워커 수에 비례해 늘어나므로,
+로더(처음 잠금을 잡은 워커 또는 CLI) 하나만 데이터셋을 읽어 공유 디렉토리에 세대(generation)로 게시하고
+나머지 워커는 같은 파일을 mmap(읽기 전용)으로 연결한다.
+공유 디렉토리를 tmpfs(/dev/shm)에 두면 모든 워커가 같은 물리 메모리 페이지를 사용한다.
+
+- 세대 디렉토리: 데이터셋별 컬럼 .npy (data_snapshot.write_columns 형식, 문자열은 사전 인코딩)
+- HEADER.json: 현재 세대와 버전, 원본 CSV 서명 - 세대를 모두 쓴 뒤 os.replace로 교체 (안전한 교체)
+- 세대 디렉토리는 만든 뒤 수정하지 않으며, 직전 세대까지만 남기고 삭제
+  (이미 mmap한 워커는 삭제 후에도 기존 페이지를 그대로 사용)
+- 게시/최초 로드는 .publish.lock 파일 잠금으로 한 번에 한 프로세스만 실행
+
+공유되는 것은 원본 데이터셋 4개의 컬럼 배열(숫자 값, 문자열 코드)뿐이다.
+다음은 공유 프레임에서 워커마다 따로 만들어지므로 워커 수에 비례해 늘어난다:
+문자열 컬럼의 카테고리 값, 벤치마크 집계(merged_df, 큐브 기본 행, 업종/월별 통계)와
+그 계산 중의 임시 사본, 가게 이름 검색 인덱스, 가맹점 메타데이터(MerchantInfo) 레지스트리,
+merchant_ids 문자열 -> id 사전과 데이터셋별 id 배열, usage/risk 조회 인덱스, 응답 캐시.
+
+사용법 (backend 디렉토리에서, SHARED_DATA_DIR 설정 필요):
+    python -m app.services.shared_datasets   # 원본에서 읽어 새 세대 게시
+"""
+import json
+import os
+import shutil
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+import pandas as pd
+
+from app.config import settings
+from app.services.data_snapshot import DATASETS, read_columns, source_signatures, write_columns
+
+try:
+    import fcntl
+except ImportError:  # Windows: 잠금 없이 동작 (동시에 게시해도 세대 이름이 겹치지 않음)
+    fcntl = None
+
+# 공유 세대 포맷 버전 - 저장 구조가 바뀌면 올려서 기존 세대를 무효화
+SHARED_FORMAT = 1
+HEADER_FILE = "HEADER.json"
+LOCK_FILE = ".publish.lock"
+KEEP_GENERATIONS = 2  # 현재 + 직전 세대 (연결 중인 워커 보호)
+ATTACH_RETRIES = 3
+
+
+class SharedDatasets:
+    """공유 디렉토리 하나 (프로세스마다 인스턴스 하나)"""
+
+    def __init__(self, root: str):
+        self.root = root
+
+    # ========== 버전 헤더 ==========
+    def read_header(self) -> Optional[Dict]:
+        """현재 헤더 (없거나 포맷이 다르면 None)"""
+        try:
+            with open(os.path.join(self.root, HEADER_FILE), "r", encoding="utf-8") as f:
+                header = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return header if header.get("format") == SHARED_FORMAT else None
+
+    def is_fresh(self, header: Optional[Dict], data_dir: Optional[str] = None) -> bool:
+        """헤더의 세대가 현재 원본 CSV에서 만들어졌는지 (원본이 바뀌었으면 다시 게시해야 함)"""
+        return header is not None and header.get("signatures") == source_signatures(data_dir)
+
+    @contextmanager
+    def _publish_lock(self):
+        os.makedirs(self.root, exist_ok=True)
+        with open(os.path.join(self.root, LOCK_FILE), "a+") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+
+    # ========== 게시 ==========
+    def publish(self, frames: Dict[str, pd.DataFrame], signatures: Dict[str, Dict]) -> Dict:
+        """
+        데이터셋들을 새 세대로 쓰고 헤더 교체 (잠금은 호출자가 잡거나 publish_locked 사용)
+
+        Args:
+            frames: 데이터셋 이름 -> DataFrame
+            signatures: 데이터의 기준이 된 원본 CSV 서명
+
+        Returns:
+            새 헤더
+        """
+        previous = self.read_header()
+        version = (previous["version"] if previous else 0) + 1
+        generation = f"gen-{version:06d}-{os.getpid()}"
+        target = os.path.join(self.root, generation)
+        os.makedirs(target, exist_ok=True)
+        for name, df in frames.items():
+            write_columns(df, os.path.join(target, name), {"format": SHARED_FORMAT, "dataset": name})
+
+        header = {
+            "format": SHARED_FORMAT,
+            "version": version,
+            "generation": generation,
+            "datasets": {name: len(df) for name, df in frames.items()},
+            "signatures": signatures,
+            "published_at": datetime.now().isoformat(),
+            "publisher_pid": os.getpid(),
+        }
+        tmp_path = os.path.join(self.root, f"{HEADER_FILE}.tmp-{os.getpid()}")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(header, f, ensure_ascii=False)
+        os.replace(tmp_path, os.path.join(self.root, HEADER_FILE))
+
+        keep = {generation, previous["generation"] if previous else None}
+        self._remove_generations(keep)
+        print(f"[OK] 공유 데이터 세대 게시: {generation} (버전 {version})")
+        return header
+
+    def publish_locked(self, frames: Dict[str, pd.DataFrame], signatures: Dict[str, Dict]) -> Dict:
+        with self._publish_lock():
+            return self.publish(frames, signatures)
+
+    def _remove_generations(self, keep: set) -> None:
+        for entry in os.listdir(self.root):
+            if entry.startswith("gen-") and entry not in keep:
+                shutil.rmtree(os.path.join(self.root, entry), ignore_errors=True)
+
+    # ========== 연결 ==========
+    def attach(self, header: Dict) -> Dict[str, pd.DataFrame]:
+        """헤더가 가리키는 세대의 데이터셋을 mmap(읽기 전용)으로 연결"""
+        base = os.path.join(self.root, header["generation"])
+        frames = {}
+        for name in header["datasets"]:
+            with open(os.path.join(base, name, "meta.json"), "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            frames[name] = read_columns(os.path.join(base, name), meta)
+        return frames
+
+    def load_or_publish(self, data_dir: Optional[str], loader,
+                        force: bool = False) -> Tuple[Dict, Dict[str, pd.DataFrame]]:
+        """
+        최신 세대에 연결하고, 없거나 원본보다 오래되었으면(force면 항상) 직접 읽어 게시한 뒤 연결
+
+        Args:
+            data_dir: 원본 CSV 디렉토리 (세대 신선도 판단용)
+            loader: 데이터셋 이름 -> DataFrame을 반환하는 함수 (게시할 때만 호출)
+            force: 최신 세대가 있어도 원본에서 다시 읽어 게시
+
+        Returns:
+            (헤더, 데이터셋 이름 -> 공유 DataFrame)
+        """
+        for attempt in range(ATTACH_RETRIES):
+            with self._publish_lock():
+                header = self.read_header()
+                if force or not self.is_fresh(header, data_dir):
+                    signatures = source_signatures(data_dir)
+                    header = self.publish({name: loader(name) for name in DATASETS}, signatures)
+                    force = False
+            try:
+                return header, self.attach(header)
+            except FileNotFoundError:
+                # 연결 직전에 다른 프로세스가 두 세대 이상 게시해 디렉토리가 삭제된 경우
+                time.sleep(0.1 * (attempt + 1))
+        raise RuntimeError(f"공유 데이터 세대에 연결하지 못했습니다: {self.root}")
+
+    def status(self) -> Dict:
+        header = self.read_header()
+        return {
+            "root": self.root,
+            "version": header["version"] if header else None,
+            "generation": header["generation"] if header else None,
+            "published_at": header["published_at"] if header else None,
+        }
+
+
+# 싱글톤 인스턴스 (SHARED_DATA_DIR가 비어 있으면 공유하지 않음)
+shared_datasets: Optional[SharedDatasets] = (
+    SharedDatasets(settings.shared_data_dir) if settings.shared_data_dir else None
+)
+
+
+if __name__ == "__main__":
+    if shared_datasets is None:
+        raise SystemExit("[ERROR] SHARED_DATA_DIR가 설정되지 않았습니다.")
+    from app.services.data_snapshot import load_frame
+    shared_datasets.load_or_publish(None, load_frame, force=True)
@@ -0,0 +1,104 @@
+"""
+테스트용 합성 데이터셋 (원본 CSV는 저장소에 포함되지 않으므로 같은 형식으로 생성)
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services.data_snapshot import DATASETS
+
+MONTHS = [202401, 202402, 202403, 202404, 202405, 202406]
+INDUSTRIES = ["카페", "치킨", "한식-육류/고기", "호프/맥주", "식료품", "축산물"]
+DISTRICTS = ["마장동", "왕십리", "성수동", None]
+BUCKETS = ["1_10%이하", "2_10-25%", "3_25-50%", "4_50-75%", "5_75-90%", "6_90%초과"]
+NAME_SYLLABLES = list("행복카페김밥고과본닭치킨")
+CUSTOMER_COLUMNS = [
+    f"M12_{gender}_{age}_RAT" for gender in ("MAL", "FME") for age in ("1020", "30", "40", "50", "60")
+] + [
+    "MCT_UE_CLN_REU_RAT", "MCT_UE_CLN_NEW_RAT",
+    "RC_M1_SHC_RSD_UE_CLN_RAT", "RC_M1_SHC_WP_UE_CLN_RAT", "RC_M1_SHC_FLP_UE_CLN_RAT",
+]
+
+
+def _numbers(rng, n: int, low: float, high: float, missing: float = 0.05) -> np.ndarray:
+    """소수 첫째 자리 값 (결측 표시값 -999999.9 포함)"""
+    values = np.round(rng.uniform(low, high, n), 1)
+    values[rng.random(n) < missing] = -999999.9
+    return values
+
+
+def make_datasets(merchant_count: int = 300, seed: int = 0) -> dict:
+    """가맹점/이용/고객/위험도 데이터셋 (월 데이터는 기준년월 순서로 이어 붙인 형태)"""
+    rng = np.random.default_rng(seed)
+    ids = [f"{i:010X}" for i in rng.choice(16 ** 8, merchant_count, replace=False)]
+    names = [
+        "".join(rng.choice(NAME_SYLLABLES, rng.integers(2, 5))) + ("**" if rng.random() < 0.3 else "")
+        for _ in ids
+    ]
+    merchants = pd.DataFrame({
+        "ENCODED_MCT": ids,
+        "MCT_BSE_AR": "서울 성동구",
+        "MCT_NM": names,
+        "MCT_BRD_NUM": np.nan,
+        "MCT_SIGUNGU_NM": "서울 성동구",
+        "HPSN_MCT_ZCD_NM": rng.choice(INDUSTRIES, merchant_count),
+        "HPSN_MCT_BZN_CD_NM": rng.choice(np.array(DISTRICTS, dtype=object), merchant_count),
+        "ARE_D": 20200101,
+        "MCT_ME_D": np.nan,
+    })
+
+    # 가맹점마다 시작 월이 달라 월별 행 수가 다름
+    start = rng.integers(0, 3, merchant_count)
+    rows = [(mct, ym) for ym in MONTHS for mct, s in zip(ids, start) if ym >= MONTHS[s]]
+    mcts, yms = [mct for mct, _ in rows], np.array([ym for _, ym in rows])
+    n = len(rows)
+
+    usage = pd.DataFrame({
+        "ENCODED_MCT": mcts, "TA_YM": yms,
+        **{col: rng.choice(BUCKETS, n) for col in (
+            "MCT_OPE_MS_CN", "RC_M1_SAA", "RC_M1_TO_UE_CT", "RC_M1_UE_CUS_CN", "RC_M1_AV_NP_AT", "APV_CE_RAT",
+        )},
+        "DLV_SAA_RAT": _numbers(rng, n, 0, 60, 0.4),
+        "M1_SME_RY_SAA_RAT": _numbers(rng, n, 0, 400),
+        "M1_SME_RY_CNT_RAT": _numbers(rng, n, 0, 400),
+        "M12_SME_RY_SAA_PCE_RT": _numbers(rng, n, 0, 100),
+        "M12_SME_BZN_SAA_PCE_RT": _numbers(rng, n, 0, 100),
+        "M12_SME_RY_ME_MCT_RAT": _numbers(rng, n, 0, 20),
+        "M12_SME_BZN_ME_MCT_RAT": _numbers(rng, n, 0, 20),
+    })
+    customers = pd.DataFrame({
+        "ENCODED_MCT": mcts, "TA_YM": yms,
+        **{col: _numbers(rng, n, 0, 30) for col in CUSTOMER_COLUMNS},
+    })
+
+    risks = np.round(rng.random((n, 3)), 6)
+    risk_score = np.round(risks.mean(axis=1), 6)
+    p_model = np.round(rng.random(n), 6)
+    p_final = np.round((p_model + risk_score) / 2, 6)
+    risk = pd.DataFrame({
+        "ENCODED_MCT": mcts,
+        "TA_YM": [f"{ym // 100}-{ym % 100:02d}-01" for ym in yms],
+        "Sales_Risk": risks[:, 0], "Customer_Risk": risks[:, 1], "Market_Risk": risks[:, 2],
+        "RiskScore": risk_score, "p_model": p_model, "p_final": p_final,
+        "Alert": np.select([p_final < 0.3, p_final < 0.5, p_final < 0.7], ["GREEN", "YELLOW", "ORANGE"], "RED"),
+    })
+    return {"merchants": merchants, "usage": usage, "customers": customers, "risk": risk}
+
+
+def month_rows(name: str, df: pd.DataFrame, ta_ym: int) -> pd.Series:
+    """해당 기준년월 행 마스크 (risk는 "YYYY-MM-01" 표기)"""
+    if name == "risk":
+        return df["TA_YM"] == f"{ta_ym // 100}-{ta_ym % 100:02d}-01"
+    return df["TA_YM"] == ta_ym
+
+
+def write_datasets(data_dir, datasets: dict) -> None:
+    """데이터셋 형식(파일명/인코딩)대로 CSV 저장"""
+    for name, df in datasets.items():
+        filename, encoding = DATASETS[name]
+        df.to_csv(data_dir / filename, index=False, encoding=encoding)
+
+
+@pytest.fixture(scope="session")
+def datasets() -> dict:
+    return make_datasets()
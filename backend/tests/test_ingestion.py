@@ -0,0 +1,191 @@
+"""
+월 단위 추가(ingest)와 리로드 - 전체 CSV를 새로 로드한 결과와 같은지 비교
+"""
+import math
+
+import pandas as pd
+import pytest
+
+from app.services.data_context import DataReloader
+from app.services.data_snapshot import DATASETS, read_csv
+from app.services.data_store import MerchantDataStore
+from app.services.diagnosis_service import DiagnosisService
+
+from conftest import MONTHS, month_rows, write_datasets
+
+LAST_MONTH = MONTHS[-1]
+MONTHLY = ("usage", "customers", "risk")
+
+
+def split_last_month(datasets: dict) -> tuple:
+    """(마지막 월을 뺀 데이터셋, 마지막 월 행)"""
+    before, last = dict(datasets), {}
+    for name in MONTHLY:
+        rows = month_rows(name, datasets[name], LAST_MONTH)
+        before[name] = datasets[name][~rows].reset_index(drop=True)
+        last[name] = datasets[name][rows].reset_index(drop=True)
+    return before, last
+
+
+def make_reloader(data_dir) -> DataReloader:
+    reloader = DataReloader(MerchantDataStore(str(data_dir), str(data_dir / ".snapshot")))
+    reloader.initialize()
+    return reloader
+
+
+def comparable(value):
+    """NaN은 NaN끼리 같지 않으므로 None으로 바꿔 비교"""
+    if isinstance(value, dict):
+        return {key: comparable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [comparable(item) for item in value]
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    return value
+
+
+def responses(context, encoded_mcts: list) -> dict:
+    """API가 읽는 값 (진단 created_at 제외)"""
+    calc, store = context.benchmark_calc, context.store
+    diagnoses, not_found = DiagnosisService(store).build_latest_diagnoses(encoded_mcts)
+    for item in diagnoses:
+        item["diagnosis"].pop("created_at")
+    return comparable({
+        "benchmarks": calc.get_all_industry_benchmarks(),
+        "category": calc.get_benchmark_for_industry("cafe"),
+        "regional": calc.get_regional_benchmark("카페", "성동구", "성수동"),
+        "percentiles": calc.get_percentiles("카페", safety_score=50, revenue=3e7, customers=800),
+        "trend": [calc.get_trend(industry, window) for industry in (None, "cafe", "치킨") for window in (1, 3)],
+        "alerts": [calc.get_alert_distribution("치킨", month) for month in (None, MONTHS[0], LAST_MONTH)],
+        "scatter": [calc.get_scatter_data("cafe", 30, mode) for mode in ("random", "grid", "histogram")],
+        "customer_mix": calc.get_customer_mix("cafe", "성동구"),
+        "customer_compare": calc.compare_customer_mix(encoded_mcts[0]),
+        "diagnoses": (diagnoses, not_found),
+        "history": [store.get_risk_history(mct) for mct in encoded_mcts],
+        "usage": [store.get_usage(mct, LAST_MONTH) for mct in encoded_mcts],
+        "search": store.search_index.search("행", limit=50),
+    })
+
+
+@pytest.fixture()
+def full_datasets(datasets) -> dict:
+    """ingest(persist) 후 저장되는 파일과 같은 순서의 전체 데이터 (기존 행 뒤에 새 월)"""
+    before, last = split_last_month(datasets)
+    return {
+        "merchants": datasets["merchants"],
+        **{name: pd.concat([before[name], last[name]], ignore_index=True) for name in MONTHLY},
+    }
+
+
+@pytest.fixture()
+def split_dirs(tmp_path, datasets, full_datasets):
+    """
+    (전체 데이터 디렉토리, 마지막 월을 뺀 데이터 디렉토리, 마지막 월 행)
+    마지막 월 행은 관리자 API와 같이 업로드 CSV를 read_csv로 읽은 값
+    """
+    before, last = split_last_month(datasets)
+    full_dir, partial_dir, upload_dir = tmp_path / "full", tmp_path / "partial", tmp_path / "upload"
+    for data_dir in (full_dir, partial_dir, upload_dir):
+        data_dir.mkdir()
+    write_datasets(full_dir, full_datasets)
+    write_datasets(partial_dir, before)
+    write_datasets(upload_dir, last)
+    uploads = {name: read_csv(name, str(upload_dir / DATASETS[name][0])) for name in MONTHLY}
+    return full_dir, partial_dir, uploads
+
+
+@pytest.fixture()
+def encoded_mcts(datasets) -> list:
+    return datasets["merchants"]["ENCODED_MCT"].tolist()[:60] + ["UNKNOWN"]
+
+
+def test_ingest_matches_full_load(split_dirs, encoded_mcts):
+    full_dir, partial_dir, last = split_dirs
+    expected = responses(make_reloader(full_dir).current, encoded_mcts)
+
+    reloader = make_reloader(partial_dir)
+    before = reloader.current
+    summary = reloader.ingest(LAST_MONTH, last["usage"], last["customers"], last["risk"])
+
+    assert summary["rows"] == {name: len(last[name]) for name in ("usage", "risk", "customers")}
+    assert not summary["replaced"]
+    assert reloader.current is not before
+    assert responses(reloader.current, encoded_mcts) == expected
+
+
+def test_ingest_same_month_twice_replaces_rows(split_dirs, full_datasets, encoded_mcts):
+    full_dir, partial_dir, last = split_dirs
+    expected = responses(make_reloader(full_dir).current, encoded_mcts)
+
+    reloader = make_reloader(partial_dir)
+    reloader.ingest(LAST_MONTH, last["usage"], last["customers"], last["risk"])
+    summary = reloader.ingest(LAST_MONTH, last["usage"], last["customers"], last["risk"])
+
+    assert summary["replaced"]
+    assert len(reloader.current.store.risk) == len(full_datasets["risk"])
+    assert responses(reloader.current, encoded_mcts) == expected
+
+
+def test_persisted_ingest_survives_reload(split_dirs, encoded_mcts):
+    full_dir, partial_dir, last = split_dirs
+    expected = responses(make_reloader(full_dir).current, encoded_mcts)
+
+    reloader = make_reloader(partial_dir)
+    reloader.ingest(LAST_MONTH, last["usage"], last["customers"], last["risk"], persist=True)
+    assert responses(reloader.current, encoded_mcts) == expected
+
+    assert reloader.reload()
+    reloader.wait()
+    assert reloader.state == "idle"
+    assert responses(reloader.current, encoded_mcts) == expected
+
+
+def test_reload_picks_up_replaced_files(split_dirs, full_datasets, encoded_mcts):
+    full_dir, partial_dir, _ = split_dirs
+    expected = responses(make_reloader(full_dir).current, encoded_mcts)
+
+    reloader = make_reloader(partial_dir)
+    before = reloader.current
+    write_datasets(partial_dir, full_datasets)
+    assert reloader.reload()
+    reloader.wait()
+
+    assert reloader.state == "idle"
+    assert reloader.current is not before
+    assert responses(reloader.current, encoded_mcts) == expected
+
+
+def test_failed_reload_keeps_current_data(split_dirs, encoded_mcts):
+    _, partial_dir, _ = split_dirs
+    reloader = make_reloader(partial_dir)
+    before = reloader.current
+    expected = responses(before, encoded_mcts)
+
+    (partial_dir / "big_data_set1_f.csv").unlink()
+    assert reloader.reload()
+    reloader.wait()
+
+    assert reloader.state == "failed"
+    assert reloader.current is before
+    assert responses(reloader.current, encoded_mcts) == expected
+
+
+def test_ingest_rejects_invalid_months(split_dirs):
+    _, partial_dir, last = split_dirs
+    reloader = make_reloader(partial_dir)
+    before = reloader.current
+
+    with pytest.raises(ValueError):
+        reloader.ingest(LAST_MONTH, last["usage"], last["customers"], None)
+    with pytest.raises(ValueError):
+        reloader.ingest(MONTHS[0], last["usage"], last["customers"], last["risk"])
+    missing_month = last["risk"].copy()
+    missing_month.loc[0, "TA_YM"] = None
+    with pytest.raises(ValueError):
+        reloader.ingest(LAST_MONTH, last["usage"], last["customers"], missing_month)
+    missing_alert = last["risk"].copy()
+    missing_alert.loc[0, "Alert"] = None
+    with pytest.raises(ValueError):
+        reloader.ingest(LAST_MONTH, last["usage"], last["customers"], missing_alert)
+
+    assert reloader.current is before
@@ -0,0 +1,115 @@
+"""
+가게 이름 검색 인덱스 (BusinessSearchIndex) - 전체 순회 기준 구현과 결과 비교
+"""
+import random
+
+import pandas as pd
+import pytest
+
+from app.services.search_index import (
+    BusinessSearchIndex, has_hangul, is_chosung_query, to_chosung, to_jamo,
+)
+
+# 겹모음(과), 받침(본, 닭, 앉), 끝 음절(힣), 자모, 영문, 공백, 마스킹 별표(*)를 섞은 이름 글자
+FUZZ_ALPHABET = list("행복카페김밥고과괜본볺기매하힣앉닭*") + list("ab ㄱㅎㅂㅏ")
+
+
+def merchants_frame(names, encoded_mcts=None) -> pd.DataFrame:
+    return pd.DataFrame({
+        "ENCODED_MCT": encoded_mcts or [f"M{i}" for i in range(len(names))],
+        "MCT_NM": names,
+        "MCT_BSE_AR": "서울 성동구",
+        "HPSN_MCT_ZCD_NM": "카페",
+    })
+
+
+def reference_matches(names, keyword: str) -> set:
+    """검색 대상 행 번호를 이름 전체 순회로 계산 (인덱스 없는 기존 검색 기준)"""
+    keyword = keyword.strip().lower()
+    matched = set()
+    for row, name in enumerate(names):
+        lower = name.lower()
+        texts = [lower, lower.replace("*", "")]
+        if any(keyword in text for text in texts):
+            matched.add(row)
+        elif is_chosung_query(keyword):
+            if any(to_chosung(keyword) in to_chosung(text) for text in texts):
+                matched.add(row)
+        elif has_hangul(keyword):
+            if any(to_jamo(keyword) in to_jamo(text) for text in texts):
+                matched.add(row)
+    return matched
+
+
+def result_rows(index: BusinessSearchIndex, keyword: str, limit: int = 10 ** 6) -> list:
+    return [int(item["encoded_mct"][1:]) for item in index.search(keyword, limit)]
+
+
+@pytest.fixture(scope="module")
+def fuzz_names() -> list:
+    rng = random.Random(1)
+    return ["".join(rng.choice(FUZZ_ALPHABET) for _ in range(rng.randint(1, 6))) for _ in range(2000)]
+
+
+@pytest.fixture(scope="module")
+def fuzz_index(fuzz_names) -> BusinessSearchIndex:
+    return BusinessSearchIndex(merchants_frame(fuzz_names))
+
+
+def test_matches_full_scan_on_fuzzed_queries(fuzz_names, fuzz_index):
+    rng = random.Random(2)
+    keywords = ["".join(rng.choice(FUZZ_ALPHABET) for _ in range(rng.randint(1, 3))) for _ in range(400)]
+    keywords += ["ㅎㅂ", "행보", "본ㅎ", "김ㅐ", "고ㅏ", "ㅏ", "ㄳ", "*", "과", "괘", "닭", "달"]
+    for keyword in keywords:
+        if not keyword.strip():
+            continue
+        rows = result_rows(fuzz_index, keyword)
+        assert len(rows) == len(set(rows)), keyword
+        assert set(rows) == reference_matches(fuzz_names, keyword), keyword
+
+
+def test_prefix_matches_rank_first_in_name_order():
+    names = ["카페행복", "행복카페", "김밥행복", "행복김밥", "김밥"]
+    index = BusinessSearchIndex(merchants_frame(names))
+
+    # 이름 시작 매칭(이름 순) -> 포함 매칭(파일 순)
+    assert [item["name"] for item in index.search("행복")] == ["행복김밥", "행복카페", "카페행복", "김밥행복"]
+    assert [item["name"] for item in index.search("행복", limit=2)] == ["행복김밥", "행복카페"]
+    # 초성/자모도 시작 매칭이 포함 매칭보다 먼저
+    assert [item["name"] for item in index.search("ㅎㅂ")] == ["행복김밥", "행복카페", "카페행복", "김밥행복"]
+    assert [item["name"] for item in index.search("행보")] == ["행복김밥", "행복카페", "카페행복", "김밥행복"]
+
+
+def test_chosung_and_partial_syllable_queries():
+    names = ["행복카페", "하늘정원", "본가 닭갈비", "과일가게"]
+    index = BusinessSearchIndex(merchants_frame(names))
+
+    assert [item["name"] for item in index.search("ㅎㅂ")] == ["행복카페"]
+    assert [item["name"] for item in index.search("ㅂㄱㄷ")] == ["본가 닭갈비"]  # 이름 공백 무시
+    assert [item["name"] for item in index.search("행보")] == ["행복카페"]  # 입력 중인 받침
+    assert [item["name"] for item in index.search("고")] == ["과일가게"]  # 입력 중인 겹모음
+    assert [item["name"] for item in index.search("닭ㄱ")] == ["본가 닭갈비"]
+    assert index.search("ㅎㅋ") == []
+
+
+def test_masked_names_and_case_are_normalized():
+    names = ["성우**", "Cafe*Latte", "CAFE"]
+    index = BusinessSearchIndex(merchants_frame(names))
+
+    assert [item["name"] for item in index.search("성우")] == ["성우**"]
+    assert [item["name"] for item in index.search("우**")] == ["성우**"]
+    assert [item["name"] for item in index.search("cafelatte")] == ["Cafe*Latte"]
+    assert [item["name"] for item in index.search("  Cafe ")] == ["CAFE", "Cafe*Latte"]
+
+
+def test_duplicate_merchants_and_empty_keyword():
+    names = ["행복카페", "행복카페 2호점", "행복식당"]
+    index = BusinessSearchIndex(merchants_frame(names, ["A", "A", "B"]))
+
+    # 같은 ENCODED_MCT는 이름 순으로 먼저 나온 행 하나만
+    assert index.search("행복") == [
+        {"encoded_mct": "B", "name": "행복식당", "area": "서울 성동구", "business_type": "카페"},
+        {"encoded_mct": "A", "name": "행복카페", "area": "서울 성동구", "business_type": "카페"},
+    ]
+    assert index.search("") == []
+    assert index.search("   ") == []